@@ -0,0 +1,16 @@
+"""asyncio API interfaces, requires the optional aiohttp dependency."""
+
+from .base_tado import AsyncTadoBase
+from .hops_tado import AsyncTadoX
+from .http import AsyncHttp
+from .my_tado import AsyncTado
+from .zone import AsyncTadoRoom, AsyncTadoZone
+
+__all__ = [
+    "AsyncHttp",
+    "AsyncTado",
+    "AsyncTadoX",
+    "AsyncTadoBase",
+    "AsyncTadoZone",
+    "AsyncTadoRoom",
+]
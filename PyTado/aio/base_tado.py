@@ -0,0 +1,534 @@
+"""
+Base class for asyncio Tado API classes.
+"""
+
+import logging
+from abc import ABCMeta, abstractmethod
+from datetime import date, timedelta
+from typing import Any, Self
+
+import aiohttp
+
+from PyTado.aio.http import AsyncHttp
+from PyTado.aio.zone import AsyncTadoRoom, AsyncTadoZone
+from PyTado.exceptions import TadoException, TadoNotSupportedException
+from PyTado.http import Action, DeviceActivationStatus, Domain, Endpoint, TadoRequest
+from PyTado.logger import Logger
+from PyTado.models import Climate, Historic, line_x, pre_line_x
+from PyTado.models.home import (
+    AirComfort,
+    EIQMeterReading,
+    EIQMeterReadings,
+    EIQTariff,
+    EIQTariffs,
+    HomeState,
+    MobileDevice,
+    MobileDevices,
+    RunningTimes,
+    User,
+    Users,
+    Weather,
+)
+from PyTado.models.line_x import Device as DeviceX
+from PyTado.models.line_x import RoomState
+from PyTado.models.line_x.room import XOpenWindow
+from PyTado.models.line_x.schedule import SetSchedule
+from PyTado.models.pre_line_x import Device, Schedule, ZoneState
+from PyTado.models.pre_line_x.zone import Capabilities, OpenWindow
+from PyTado.models.return_models import SuccessResult, TemperatureOffset
+from PyTado.types import (
+    DayType,
+    FanLevel,
+    FanSpeed,
+    HorizontalSwing,
+    HvacMode,
+    OverlayMode,
+    Power,
+    Presence,
+    Timetable,
+    VerticalSwing,
+    ZoneType,
+)
+
+_LOGGER = Logger(__name__)
+
+
+class AsyncTadoBase(metaclass=ABCMeta):
+    """Base class for asyncio Tado API classes.
+    Async mirror of TadoBase, provides all common functionality for pre line X
+    and line X systems."""
+
+    _http: AsyncHttp
+    _auto_geofencing_supported: bool | None = None
+
+    @classmethod
+    async def create(
+        cls,
+        token_file_path: str | None = None,
+        saved_refresh_token: str | None = None,
+        http_session: aiohttp.ClientSession | None = None,
+        debug: bool = False,
+        user_agent: str | None = None,
+        **http_options: Any,
+    ) -> Self:
+        """
+        Creates an AsyncHttp client and the API instance on top of it.
+
+        Args:
+            token_file_path (str | None, optional): Path to a file which will be used to persist
+                the refresh_token token. Defaults to None.
+            saved_refresh_token (str | None, optional): A previously saved refresh token.
+                Defaults to None.
+            http_session (aiohttp.ClientSession | None, optional): An optional aiohttp session
+                to use for requests. Defaults to None.
+            debug (bool, optional): Flag to enable or disable debug mode. Defaults to False.
+            user_agent (str | None): Optional user-agent header to use for the HTTP requests.
+            **http_options: Further keyword arguments of `AsyncHttp.create()`, e.g.
+                response_cache, rate_limiter, json_codec, timeout, endpoint_timeouts,
+                deadline, circuit_breaker or observers.
+        """
+
+        http = await AsyncHttp.create(
+            token_file_path=token_file_path,
+            saved_refresh_token=saved_refresh_token,
+            http_session=http_session,
+            debug=debug,
+            user_agent=user_agent,
+            **http_options,
+        )
+        return cls.from_http(http, debug=debug)
+
+    @classmethod
+    def from_http(
+        cls,
+        http: AsyncHttp,
+        debug: bool = False,
+    ) -> Self:
+        """Creates an instance of AsyncTado/AsyncTadoX from an existing AsyncHttp object."""
+        instance = cls.__new__(cls)
+        instance._http = http
+
+        if debug:
+            _LOGGER.setLevel(logging.DEBUG)
+        else:
+            _LOGGER.setLevel(logging.WARNING)
+
+        return instance
+
+    def __getattribute__(self, name: str) -> Any:
+        """Override __getattribute__ to ensure device activation status is checked
+        before accessing any attribute or method that is not private.
+        """
+
+        exclude_list = [
+            "close",
+            "create",
+            "device_activation",
+            "device_activation_status",
+            "device_verification_url",
+            "from_http",
+        ]
+
+        if not name.startswith("_") and name not in exclude_list:
+            self._ensure_device_activation()
+        return super().__getattribute__(str(name))
+
+    def _ensure_device_activation(self) -> None:
+        if not self._http.device_activation_status == DeviceActivationStatus.COMPLETED:
+            raise TadoException(
+                "Device activation is not completed. Please activate the device first."
+            )
+
+    def device_verification_url(self) -> str | None:
+        """Returns the URL for device verification."""
+        return self._http.device_verification_url
+
+    def device_activation_status(self) -> DeviceActivationStatus:
+        """Returns the status of the device activation."""
+        return self._http.device_activation_status
+
+    async def device_activation(self) -> None:
+        """Activates the device."""
+        await self._http.device_activation()
+        self._ensure_device_activation()
+
+    async def close(self) -> None:
+        """Closes the underlying AsyncHttp client."""
+        await self._http.close()
+
+    # -------------- Home methods --------------
+
+    async def get_me(self) -> User:
+        """
+        Gets home information.
+        """
+
+        request = TadoRequest()
+        request.action = Action.GET
+        request.domain = Domain.ME
+
+        return User.model_validate(await self._http.request(request))
+
+    @abstractmethod
+    async def get_devices(self) -> list[Device] | list[DeviceX]:
+        """Gets device information."""
+
+    @abstractmethod
+    async def get_zones(self) -> list[AsyncTadoZone] | list[AsyncTadoRoom]:
+        """Gets zones information."""
+
+    @abstractmethod
+    async def get_zone_states(self) -> dict[str, ZoneState] | dict[str, RoomState]:
+        """Gets current state of all zones."""
+
+    async def get_home_state(self) -> HomeState:
+        """
+        Gets current state of Home.
+        """
+
+        request = TadoRequest()
+        request.command = "state"
+        return HomeState.model_validate(await self._http.request(request))
+
+    async def get_auto_geofencing_supported(self) -> bool:
+        """
+        Return whether the Tado Home supports auto geofencing
+        """
+
+        if self._auto_geofencing_supported is not None:
+            return self._auto_geofencing_supported
+
+        data = await self.get_home_state()
+        # Check whether Auto Geofencing is permitted via the presence of
+        # showSwitchToAutoGeofencingButton or currently enabled via the
+        # presence of presenceLocked = False
+        if data.show_switch_to_auto_geofencing_button is not None:
+            supported = data.show_switch_to_auto_geofencing_button
+        elif data.presence_locked is not None:
+            supported = not data.presence_locked
+        else:
+            supported = False
+
+        self._auto_geofencing_supported = supported
+        return supported
+
+    async def set_home(self) -> SuccessResult:
+        """
+        Sets HomeState to HOME
+        """
+
+        return await self.change_presence(Presence.HOME)
+
+    async def set_away(self) -> SuccessResult:
+        """
+        Sets HomeState to AWAY
+        """
+
+        return await self.change_presence(Presence.AWAY)
+
+    async def change_presence(self, presence: Presence) -> SuccessResult:
+        """
+        Sets HomeState to presence
+        """
+
+        request = TadoRequest()
+        request.command = "presenceLock"
+        request.action = Action.CHANGE
+        request.payload = {"homePresence": presence}
+
+        return SuccessResult.model_validate(await self._http.request(request))
+
+    async def set_auto(self) -> None:
+        """
+        Sets HomeState to AUTO
+        """
+
+        # Only attempt to set Auto Geofencing if it is believed to be supported
+        if await self.get_auto_geofencing_supported():
+            request = TadoRequest()
+            request.command = "presenceLock"
+            request.action = Action.RESET
+
+            await self._http.request(request)
+        else:
+            raise TadoNotSupportedException("Auto mode is not known to be supported.")
+
+    async def get_weather(self) -> Weather:
+        """
+        Gets outside weather data
+        """
+
+        request = TadoRequest()
+        request.command = "weather"
+
+        return Weather.model_validate(await self._http.request(request))
+
+    @abstractmethod
+    async def get_air_comfort(self) -> AirComfort:
+        """Gets air quality information"""
+
+    async def get_users(self) -> list[User]:
+        """
+        Gets active users in home
+        """
+
+        request = TadoRequest()
+        request.command = "users"
+
+        return Users.validate_python(await self._http.request(request))
+
+    async def get_mobile_devices(self) -> list[MobileDevice]:
+        """
+        Gets information about mobile devices
+        """
+
+        request = TadoRequest()
+        request.command = "mobileDevices"
+
+        return MobileDevices.validate_python(await self._http.request(request))
+
+    async def get_running_times(self, from_date: date = date.today()) -> RunningTimes:
+        """
+        Get the running times from the Minder API
+        """
+
+        request = TadoRequest()
+        request.command = "runningTimes"
+        request.action = Action.GET
+        request.endpoint = Endpoint.MINDER
+        request.params = {"from": from_date.strftime("%Y-%m-%d")}
+
+        return RunningTimes.model_validate(await self._http.request(request))
+
+    # ------------- Zone methods -------------
+
+    @abstractmethod
+    def get_zone(self, zone: int) -> AsyncTadoZone | AsyncTadoRoom:
+        """Gets the specified zone as an AsyncTadoZone or AsyncTadoRoom object.
+        Await `update()` on the returned object before reading its state properties."""
+
+    @abstractmethod
+    async def get_zone_state(self, zone: int) -> ZoneState | RoomState:
+        """Gets current state of Zone as a ZoneState or RoomState object."""
+
+    @abstractmethod
+    async def get_state(self, zone: int) -> ZoneState | RoomState:
+        """Gets current state of Zone as a ZoneState or RoomState object."""
+
+    async def get_capabilities(self, zone: int) -> Capabilities:
+        """Gets capabilities of the specified zone."""
+        return await self.get_zone(zone).get_capabilities()
+
+    async def get_climate(self, zone: int) -> Climate:
+        """Gets the climate for the specified zone."""
+        return await self.get_zone(zone).get_climate()
+
+    async def get_historic(self, zone: int, day_report_date: date) -> Historic:
+        """
+        Gets historic information on given date for zone
+        """
+        return await self.get_zone(zone).get_historic(day_report_date)
+
+    async def get_schedule(
+        self, zone: int, timetable: Timetable | None = None, day: DayType | None = None
+    ) -> line_x.Schedule | list[pre_line_x.Schedule]:
+        """Gets the schedule for the specified zone."""
+        if timetable is None and day is None:
+            return await self.get_zone(zone).get_schedule()
+        elif timetable is None or day is None:
+            raise TadoException(
+                "For Tado V3/V2 API, timetable and day must be provided together."
+            )
+        return await self.get_zone(zone).get_schedule(timetable, day)
+
+    async def set_schedule(
+        self,
+        zone: int,
+        data: list[Schedule] | SetSchedule,
+        timetable: Timetable | None = None,
+        day: DayType | None = None,
+    ) -> None | list[Schedule]:
+        """Sets the schedule for the specified zone."""
+
+        if isinstance(data, SetSchedule):
+            # For Tado X API, data is a SetSchedule object
+            return await self.get_zone(zone).set_schedule(data)
+        elif timetable is None or day is None:
+            # For Tado V3/V2 API, timetable and day must be provided together
+            raise TadoException(
+                "For Tado V3/V2 API, timetable and day must be provided together."
+            )
+        return await self.get_zone(zone).set_schedule(data, timetable, day)
+
+    async def reset_zone_overlay(self, zone: int) -> None:
+        """Resets the zone overlay for the specified zone."""
+        await self.get_zone(zone).reset_zone_overlay()
+
+    async def set_zone_overlay(
+        self,
+        zone: int,
+        overlay_mode: OverlayMode,
+        set_temp: float | None = None,
+        duration: timedelta | None = None,
+        power: Power = Power.ON,
+        is_boost: bool | None = None,
+        device_type: ZoneType | None = None,
+        mode: HvacMode | None = None,
+        fan_speed: FanSpeed | None = None,
+        swing: Any = None,
+        fan_level: FanLevel | None = None,
+        vertical_swing: VerticalSwing | None = None,
+        horizontal_swing: HorizontalSwing | None = None,
+    ) -> None | dict[str, Any] | list[Any] | str:
+        """Sets a zone overlay for the specified zone."""
+        return await self.get_zone(zone).set_zone_overlay(
+            overlay_mode,
+            set_temp,
+            duration,
+            power,
+            is_boost,
+            device_type,
+            mode,
+            fan_speed,
+            swing,
+            fan_level,
+            vertical_swing,
+            horizontal_swing,
+        )
+
+    async def get_window_state(self, zone: int) -> OpenWindow | XOpenWindow | None:
+        """
+        Returns the state of the window for zone
+        """
+
+        return (await self.get_state(zone)).open_window
+
+    @abstractmethod
+    async def get_open_window_detected(self, zone: int) -> dict[str, Any]:
+        """Returns whether an open window is detected."""
+
+    # --------------- Device methods ---------------
+
+    @abstractmethod
+    async def set_child_lock(
+        self, device_id: str, child_lock: bool
+    ) -> SuccessResult | None:
+        """Set the child lock on the device."""
+
+    async def get_device_info(self, device_id: str, cmd: str) -> Device | DeviceX:
+        """Get information about a device."""
+        request = TadoRequest()
+        request.command = cmd
+        request.action = Action.GET
+        request.domain = Domain.DEVICES
+        request.device = device_id
+
+        return Device.model_validate(await self._http.request(request))
+
+    @abstractmethod
+    async def set_temp_offset(
+        self, device_id: str, offset: float = 0, measure: str = "celsius"
+    ) -> TemperatureOffset | SuccessResult:
+        """Set the Temperature offset on the device."""
+
+    # --------------- Energy IQ methods ---------------
+
+    async def get_eiq_tariffs(self) -> list[EIQTariff]:
+        """
+        Get Energy IQ tariff history
+        """
+
+        request = TadoRequest()
+        request.command = "tariffs"
+        request.action = Action.GET
+        request.endpoint = Endpoint.EIQ
+
+        return EIQTariffs.validate_python(await self._http.request(request))
+
+    async def get_eiq_meter_readings(self) -> list[EIQMeterReading]:
+        """
+        Get Energy IQ meter readings
+        """
+
+        request = TadoRequest()
+        request.command = "meterReadings"
+        request.action = Action.GET
+        request.endpoint = Endpoint.EIQ
+
+        response = await self._http.request(request)
+
+        if not isinstance(response, dict):
+            raise TadoException("Invalid response from Tado")
+
+        return EIQMeterReadings.validate_python(response.get("readings", []))
+
+    async def set_eiq_meter_readings(
+        self, reading_date: date = date.today(), reading: int = 0
+    ) -> SuccessResult | None:
+        """
+        Send Meter Readings to Tado, reading is without decimals
+        """
+
+        request = TadoRequest()
+        request.command = "meterReadings"
+        request.action = Action.SET
+        request.endpoint = Endpoint.EIQ
+        request.payload = {
+            "date": reading_date.strftime("%Y-%m-%d"),
+            "reading": reading,
+        }
+
+        return SuccessResult.model_validate(await self._http.request(request))
+
+    async def set_eiq_tariff(
+        self,
+        from_date: date = date.today(),
+        to_date: date = date.today(),
+        tariff: float = 0,
+        unit: str = "m3",
+        is_period: bool = False,
+    ) -> SuccessResult | None:
+        """
+        Send Tariffs to Tado,
+        tariff is with decimals, unit is either m3 or kWh,
+        set is_period to true to set a period of price
+        """
+
+        tariff_in_cents = tariff * 100
+
+        payload: dict[str, float | str] = {
+            "tariffInCents": tariff_in_cents,
+            "unit": unit,
+            "startDate": from_date.strftime("%Y-%m-%d"),
+        }
+        if is_period:
+            payload["endDate"] = to_date.strftime("%Y-%m-%d")
+
+        request = TadoRequest()
+        request.command = "tariffs"
+        request.action = Action.SET
+        request.endpoint = Endpoint.EIQ
+        request.payload = payload
+
+        return SuccessResult.model_validate(await self._http.request(request))
+
+    async def set_away_radius_in_meters(self, meters: int) -> SuccessResult | None:
+        """
+        When the distance between home location and the location of a
+        mobile device which can control this home is greater than
+        this distance, tado considers the mobile device to be outside
+        of home.
+
+        Included is check to ignore request to less than 100 meters
+        """
+        if meters < 100:
+            return None
+
+        request = TadoRequest()
+        request.action = Action.CHANGE
+        request.domain = Domain.HOME
+        request.endpoint = Endpoint.MY_API
+        request.command = "awayRadiusInMeters"
+        request.payload = {"awayRadiusInMeters": f"{meters}"}
+
+        return SuccessResult.model_validate(await self._http.request(request))
@@ -0,0 +1,333 @@
+"""
+PyTado asyncio interface implementation for hops.tado.com (Tado X).
+"""
+
+from functools import cached_property
+from typing import Any, Self, final
+
+import aiohttp
+
+from PyTado.aio.base_tado import AsyncTadoBase
+from PyTado.aio.zone import AsyncTadoRoom
+from PyTado.const import ZONE_METADATA_TTL
+from PyTado.exceptions import TadoNotSupportedException
+from PyTado.http import Action, Domain, Endpoint, TadoXRequest
+from PyTado.models.home import AirComfort
+from PyTado.models.line_x.device import Device, DevicesResponse, DevicesRooms
+from PyTado.models.line_x.installation import Installation
+from PyTado.models.line_x.room import RoomState, RoomStates
+from PyTado.models.pre_line_x.flow_temperature_optimization import (
+    FlowTemperatureOptimization,
+)
+from PyTado.models.return_models import SuccessResult
+from PyTado.zone.metadata import AsyncZoneMetadataCache
+
+
+@final
+class AsyncTadoX(AsyncTadoBase):
+    """Interacts with a Tado thermostat via hops.tado.com (Tado X) API using asyncio.
+
+    Example usage: t = await AsyncTadoX.create(token_file_path="/var/tado/token")
+                   await t.get_climate(1) # Get climate, room 1.
+                   await t.close()
+    """
+
+    @classmethod
+    async def create(
+        cls,
+        token_file_path: str | None = None,
+        saved_refresh_token: str | None = None,
+        http_session: aiohttp.ClientSession | None = None,
+        debug: bool = False,
+        user_agent: str | None = None,
+        **http_options: Any,
+    ) -> Self:
+        instance = await super().create(
+            token_file_path,
+            saved_refresh_token,
+            http_session,
+            debug,
+            user_agent,
+            **http_options,
+        )
+
+        if not instance._http.is_x_line:
+            raise TadoNotSupportedException(
+                "TadoX is only usable with LINE_X Generation"
+            )
+
+        return instance
+
+    # ------------------- Home methods -------------------
+
+    @cached_property
+    def _zone_metadata(self) -> AsyncZoneMetadataCache[DevicesRooms]:
+        return AsyncZoneMetadataCache(self._fetch_rooms, ZONE_METADATA_TTL)
+
+    async def _fetch_rooms(self) -> dict[int, DevicesRooms]:
+        return self._rooms_by_id(await self._get_rooms_and_devices())
+
+    @staticmethod
+    def _rooms_by_id(rooms_and_devices: DevicesResponse) -> dict[int, DevicesRooms]:
+        return {room.room_id: room for room in rooms_and_devices.rooms}
+
+    async def _get_rooms_and_devices(self) -> DevicesResponse:
+        request = TadoXRequest()
+        request.command = "roomsAndDevices"
+
+        rooms_and_devices = DevicesResponse.model_validate(
+            await self._http.request(request)
+        )
+        self._zone_metadata.put(self._rooms_by_id(rooms_and_devices))
+        return rooms_and_devices
+
+    async def get_devices(self) -> list[Device]:
+        """
+        Gets device information.
+        """
+
+        rooms_and_devices = await self._get_rooms_and_devices()
+
+        devices = [
+            device for room in rooms_and_devices.rooms for device in room.devices
+        ]
+        devices.extend(rooms_and_devices.other_devices)
+
+        return devices
+
+    async def get_zones(self) -> list[AsyncTadoRoom]:
+        """
+        Gets zones (or rooms in Tado X API) information.
+        """
+
+        rooms_and_devices = await self._get_rooms_and_devices()
+
+        return [AsyncTadoRoom(self, room.room_id) for room in rooms_and_devices.rooms]
+
+    async def get_zone_states(self) -> dict[str, RoomState]:
+        """
+        Gets current states of all zones/rooms.
+        """
+
+        request = TadoXRequest()
+        request.command = "rooms"
+
+        rooms = RoomStates.validate_python(await self._http.request(request))
+
+        return {room.name: room for room in rooms}
+
+    async def get_zone_state(self, zone: int) -> RoomState:
+        """
+        Gets current state of zone/room as a RoomState object.
+        """
+
+        return await self.get_state(zone)
+
+    async def get_air_comfort(self) -> AirComfort:
+        request = TadoXRequest()
+        request.command = "airComfort"
+
+        return AirComfort.model_validate(await self._http.request(request))
+
+    # ------------------- Zone methods -------------------
+
+    def get_zone(self, zone: int) -> AsyncTadoRoom:
+        """
+        Gets zone/room.
+        """
+        return AsyncTadoRoom(self, zone)
+
+    async def get_state(self, zone: int) -> RoomState:
+        """
+        Gets current state of zone/room.
+        """
+
+        request = TadoXRequest()
+        request.command = f"rooms/{zone:d}"
+
+        return RoomState.model_validate(await self._http.request(request))
+
+    async def get_open_window_detected(self, zone: int) -> dict[str, bool]:
+        """
+        Returns whether an open window is detected.
+        """
+
+        data = await self.get_state(zone)
+
+        return {
+            "openWindowDetected": (
+                data.open_window.activated if data.open_window else False
+            )
+        }
+
+    async def set_open_window(self, zone: int) -> SuccessResult:
+        """
+        Sets the window in zone to open
+        Note: This can only be set if an open window was detected in this zone
+        """
+        request = TadoXRequest()
+        request.command = f"rooms/{zone}/openWindow"
+        request.action = Action.SET
+
+        return SuccessResult.model_validate(await self._http.request(request))
+
+    async def reset_open_window(self, zone: int) -> SuccessResult:
+        """
+        Sets the window in zone to closed
+        """
+        request = TadoXRequest()
+        request.command = f"rooms/{zone}/openWindow"
+        request.action = Action.RESET
+
+        return SuccessResult.model_validate(await self._http.request(request))
+
+    # ------------------- Device methods -------------------
+
+    async def get_device_info(self, device_id: str, cmd: str = "") -> Device:
+        """
+        Gets information about devices
+        """
+
+        request = TadoXRequest()
+        request.command = f"devices/{device_id}"
+        return Device.model_validate(await self._http.request(request))
+
+    async def set_temp_offset(
+        self, device_id: str, offset: float = 0, measure: str = ""
+    ) -> SuccessResult:
+        """
+        Set the Temperature offset on the device.
+        """
+
+        request = TadoXRequest()
+        request.command = f"roomsAndDevices/devices/{device_id}"
+        request.action = Action.CHANGE
+        request.payload = {"temperatureOffset": offset}
+
+        return SuccessResult.model_validate(await self._http.request(request))
+
+    async def set_child_lock(self, device_id: str, child_lock: bool) -> SuccessResult:
+        """
+        Set and toggle the child lock on the device.
+        """
+
+        request = TadoXRequest()
+        request.command = f"roomsAndDevices/devices/{device_id}"
+        request.action = Action.CHANGE
+        request.payload = {"childLockEnabled": child_lock}
+
+        return SuccessResult.model_validate(await self._http.request(request))
+
+    async def set_flow_temperature_optimization(
+        self, max_flow_temperature: float
+    ) -> SuccessResult:
+        """
+        Set the flow temperature optimization.
+
+        max_flow_temperature: float, the maximum flow temperature in Celsius
+        """
+
+        request = TadoXRequest()
+        request.action = Action.CHANGE
+        request.domain = Domain.HOME
+        request.command = "settings/flowTemperatureOptimization"
+        request.payload = {"maxFlowTemperature": max_flow_temperature}
+
+        return SuccessResult.model_validate(await self._http.request(request))
+
+    async def get_flow_temperature_optimization(self) -> FlowTemperatureOptimization:
+        """
+        Get the current flow temperature optimization
+        """
+
+        request = TadoXRequest()
+        request.action = Action.GET
+        request.domain = Domain.HOME
+        request.command = "settings/flowTemperatureOptimization"
+
+        return FlowTemperatureOptimization.model_validate(
+            await self._http.request(request)
+        )
+
+    async def boost_all_heating(self) -> SuccessResult:
+        """
+        Boost mode, expires after 30 minutes.
+        """
+        return await self._quick_action("boost")
+
+    async def disable_all_heating(self) -> SuccessResult:
+        """
+        Sets all rooms off, frost protection.
+        """
+        return await self._quick_action("allOff")
+
+    async def resume_all_schedules(self) -> SuccessResult:
+        """
+        Resumes regular schedule for all rooms, undo boost,
+        disable heating and manual settings.
+        """
+        return await self._quick_action("resumeSchedule")
+
+    async def _quick_action(self, action: str) -> SuccessResult:
+        request = TadoXRequest()
+        request.action = Action.SET
+        request.domain = Domain.HOME
+        request.command = f"quickActions/{action}"
+
+        return SuccessResult.model_validate(await self._http.request(request))
+
+    async def delete_eiq_tariff(self, reader_id: int) -> SuccessResult:
+        """
+        Delete an earlier provided reading-id,
+        like "8c46366f-f3a8-4aed-be08-ebe1de3ff260"
+        """
+        request = TadoXRequest()
+        request.action = Action.RESET
+        request.domain = Domain.HOME
+        request.endpoint = Endpoint.EIQ
+        request.command = f"meterReadings/{reader_id}"
+
+        return SuccessResult.model_validate(await self._http.request(request))
+
+    async def set_incident_detection(self, b_present: bool = True) -> SuccessResult:
+        """Enable or disable incident detection setting for this home."""
+        return await self._change_home_setting(
+            "incidentDetection", "enabled", b_present
+        )
+
+    async def set_boiler_presence(self, b_present: bool = True) -> SuccessResult:
+        """Sets boiler present or not."""
+        return await self._change_home_setting(
+            "heatingSystem/boiler", "present", b_present
+        )
+
+    async def set_underfloor_heating_presence(
+        self, b_present: bool = True
+    ) -> SuccessResult:
+        """Inform about the presence of underfloor heating in this home"""
+        return await self._change_home_setting(
+            "heatingSystem/underfloorHeating", "present", b_present
+        )
+
+    async def _change_home_setting(
+        self, command: str, key: str, value: bool
+    ) -> SuccessResult:
+        request = TadoXRequest()
+        request.action = Action.CHANGE
+        request.domain = Domain.HOME
+        request.endpoint = Endpoint.MY_API
+        request.command = command
+        request.payload = {key: f"{value}"}
+
+        return SuccessResult.model_validate(await self._http.request(request))
+
+    async def get_installation(self) -> Installation:
+        """
+        Gets home installation details.
+        """
+
+        request = TadoXRequest()
+        request.action = Action.GET
+        request.domain = Domain.HOME
+
+        return Installation.model_validate(await self._http.request(request))
@@ -0,0 +1,584 @@
+"""
+Do all the asyncio API HTTP heavy lifting in this file
+"""
+
+import asyncio
+import copy
+import logging
+import time
+from collections.abc import Callable, Coroutine, Iterable, Mapping
+from typing import TYPE_CHECKING, Any, Self
+
+try:
+    import aiohttp
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "PyTado.aio requires aiohttp, install it with 'pip install python-tado[async]'"
+    ) from e
+
+from PyTado.circuit import CircuitBreaker
+from PyTado.codec import JsonCodec
+from PyTado.exceptions import (
+    TadoException,
+    TadoTimeoutException,
+    TadoWrongCredentialsException,
+)
+from PyTado.http import (
+    _DEFAULT_MAX_CONCURRENCY,
+    _DEFAULT_RETRIES,
+    _OAUTH_DEVICE_AUTHORIZE_URL,
+    _OAUTH_TOKEN_URL,
+    BaseHttp,
+    DeviceActivationStatus,
+    TadoRequest,
+    Timeout,
+)
+from PyTado.logger import Logger
+from PyTado.metrics import Observer
+from PyTado.ratelimit import RateLimiter
+
+if TYPE_CHECKING:
+    from PyTado.cache import ResponseCache  # pragma: no cover
+
+_LOGGER = Logger(__name__)
+
+_RETRY_STATUS_CODES = frozenset((502, 503, 504))
+_RETRY_BACKOFF_FACTOR = 0.1
+_RETRY_BACKOFF_MAX = 120
+
+
+class AsyncHttp(BaseHttp):
+    """Async API Request Class
+
+    Uses an aiohttp ClientSession instead of a requests Session, so that a single
+    event loop can keep many requests in flight. The OAuth device flow, URL and
+    payload handling are shared with the blocking Http class.
+
+    Example usage: http = await AsyncHttp.create(token_file_path="/var/tado/token")
+                   if http.device_activation_status == "PENDING":
+                       print(http.device_verification_url)
+                       await http.device_activation()
+    """
+
+    _session: aiohttp.ClientSession | None
+
+    def __init__(
+        self,
+        token_file_path: str | None = None,
+        saved_refresh_token: str | None = None,
+        http_session: aiohttp.ClientSession | None = None,
+        debug: bool = False,
+        user_agent: str | None = None,
+        response_cache: "ResponseCache | None" = None,
+        rate_limiter: RateLimiter | None = None,
+        json_codec: JsonCodec | str = "json",
+        timeout: Timeout = Timeout(),
+        endpoint_timeouts: Mapping[str, Timeout] | None = None,
+        deadline: float | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        observers: Iterable[Observer] | None = None,
+    ) -> None:
+        """
+        Initialize the asyncio HTTP client for interacting with the Tado API.
+
+        The constructor does not do any I/O, await `async_init()` (or use `create()`)
+        before sending requests.
+
+        Args:
+            token_file_path (str | None): Path to the file where the token is stored.
+                If None, the token will not be saved to a file.
+            saved_refresh_token (str | None): A previously saved refresh token to use for
+                authentication. If None, a new token will be requested.
+            http_session (aiohttp.ClientSession | None): An optional pre-configured session.
+                If None, a new session will be created and closed by `close()`.
+            debug (bool): If True, enables debug logging. Defaults to False.
+            user_agent (str | None): Optional user-agent header to use for the HTTP requests.
+                If None, a default user-agent PyTado/<PyTado-version> will be used.
+            response_cache (ResponseCache | None): Optional cache for GET responses of slow
+                changing resources (zones, capabilities, ...). If None, nothing is cached.
+            rate_limiter (RateLimiter | None): Optional request budgets per account and
+                endpoint. If None, requests are only counted, see `quota_status()`.
+            json_codec (JsonCodec | str): JSON codec of the request and response bodies and
+                of the token file: "json" (default), "orjson", "msgspec", "auto" for the
+                fastest one installed, or a JsonCodec instance.
+            timeout (Timeout): Connect and read timeout of the requests, 5 and 10 seconds
+                by default.
+            endpoint_timeouts (Mapping[str, Timeout] | None): Timeouts of specific
+                endpoints, e.g. {Endpoint.MINDER: Timeout(read=30)}.
+            deadline (float | None): Seconds a call may take in total, including retries
+                and their backoff, unless the TadoRequest sets its own deadline. If None,
+                calls are only limited by the timeouts and the retries.
+            circuit_breaker (CircuitBreaker | None): Circuit breaker per endpoint and retry
+                budget. If None, a CircuitBreaker with its defaults is used.
+            observers (Iterable[Observer] | None): Receive the duration, status code,
+                retries and sizes of every API call and the time spent validating the
+                responses, e.g. a MetricsRecorder or PrometheusObserver from
+                PyTado.metrics. More can be added with `add_observer()`.
+        """
+
+        super().__init__(
+            token_file_path=token_file_path,
+            debug=debug,
+            user_agent=user_agent,
+            response_cache=response_cache,
+            rate_limiter=rate_limiter,
+            json_codec=json_codec,
+            timeout=timeout,
+            endpoint_timeouts=endpoint_timeouts,
+            deadline=deadline,
+            circuit_breaker=circuit_breaker,
+            observers=observers,
+        )
+
+        self._saved_refresh_token = saved_refresh_token
+        self._session = http_session
+        self._close_session = http_session is None
+        self._refresh_lock: asyncio.Lock | None = None
+        self._in_flight: dict[str, asyncio.Future[dict[str, Any] | list[Any] | str]] = (
+            {}
+        )
+
+    @classmethod
+    async def create(
+        cls,
+        token_file_path: str | None = None,
+        saved_refresh_token: str | None = None,
+        http_session: aiohttp.ClientSession | None = None,
+        debug: bool = False,
+        user_agent: str | None = None,
+        response_cache: "ResponseCache | None" = None,
+        rate_limiter: RateLimiter | None = None,
+        json_codec: JsonCodec | str = "json",
+        timeout: Timeout = Timeout(),
+        endpoint_timeouts: Mapping[str, Timeout] | None = None,
+        deadline: float | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        observers: Iterable[Observer] | None = None,
+    ) -> Self:
+        """Create an AsyncHttp instance and start the authentication."""
+        http = cls(
+            token_file_path=token_file_path,
+            saved_refresh_token=saved_refresh_token,
+            http_session=http_session,
+            debug=debug,
+            user_agent=user_agent,
+            response_cache=response_cache,
+            rate_limiter=rate_limiter,
+            json_codec=json_codec,
+            timeout=timeout,
+            endpoint_timeouts=endpoint_timeouts,
+            deadline=deadline,
+            circuit_breaker=circuit_breaker,
+            observers=observers,
+        )
+        await http.async_init()
+        return http
+
+    async def async_init(self) -> None:
+        """Refresh the saved token or start the device flow."""
+        if self._saved_refresh_token or self._load_token():
+            # a home saved with the token is trusted, the refresh happens on first use
+            if not self._resume_saved_home() and await self._refresh_token(
+                refresh_token=self._saved_refresh_token, force_refresh=True
+            ):
+                await self._device_ready()
+        else:
+            self._device_activation_status = await self._login_device_flow()
+
+    async def close(self) -> None:
+        """Close the aiohttp session, if it was created by this instance."""
+        if self._session is not None and self._close_session:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    def _get_refresh_lock(self) -> asyncio.Lock:
+        # created lazily, so that the lock belongs to the running event loop
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        return self._refresh_lock
+
+    async def request(self, request: TadoRequest) -> dict[str, Any] | list[Any] | str:
+        """
+        Request something from the API with a TadoRequest
+
+        Raises:
+            TadoTimeoutException: If the request timed out or exceeded its deadline.
+        """
+        deadline = self._deadline_of(request)
+        await self._refresh_token()
+        self._observe_validation(request)
+
+        url = self._configure_url(request)
+
+        cached = self._cached_response(str(request.action), url)
+        if cached is not None:
+            return cached
+
+        if self._can_coalesce(request):
+            return await self._coalesce(
+                url, lambda: self._send_request(request, url, deadline), deadline
+            )
+
+        return await self._send_request(request, url, deadline)
+
+    async def request_many(
+        self,
+        requests: Iterable[TadoRequest],
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
+    ) -> list[dict[str, Any] | list[Any] | str | Exception]:
+        """
+        Send several requests concurrently, at most max_concurrency at once.
+
+        Returns:
+            list: The results in the order of the requests. A request that failed has
+                its exception in its place instead, the other results are kept.
+        """
+
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def send(
+            request: TadoRequest,
+        ) -> dict[str, Any] | list[Any] | str | Exception:
+            async with semaphore:
+                try:
+                    return await self.request(request)
+                except Exception as e:  # pylint: disable=broad-except
+                    return e
+
+        return list(await asyncio.gather(*(send(request) for request in requests)))
+
+    async def _send_request(
+        self, request: TadoRequest, url: str, deadline: float | None = None
+    ) -> dict[str, Any] | list[Any] | str:
+        headers, data = self._configure_payload(request)
+
+        # calls failing fast on an open circuit or a passed deadline do not go out,
+        # so they take no request of the quota
+        remaining = self._remaining(deadline, url)
+        self._circuit_breaker.before_request(request.endpoint)
+        try:
+            delay = self._rate_limiter.acquire(request.endpoint, remaining)
+            if delay is None:
+                raise TadoTimeoutException(
+                    f"Deadline exceeded for {url}, the request budget frees up too late"
+                )
+            if delay > 0:
+                await asyncio.sleep(delay)
+        except BaseException:
+            self._circuit_breaker.record_result(request.endpoint, None)
+            raise
+        retries = 0
+
+        def allow_retry() -> bool:
+            nonlocal retries
+            if not self._circuit_breaker.allow_retry(request.endpoint):
+                return False
+            retries += 1
+            return True
+
+        succeeded: bool | None = False
+        status_code: int | None = None
+        body = b""
+        error: BaseException | None = None
+        started = time.perf_counter()
+        try:
+            status_code, body, response_headers = await self._send(
+                request, str(request.action), url, headers, data, deadline, allow_retry
+            )
+            succeeded = status_code < 500
+        except asyncio.CancelledError as e:
+            succeeded = None
+            error = e
+            raise
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self._circuit_breaker.record_result(request.endpoint, succeeded)
+            self._notify_request(
+                request,
+                started,
+                status_code=status_code,
+                retries=retries,
+                bytes_sent=len(data),
+                bytes_received=len(body),
+                error=error,
+            )
+
+        self._rate_limiter.record_response(
+            request.endpoint, status_code, response_headers
+        )
+
+        if self._verify_saved_home(request, status_code):
+            home_id = self._id
+            await self._device_ready()
+            if self._id != home_id:
+                return await self._send_request(
+                    request, self._configure_url(request), deadline
+                )
+
+        result = self._parse_response(url, status_code, body)
+        self._update_cache(str(request.action), url, result)
+
+        return result
+
+    async def _coalesce(
+        self,
+        url: str,
+        send: Callable[[], Coroutine[Any, Any, dict[str, Any] | list[Any] | str]],
+        deadline: float | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """Share one upstream call between tasks requesting the same URL at once"""
+        task = self._in_flight.get(url)
+
+        if task is not None:
+            # shielded, a cancelled waiter must not cancel the call of the others
+            try:
+                result = await asyncio.wait_for(
+                    asyncio.shield(task), self._remaining(deadline, url)
+                )
+            except TimeoutError as e:
+                raise TadoTimeoutException(f"Deadline exceeded for {url}") from e
+            return copy.deepcopy(result)
+
+        task = asyncio.ensure_future(send())
+        self._in_flight[url] = task
+        task.add_done_callback(lambda _: self._in_flight.pop(url, None))
+
+        return await asyncio.shield(task)
+
+    async def _send(
+        self,
+        request: TadoRequest,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        data: bytes,
+        deadline: float | None,
+        allow_retry: Callable[[], bool],
+    ) -> tuple[int, bytes, Mapping[str, str]]:
+        """
+        Send the request, retrying on gateway errors like the urllib3 Retry of Http.
+
+        allow_retry takes a retry from the retry budget, it is called before every retry.
+        """
+
+        session = self._get_session()
+        attempt = 0
+
+        while True:
+            timeout = self._timeout_of(request, deadline, url)
+            try:
+                async with session.request(
+                    method,
+                    url,
+                    headers=headers,
+                    data=data or None,
+                    timeout=aiohttp.ClientTimeout(
+                        total=self._remaining(deadline, url),
+                        sock_connect=timeout.connect,
+                        sock_read=timeout.read,
+                    ),
+                ) as response:
+                    status_code = response.status
+                    body = await response.read()
+                    response_headers = response.headers
+            except TimeoutError as e:
+                _LOGGER.error("Request %s timed out: %s", url, e)
+                raise TadoTimeoutException(e) from e
+            except aiohttp.ClientError as e:
+                _LOGGER.error("Connection error: %s", e)
+                raise TadoException(e) from e
+
+            self._log_response(method, url, headers, status_code, body)
+
+            if status_code not in _RETRY_STATUS_CODES or not (
+                attempt >= _DEFAULT_RETRIES or allow_retry()
+            ):
+                return status_code, body, response_headers
+
+            if attempt >= _DEFAULT_RETRIES:
+                _LOGGER.error("Max retries exceeded for %s", url)
+                raise TadoException(
+                    f"Max retries exceeded with status code {status_code}"
+                )
+
+            backoff = min(_RETRY_BACKOFF_FACTOR * (2**attempt), _RETRY_BACKOFF_MAX)
+            remaining = self._remaining(deadline, url)
+            if remaining is not None and backoff >= remaining:
+                raise TadoTimeoutException(
+                    f"Deadline exceeded for {url} with status code {status_code}"
+                )
+
+            await asyncio.sleep(backoff)
+            attempt += 1
+
+    def _log_response(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        status_code: int,
+        body: bytes,
+    ) -> None:
+        if not _LOGGER.isEnabledFor(logging.DEBUG):
+            return
+
+        _LOGGER.debug(
+            f"\nRequest:\n\tMethod:{method}"
+            f"\n\tURL: {url}"
+            f"\n\tHeaders: {headers}"
+            f"\nResponse:\n\tStatusCode: {status_code}"
+            f"\n\tData: {body.decode('utf-8', 'replace')}"
+        )
+
+    async def _post_oauth(
+        self, url: str, params: dict[str, Any]
+    ) -> tuple[int, str, dict[str, Any]]:
+        try:
+            async with self._get_session().post(
+                url,
+                params=params,
+                data=self._codec.dumps({}),
+                headers={
+                    "Content-Type": "application/json",
+                    "Referer": "https://app.tado.com/",
+                },
+                timeout=aiohttp.ClientTimeout(
+                    sock_connect=self._timeout.connect, sock_read=self._timeout.read
+                ),
+            ) as response:
+                body = await response.read()
+                data = self._codec.loads(body) if body else {}
+                return response.status, response.reason or "", data
+        except aiohttp.ClientError as e:
+            _LOGGER.error("Connection error: %s", e)
+            raise TadoException(e) from e
+
+    async def _refresh_token(
+        self, refresh_token: str | None = None, force_refresh: bool = False
+    ) -> bool:
+        """
+        Refresh the OAuth token if it is about to expire or if forced.
+
+        Concurrent callers wait for a single refresh instead of each sending their own.
+
+        Returns:
+            bool: True if the token was successfully refreshed, False if the refresh failed due
+                  to invalid credentials and force_refresh is True.
+
+        Raises:
+            TadoException: If a connection error occurs during the token refresh process.
+            TadoWrongCredentialsException: If the token refresh fails due to invalid credentials
+                and force_refresh is False.
+        """
+
+        if not self._token_expired() and not force_refresh:
+            return True
+
+        async with self._get_refresh_lock():
+            # another task may have refreshed the token while we were waiting
+            if not self._token_expired() and not force_refresh:
+                return True
+
+            status_code, _, data = await self._post_oauth(
+                _OAUTH_TOKEN_URL, self._refresh_token_params(refresh_token)
+            )
+
+            if status_code != 200:
+                if force_refresh:
+                    _LOGGER.error(
+                        "Failed to refresh token, probably wrong credentials. Status code: %s",
+                        status_code,
+                    )
+                    return False
+
+                raise TadoWrongCredentialsException(
+                    "Failed to refresh token, probably wrong credentials. "
+                    f"Status code: {status_code}"
+                )
+
+            self._set_oauth_header(data)
+
+        return True
+
+    async def _login_device_flow(self) -> DeviceActivationStatus:
+        """Start the login to the API using the device flow"""
+
+        if self._device_activation_status != DeviceActivationStatus.NOT_STARTED:
+            raise TadoException("The device has been started already")
+
+        status_code, reason, data = await self._post_oauth(
+            _OAUTH_DEVICE_AUTHORIZE_URL, self._device_authorize_params()
+        )
+
+        if status_code != 200:
+            raise TadoException(
+                f"Login failed. Status code: {status_code} and reason: {reason}"
+            )
+
+        self._start_device_flow(data)
+
+        return DeviceActivationStatus.PENDING
+
+    async def _check_device_activation(self) -> bool:
+        self._check_device_flow_expired()
+
+        # Await the desired interval, before polling the API again
+        await asyncio.sleep(self._device_flow_data.get("interval", 0))
+
+        status_code, reason, data = await self._post_oauth(
+            _OAUTH_TOKEN_URL, self._device_token_params()
+        )
+
+        if status_code == 200:
+            self._set_oauth_header(data)
+            return True
+
+        # The user has not yet authorized the device, let's continue
+        if status_code == 400 and data.get("error") == "authorization_pending":
+            _LOGGER.info(
+                "Authorization pending, waiting for user to authorize. Continue polling."
+            )
+            return False
+
+        raise TadoException(f"Login failed. Reason: {reason}")
+
+    async def device_activation(self) -> None:
+        """Activate the device and get the refresh token"""
+
+        if self._device_activation_status == DeviceActivationStatus.NOT_STARTED:
+            raise TadoException("The device flow has not yet started")
+
+        while True:
+            if await self._check_device_activation():
+                break
+
+        await self._device_ready()
+
+    async def _device_ready(self) -> None:
+        """after device refresh code has been obtained"""
+        home_id = await self._get_id()
+        self._id = home_id
+        self._complete_device_flow(home_id, await self._check_x_line_generation())
+
+    async def _get_id(self) -> int:
+        return self._parse_home_id(await self.request(self._me_request()))
+
+    async def _check_x_line_generation(self) -> bool:
+        # get home info
+        return self._parse_x_line_generation(await self.request(self._home_request()))
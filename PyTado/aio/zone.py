@@ -0,0 +1,448 @@
+"""
+Adapters to represent tado zones and rooms for the asyncio API classes.
+
+The state properties (current_temp, target_temp, overlay_active, ...) are shared with
+the blocking TadoZone and TadoRoom classes: `update()` fetches the raw data with the
+AsyncHttp client and loads it into a TadoZone/TadoRoom, which is then used to answer
+property lookups without any further I/O.
+"""
+
+import asyncio
+from abc import ABCMeta, abstractmethod
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, TypeVar
+
+from PyTado import const
+from PyTado.aio.http import AsyncHttp
+from PyTado.exceptions import TadoException
+from PyTado.http import Action, Mode, TadoRequest, TadoXRequest
+from PyTado.models import pre_line_x
+from PyTado.models.historic import Historic
+from PyTado.models.line_x.room import RoomState
+from PyTado.models.line_x.schedule import Schedule as ScheduleX
+from PyTado.models.line_x.schedule import SetSchedule
+from PyTado.models.pre_line_x.schedule import Schedule, Schedules
+from PyTado.models.pre_line_x.zone import (
+    Capabilities,
+    TemperatureCapabilitiesValues,
+    ZoneControl,
+)
+from PyTado.models.return_models import Climate
+from PyTado.types import (
+    DayType,
+    FanLevel,
+    FanSpeed,
+    HorizontalSwing,
+    HvacMode,
+    OverlayMode,
+    Power,
+    Timetable,
+    VerticalSwing,
+    ZoneType,
+)
+from PyTado.zone.base_zone import BaseZone
+from PyTado.zone.hops_zone import TadoRoom
+from PyTado.zone.my_zone import TadoZone
+
+if TYPE_CHECKING:
+    from PyTado.aio.hops_tado import AsyncTadoX  # pragma: no cover
+    from PyTado.aio.my_tado import AsyncTado  # pragma: no cover
+
+ZoneT = TypeVar("ZoneT", bound=BaseZone)
+
+
+class AsyncBaseZone(Generic[ZoneT], metaclass=ABCMeta):
+    """Base class for asyncio Tado zone/room control.
+
+    Attributes:
+        _id: The unique identifier of the zone/room
+        _home: Reference to the parent AsyncTado/AsyncTadoX instance
+        _http: Async HTTP client for making API requests
+        _zone: The loaded TadoZone/TadoRoom answering the state properties
+    """
+
+    _zone_class: ClassVar[type[BaseZone]]
+
+    _id: int
+    _home: "AsyncTado | AsyncTadoX"
+    _http: AsyncHttp
+    _zone: ZoneT | None
+
+    def __init__(self, home: "AsyncTado | AsyncTadoX", id: int):
+        """Initialize a new AsyncBaseZone instance.
+
+        Args:
+            home: The parent AsyncTado/AsyncTadoX instance this zone/room belongs to
+            id: The unique identifier of the zone/room
+        """
+        self._home = home
+        self._http = home._http
+        self._id = id
+        self._zone = None
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Delegate the state properties to the loaded TadoZone/TadoRoom.
+
+        Raises:
+            TadoException: If the zone has not been loaded with `update()` yet
+            AttributeError: If the attribute is not a state property
+        """
+        if name.startswith("_") or not isinstance(
+            getattr(self._zone_class, name, None), property
+        ):
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+
+        zone = self._zone
+        if zone is None:
+            raise TadoException(
+                f"Zone {self._id} is not loaded yet, await update() first"
+            )
+        return getattr(zone, name)
+
+    @abstractmethod
+    async def update(self) -> None:
+        """Fetch the zone's state and room data from the API."""
+
+    async def _loaded(self) -> ZoneT:
+        if self._zone is None:
+            await self.update()
+        if self._zone is None:
+            raise TadoException(f"Zone {self._id} could not be loaded")
+        return self._zone
+
+    async def get_climate(self) -> Climate:
+        """
+        Gets temp (centigrade) and humidity (% RH) for zone/room.
+        """
+
+        return (await self._loaded()).get_climate()
+
+    async def get_historic(self, day_report_date: date) -> Historic:
+        """
+        Gets historic information on given date for zone/room
+        """
+
+        request = TadoRequest()
+        request.command = (
+            f"zones/{self._id:d}/dayReport?date={day_report_date.strftime('%Y-%m-%d')}"
+        )
+        return Historic.model_validate(await self._http.request(request))
+
+
+class AsyncTadoZone(AsyncBaseZone[TadoZone]):
+    """Async Tado Zone data structure for my.tado.com."""
+
+    _zone_class = TadoZone
+    _home: "AsyncTado"
+
+    async def update(self) -> None:
+        state_request = TadoRequest()
+        state_request.command = f"zones/{self._id}/state"
+
+        default_overlay_request = TadoRequest()
+        default_overlay_request.command = f"zones/{self._id}/defaultOverlay"
+
+        state, room, default_overlay = await asyncio.gather(
+            self._http.request(state_request),
+            self._home._zone_metadata.get(self._id),
+            self._http.request(default_overlay_request),
+        )
+
+        if room is None:
+            raise TadoException(f"Zone with id {self._id} not found")
+
+        zone = TadoZone(self._home, self._id)  # type: ignore[arg-type]
+        zone._raw_state = pre_line_x.ZoneState.model_validate(state)
+        zone._raw_room = room
+        zone._default_overlay = pre_line_x.ZoneOverlayDefault.model_validate(
+            default_overlay
+        )
+        self._zone = zone
+
+    async def get_capabilities(self) -> Capabilities:
+        """Gets capabilities of the zone."""
+        request = TadoRequest()
+        request.command = f"zones/{self._id:d}/capabilities"
+
+        return Capabilities.model_validate(await self._http.request(request))
+
+    async def get_timetable(self) -> Timetable:
+        """
+        Get the Timetable type currently active
+        """
+
+        request = TadoRequest()
+        request.command = f"zones/{self._id:d}/schedule/activeTimetable"
+        request.mode = Mode.PLAIN
+        data = await self._http.request(request)
+
+        if not isinstance(data, dict):
+            raise TadoException("Invalid response from Tado API")
+
+        if "id" not in data:
+            raise TadoException(f'Returned data did not contain "id" : {str(data)}')
+
+        return Timetable(data["id"])
+
+    async def get_schedule(
+        self, timetable: Timetable | None = None, day: DayType | None = None
+    ) -> list[Schedule]:
+        """
+        Get the JSON representation of the schedule for a zone.
+        Zone has 3 different schedules, one for each timetable (see setTimetable)
+        """
+        request = TadoRequest()
+        if day:
+            request.command = (
+                f"zones/{self._id:d}/schedule/timetables/{timetable:d}/blocks/{day}"
+            )
+        else:
+            request.command = (
+                f"zones/{self._id:d}/schedule/timetables/{timetable:d}/blocks"
+            )
+        request.mode = Mode.PLAIN
+
+        return Schedules.validate_python(await self._http.request(request))
+
+    async def set_schedule(
+        self,
+        data: list[Schedule] | SetSchedule,
+        timetable: Timetable | None = None,
+        day: DayType | None = None,
+    ) -> list[Schedule]:
+        """
+        Set the schedule for a zone, day is required
+        """
+
+        if isinstance(data, list):
+            request = TadoRequest()
+            request.command = (
+                f"zones/{self._id:d}/schedule/timetables/{timetable:d}/blocks/{day}"
+            )
+            request.action = Action.CHANGE
+            request.payload = [schedule.model_dump(by_alias=True) for schedule in data]
+            return Schedules.validate_python(await self._http.request(request))
+        raise TadoException("Invalid data type for set_schedule for pre line x")
+
+    async def reset_zone_overlay(self) -> None:
+        """
+        Delete current overlay (Resume Schedule)
+        """
+
+        request = TadoRequest()
+        request.command = f"zones/{self._id:d}/overlay"
+        request.action = Action.RESET
+        request.mode = Mode.PLAIN
+
+        await self._http.request(request)
+
+    async def set_zone_overlay(
+        self,
+        overlay_mode: OverlayMode,
+        set_temp: float | None = None,
+        duration: timedelta | None = None,
+        power: Power = Power.ON,
+        is_boost: bool | None = None,
+        device_type: ZoneType | None = None,
+        mode: HvacMode | None = None,
+        fan_speed: FanSpeed | None = None,
+        swing: Any = None,
+        fan_level: FanLevel | None = None,
+        vertical_swing: VerticalSwing | None = None,
+        horizontal_swing: HorizontalSwing | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """
+        Set zone overlay (manual control), see TadoZone.set_zone_overlay
+        """
+
+        if device_type is None:
+            device_type = (await self._loaded()).zone_type
+
+        request = TadoRequest()
+        request.command = f"zones/{self._id:d}/overlay"
+        request.action = Action.CHANGE
+        request.payload = TadoZone._build_overlay_payload(
+            zone_type=device_type,
+            overlay_mode=overlay_mode,
+            set_temp=set_temp,
+            duration=duration,
+            power=power,
+            mode=mode,
+            fan_speed=fan_speed,
+            swing=swing,
+            fan_level=fan_level,
+            vertical_swing=vertical_swing,
+            horizontal_swing=horizontal_swing,
+        )
+
+        return await self._http.request(request)
+
+    async def set_open_window(self) -> None:
+        """
+        Sets the window in zone to open
+        Note: This can only be set if an open window was detected in this zone
+        """
+
+        request = TadoRequest()
+        request.command = f"zones/{self._id:d}/state/openWindow/activate"
+        request.action = Action.SET
+        request.mode = Mode.PLAIN
+
+        await self._http.request(request)
+
+    async def reset_open_window(self) -> None:
+        """
+        Sets the window in zone to closed
+        """
+
+        request = TadoRequest()
+        request.command = f"zones/{self._id:d}/state/openWindow"
+        request.action = Action.RESET
+        request.mode = Mode.PLAIN
+
+        await self._http.request(request)
+
+    async def get_zone_control(self) -> ZoneControl:
+        """
+        Get zone control information
+        """
+
+        request = TadoRequest()
+        request.command = f"zones/{self._id:d}/control"
+
+        return ZoneControl.model_validate(await self._http.request(request))
+
+    async def set_zone_heating_circuit(self, heating_circuit: int) -> ZoneControl:
+        """
+        Sets the heating circuit for a zone
+        """
+
+        request = TadoRequest()
+        request.command = f"zones/{self._id:d}/control/heatingCircuit"
+        request.action = Action.CHANGE
+        request.payload = {"circuitNumber": heating_circuit}
+
+        return ZoneControl.model_validate(await self._http.request(request))
+
+
+class AsyncTadoRoom(AsyncBaseZone[TadoRoom]):
+    """Async Tado Room data structure for hops.tado.com (Tado X)."""
+
+    _zone_class = TadoRoom
+    _home: "AsyncTadoX"
+
+    async def update(self) -> None:
+        state_request = TadoXRequest()
+        state_request.command = f"rooms/{self._id:d}"
+
+        state, room, home_state = await asyncio.gather(
+            self._http.request(state_request),
+            self._home._zone_metadata.get(self._id),
+            self._home.get_home_state(),
+        )
+
+        if room is None:
+            raise TadoException(
+                f"Room {self._id} not found in roomsAndDevices response"
+            )
+
+        zone = TadoRoom(self._home, self._id)  # type: ignore[arg-type]
+        zone._raw_state = RoomState.model_validate(state)
+        zone._raw_room = room
+        zone._home_state = home_state
+        self._zone = zone
+
+    async def get_capabilities(self) -> Capabilities:
+        """
+        Tado X does not provide capabilities, we always return type heating.
+        """
+
+        return pre_line_x.Capabilities(
+            type=ZoneType.HEATING,
+            temperatures=pre_line_x.TemperatureCapability(
+                celsius=TemperatureCapabilitiesValues(
+                    min=const.DEFAULT_TADOX_MIN_TEMP,
+                    max=const.DEFAULT_TADOX_MAX_TEMP,
+                    step=const.DEFAULT_TADOX_PRECISION,
+                )
+            ),
+        )
+
+    async def get_schedule(
+        self, timetable: Timetable | None = None, day: DayType | None = None
+    ) -> ScheduleX:
+        """
+        Get the schedule of the room.
+        """
+
+        request = TadoXRequest()
+        request.command = f"rooms/{self._id:d}/schedule"
+
+        return ScheduleX.model_validate(await self._http.request(request))
+
+    async def set_schedule(
+        self,
+        data: list[Schedule] | SetSchedule,
+        timetable: Timetable | None = None,
+        day: DayType | None = None,
+    ) -> None:
+        """
+        Set the schedule of the room.
+        """
+
+        if isinstance(data, SetSchedule):
+            request = TadoXRequest()
+            request.command = f"rooms/{self._id:d}/schedule"
+            request.action = Action.SET
+            request.payload = data.model_dump(by_alias=True, exclude_defaults=True)
+            request.mode = Mode.OBJECT
+            await self._http.request(request)
+            return None
+        raise TadoException("Invalid data type for set_schedule for Tado X API")
+
+    async def reset_zone_overlay(self) -> None:
+        """
+        Delete current overlay
+        """
+
+        request = TadoXRequest()
+        request.command = f"rooms/{self._id:d}/resumeSchedule"
+        request.action = Action.SET
+
+        await self._http.request(request)
+
+    async def set_zone_overlay(
+        self,
+        overlay_mode: OverlayMode,
+        set_temp: float | None = None,
+        duration: timedelta | None = None,
+        power: Power = Power.ON,
+        is_boost: bool | None = None,
+        device_type: ZoneType | None = None,
+        mode: HvacMode | None = None,
+        fan_speed: FanSpeed | None = None,
+        swing: Any = None,
+        fan_level: FanLevel | None = None,
+        vertical_swing: VerticalSwing | None = None,
+        horizontal_swing: HorizontalSwing | None = None,
+    ) -> None:
+        """
+        Set room overlay (manual control), see TadoRoom.set_zone_overlay
+        """
+
+        request = TadoXRequest()
+        request.command = f"rooms/{self._id:d}/manualControl"
+        request.action = Action.SET
+        request.payload = TadoRoom._build_overlay_payload(
+            overlay_mode=overlay_mode,
+            set_temp=set_temp,
+            duration=duration,
+            power=power,
+            is_boost=is_boost,
+        )
+
+        await self._http.request(request)
+        return None
@@ -0,0 +1,160 @@
+"""
+Opt-in response cache for slow changing API resources
+"""
+
+import copy
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlsplit
+
+from PyTado.http import Endpoint
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """TTL for GET responses of an endpoint whose path matches a pattern
+
+    pattern: regular expression, matched against the whole path of the URL after the
+        endpoint, without query string (e.g. "homes/1234/zones/1/capabilities")
+    ttl: seconds a cached response stays valid
+    """
+
+    endpoint: Endpoint
+    pattern: str
+    ttl: float
+    _regex: re.Pattern[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_regex", re.compile(self.pattern))
+
+    def matches(self, endpoint: Endpoint, path: str) -> bool:
+        """Check whether the policy applies to the path of an endpoint"""
+        return endpoint == self.endpoint and self._regex.fullmatch(path) is not None
+
+
+DEFAULT_CACHE_POLICIES: tuple[CachePolicy, ...] = (
+    CachePolicy(Endpoint.MY_API, r"me", 3600),
+    CachePolicy(Endpoint.MY_API, r"homes/\d+/zones", 300),
+    CachePolicy(Endpoint.MY_API, r"homes/\d+/zones/\d+/capabilities", 3600),
+    CachePolicy(Endpoint.MY_API, r"homes/\d+/zones/\d+/defaultOverlay", 300),
+    CachePolicy(Endpoint.MY_API, r"homes/\d+/heatingCircuits", 3600),
+    CachePolicy(Endpoint.HOPS_API, r"homes/\d+/roomsAndDevices", 300),
+    # TadoX.get_installation() requests the home itself, without a command
+    CachePolicy(Endpoint.HOPS_API, r"homes/\d+/(None)?", 3600),
+)
+
+# Longest endpoints first, my.tado.com/mobile/ has to win over my.tado.com/api/v2/
+_ENDPOINTS = sorted(Endpoint, key=lambda endpoint: len(endpoint), reverse=True)
+
+
+def _split_url(url: str) -> tuple[Endpoint, str] | None:
+    """Split an API URL into its endpoint and the path after it, without query string"""
+    for endpoint in _ENDPOINTS:
+        if url.startswith(endpoint):
+            return endpoint, urlsplit(url.removeprefix(endpoint)).path
+    return None
+
+
+def _segments(path: str) -> list[str]:
+    return [segment for segment in path.split("/") if segment and segment != "None"]
+
+
+class ResponseCache:
+    """Size bounded LRU cache of parsed GET responses, with a TTL per CachePolicy
+
+    A write (POST, PUT, PATCH, DELETE) invalidates the cached responses of the same
+    resource, its parents and its children: e.g. a PUT on homes/1/zones/1/defaultOverlay
+    drops homes/1/zones/1/defaultOverlay and homes/1/zones, but not homes/1/zones/2/...
+
+    Responses are returned as copies, so callers can not change the cached data.
+
+    Example usage: http = Http(response_cache=ResponseCache())
+                   tado = Tado.from_http(http)
+    """
+
+    def __init__(
+        self,
+        policies: Iterable[CachePolicy] = DEFAULT_CACHE_POLICIES,
+        max_size: int = 256,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._policies = tuple(policies)
+        self._max_size = max_size
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _ttl(self, url: str) -> float | None:
+        split = _split_url(url)
+        if split is None:
+            return None
+
+        endpoint, path = split
+        for policy in self._policies:
+            if policy.matches(endpoint, path):
+                return policy.ttl
+        return None
+
+    def get(self, url: str) -> Any | None:
+        """Return a copy of the cached response of a GET request, None if not cached"""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._entries[url]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(url)
+            self.hits += 1
+            value = entry[1]
+
+        return copy.deepcopy(value)
+
+    def put(self, url: str, response: Any) -> None:
+        """Cache the response of a GET request, if a policy applies to the URL"""
+        ttl = self._ttl(url)
+        if ttl is None or ttl <= 0:
+            return
+
+        value = copy.deepcopy(response)
+        with self._lock:
+            self._entries[url] = (self._clock() + ttl, value)
+            self._entries.move_to_end(url)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, url: str) -> None:
+        """Drop the cached responses of the resource written to, its parents and children"""
+        split = _split_url(url)
+        if split is None:
+            return
+
+        endpoint, path = split
+        written = _segments(path)
+
+        with self._lock:
+            for cached_url in list(self._entries):
+                cached = _split_url(cached_url)
+                if cached is None or cached[0] != endpoint:
+                    continue
+
+                segments = _segments(cached[1])
+                common = min(len(segments), len(written))
+                if segments[:common] == written[:common]:
+                    del self._entries[cached_url]
+
+    def clear(self) -> None:
+        """Drop all cached responses"""
+        with self._lock:
+            self._entries.clear()
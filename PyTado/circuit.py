@@ -0,0 +1,203 @@
+"""
+Circuit breaker per endpoint and a retry budget shared by all endpoints
+"""
+
+import enum
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from PyTado.exceptions import TadoCircuitOpenException
+
+
+class CircuitState(enum.StrEnum):
+    """State of the circuit of an endpoint"""
+
+    CLOSED = "CLOSED"  # requests are sent
+    OPEN = "OPEN"  # requests fail fast
+    HALF_OPEN = "HALF_OPEN"  # a single probe request is sent
+
+
+@dataclass(frozen=True)
+class CircuitStatus:
+    """Circuit of an endpoint
+
+    state: CLOSED, OPEN or HALF_OPEN
+    failures: consecutive failed calls
+    retry_in: seconds until a probe request is let through, None unless OPEN
+    """
+
+    state: CircuitState
+    failures: int
+    retry_in: float | None = None
+
+
+@dataclass(frozen=True)
+class RetryBudgetStatus:
+    """Retry budget over the sliding window
+
+    requests: calls sent in the window
+    retries: retries sent in the window
+    remaining: retries that may still be sent
+    """
+
+    requests: int
+    retries: int
+    remaining: int
+
+
+@dataclass
+class _Circuit:
+    state: CircuitState = CircuitState.CLOSED
+    failures: int = 0
+    opened_at: float = 0.0
+    probing: bool = False
+
+
+class CircuitBreaker:
+    """Circuit breaker per Endpoint and a retry budget shared by all endpoints
+
+    After `failure_threshold` consecutive failed calls (5xx responses, connection errors
+    and timeouts) the circuit of an endpoint opens and its calls fail fast with a
+    TadoCircuitOpenException. After `reset_timeout` seconds a single probe call is let
+    through (half-open): if it succeeds the circuit closes, otherwise it opens again.
+
+    Retries of all endpoints share a budget: within `window` seconds at most
+    `min_retries` plus `retry_ratio` of the calls may be retried, so that a failing
+    endpoint can not multiply the load with retries. Open circuits are not retried.
+
+    Example usage: breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+                   http = Http(circuit_breaker=breaker)
+                   http.circuit_status()
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        retry_ratio: float = 0.2,
+        min_retries: int = 10,
+        window: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._retry_ratio = retry_ratio
+        self._min_retries = min_retries
+        self._window = window
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._circuits: dict[str, _Circuit] = {}
+        self._requests: deque[float] = deque()
+        self._retries: deque[float] = deque()
+
+    def _circuit(self, endpoint: str) -> _Circuit:
+        return self._circuits.setdefault(endpoint, _Circuit())
+
+    def _expire(self, now: float) -> None:
+        for sent in (self._requests, self._retries):
+            while sent and sent[0] <= now - self._window:
+                sent.popleft()
+
+    def _retry_allowance(self) -> int:
+        return int(self._min_retries + self._retry_ratio * len(self._requests))
+
+    def before_request(self, endpoint: str) -> None:
+        """
+        Let a call to the endpoint through, every call has to be followed by record_result.
+
+        Raises:
+            TadoCircuitOpenException: If the circuit of the endpoint is open, or half-open
+                with its probe call in flight.
+        """
+
+        with self._lock:
+            now = self._clock()
+            circuit = self._circuit(endpoint)
+
+            if circuit.state == CircuitState.OPEN:
+                retry_in = circuit.opened_at + self._reset_timeout - now
+                if retry_in > 0:
+                    raise TadoCircuitOpenException(
+                        f"Circuit of {endpoint} is open, retry in {retry_in:.0f} seconds"
+                    )
+                circuit.state = CircuitState.HALF_OPEN
+
+            if circuit.state == CircuitState.HALF_OPEN:
+                if circuit.probing:
+                    raise TadoCircuitOpenException(
+                        f"Circuit of {endpoint} is half-open, waiting for its probe"
+                    )
+                circuit.probing = True
+
+            self._expire(now)
+            self._requests.append(now)
+
+    def record_result(self, endpoint: str, succeeded: bool | None) -> None:
+        """Record the outcome of a call let through by before_request, None if cancelled"""
+
+        with self._lock:
+            circuit = self._circuit(endpoint)
+            circuit.probing = False
+
+            if succeeded is None:
+                return
+
+            if succeeded:
+                circuit.state = CircuitState.CLOSED
+                circuit.failures = 0
+                return
+
+            circuit.failures += 1
+            if (
+                circuit.state == CircuitState.HALF_OPEN
+                or circuit.failures >= self._failure_threshold
+            ):
+                circuit.state = CircuitState.OPEN
+                circuit.opened_at = self._clock()
+
+    def allow_retry(self, endpoint: str) -> bool:
+        """Take a retry of a call to the endpoint from the budget, False if none is left"""
+
+        with self._lock:
+            if self._circuit(endpoint).state != CircuitState.CLOSED:
+                return False
+
+            now = self._clock()
+            self._expire(now)
+            if len(self._retries) >= self._retry_allowance():
+                return False
+
+            self._retries.append(now)
+            return True
+
+    def status(self) -> dict[str, CircuitStatus]:
+        """Return the circuit of every endpoint called so far"""
+
+        with self._lock:
+            now = self._clock()
+            return {
+                endpoint: CircuitStatus(
+                    state=circuit.state,
+                    failures=circuit.failures,
+                    retry_in=(
+                        max(0.0, circuit.opened_at + self._reset_timeout - now)
+                        if circuit.state == CircuitState.OPEN
+                        else None
+                    ),
+                )
+                for endpoint, circuit in self._circuits.items()
+            }
+
+    def retry_budget(self) -> RetryBudgetStatus:
+        """Return the retry budget of the current window"""
+
+        with self._lock:
+            self._expire(self._clock())
+            return RetryBudgetStatus(
+                requests=len(self._requests),
+                retries=len(self._retries),
+                remaining=max(0, self._retry_allowance() - len(self._retries)),
+            )
@@ -0,0 +1,106 @@
+"""
+Pluggable JSON codecs for request and response bodies and the token file
+"""
+
+import json
+from typing import Any
+
+
+class JsonCodec:
+    """JSON codec using the json module of the standard library"""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object to UTF-8 encoded JSON"""
+        return json.dumps(obj).encode("utf-8")
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode JSON from bytes or str, raises a ValueError for invalid JSON"""
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec using orjson, requires the optional orjson dependency"""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        try:
+            import orjson
+        except ImportError as e:
+            raise ImportError(
+                "OrjsonCodec requires orjson, install it with 'pip install orjson'"
+            ) from e
+
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._dumps(obj)
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    """JSON codec using msgspec, requires the optional msgspec dependency"""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        try:
+            import msgspec
+        except ImportError as e:
+            raise ImportError(
+                "MsgspecCodec requires msgspec, install it with 'pip install msgspec'"
+            ) from e
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: bytes | str) -> Any:
+        # msgspec.DecodeError is a ValueError, like json.JSONDecodeError
+        return self._decoder.decode(data)
+
+
+_CODECS: dict[str, type[JsonCodec]] = {
+    JsonCodec.name: JsonCodec,
+    OrjsonCodec.name: OrjsonCodec,
+    MsgspecCodec.name: MsgspecCodec,
+}
+
+
+def get_codec(codec: JsonCodec | str = "json") -> JsonCodec:
+    """
+    Return a JSON codec by name, or the given codec instance.
+
+    Args:
+        codec: "json", "orjson", "msgspec" or "auto" for the fastest installed one,
+            falling back to the standard library.
+
+    Raises:
+        ImportError: If the requested codec is not installed.
+        ValueError: If the codec name is unknown.
+    """
+
+    if isinstance(codec, JsonCodec):
+        return codec
+
+    if codec == "auto":
+        for candidate in (OrjsonCodec, MsgspecCodec):
+            try:
+                return candidate()
+            except ImportError:
+                continue
+        return JsonCodec()
+
+    if codec not in _CODECS:
+        raise ValueError(
+            f"Unknown JSON codec {codec!r}, use one of {[*_CODECS, 'auto']}"
+        )
+
+    return _CODECS[codec]()
@@ -70,3 +70,12 @@ HOME_DOMAIN = "homes"
 DEVICE_DOMAIN = "devices"
 
 HTTP_CODES_OK = [200, 201, 202, 204]
+
+# Seconds the zone (room) list of a home is shared by its zone objects before a refetch
+ZONE_METADATA_TTL = 300
+
+# Seconds a zone object handed out by Tado.get_zone() keeps its state before an update
+ZONE_STATE_MAX_AGE = 10
+
+# Zones per request of Tado.set_zone_overlays() and Tado.reset_zone_overlays()
+ZONE_OVERLAYS_PER_REQUEST = 20
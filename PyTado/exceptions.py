@@ -19,3 +19,15 @@ class TadoNoCredentialsException(TadoCredentialsException):
 
 class TadoWrongCredentialsException(TadoCredentialsException):
     """Exception to indicate wrong credentials"""
+
+
+class TadoRateLimitException(TadoException):
+    """Exception to indicate the request budget or the API quota is exhausted"""
+
+
+class TadoTimeoutException(TadoException):
+    """Exception to indicate a request timed out or exceeded its deadline"""
+
+
+class TadoCircuitOpenException(TadoException):
+    """Exception to indicate the calls to an endpoint fail fast after repeated failures"""
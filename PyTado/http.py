@@ -2,32 +2,56 @@
 Do all the API HTTP heavy lifting in this file
 """
 
+import contextvars
+import copy
 import enum
-import json
 import logging
 import os
 import pprint
+import threading
 import time
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from json import dump as json_dump
-from json import load as json_load
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, TypeVar, overload
 from urllib.parse import urlencode
 
 import requests
 import requests.adapters
+from pydantic import BaseModel
 from urllib3 import Retry
-from urllib3.exceptions import MaxRetryError
+from urllib3.exceptions import ConnectTimeoutError, MaxRetryError, ReadTimeoutError
 
 from PyTado import __version__
+from PyTado.circuit import CircuitBreaker, CircuitStatus, RetryBudgetStatus
+from PyTado.codec import JsonCodec, get_codec
 from PyTado.const import CLIENT_ID_DEVICE, HTTP_CODES_OK
-from PyTado.exceptions import TadoException, TadoWrongCredentialsException
+from PyTado.exceptions import (
+    TadoException,
+    TadoTimeoutException,
+    TadoWrongCredentialsException,
+)
 from PyTado.logger import Logger
+from PyTado.metrics import (
+    Observer,
+    RequestMetrics,
+    command_template,
+    notify,
+    set_validation_target,
+)
+from PyTado.models.util import ModelAdapter
+from PyTado.ratelimit import QuotaStatus, RateLimiter
+
+if TYPE_CHECKING:
+    from PyTado.cache import ResponseCache  # pragma: no cover
 
 _LOGGER = Logger(__name__)
 
+_M = TypeVar("_M", bound=BaseModel)
+_T = TypeVar("_T")
+
 
 class Endpoint(enum.StrEnum):
     """Endpoint URL Enum"""
@@ -86,6 +110,8 @@ class TadoRequest:
     device: int | str | None = None
     mode: Mode = Mode.OBJECT
     params: dict[str, Any] | None = None
+    # seconds the whole call may take, including retries, None for the client default
+    deadline: float | None = None
 
 
 @dataclass
@@ -113,6 +139,23 @@ class TadoXRequest(TadoRequest):
         self._action = value
 
 
+@dataclass(frozen=True)
+class ConnectionPoolStats:
+    """Counters of the connection pools used by the Http client
+
+    requests: requests sent through the pools, including retries
+    new_connections: connections that had to be opened (TCP and TLS handshake)
+    """
+
+    requests: int = 0
+    new_connections: int = 0
+
+    @property
+    def reused_connections(self) -> int:
+        """Requests that were sent over an already open, pooled connection"""
+        return self.requests - self.new_connections
+
+
 class TadoResponse:
     """Unimplemented Response Container
     todo: implement response parser"""
@@ -122,17 +165,102 @@ class TadoResponse:
 
 _DEFAULT_TIMEOUT = 10
 _DEFAULT_RETRIES = 5
+# request_many() stays below the 10 connections an HTTPAdapter keeps per host
+_DEFAULT_MAX_CONCURRENCY = 8
+
+_OAUTH_TOKEN_URL = "https://login.tado.com/oauth2/token"  # nosec B105
+_OAUTH_DEVICE_AUTHORIZE_URL = "https://login.tado.com/oauth2/device_authorize"
+
+# time.monotonic() deadline of the request being sent by the current thread
+_DEADLINE: contextvars.ContextVar[float | None] = contextvars.ContextVar(
+    "_DEADLINE", default=None
+)
+# takes a retry of the request being sent by the current thread from the retry budget
+_RETRY_GATE: contextvars.ContextVar[Callable[[], bool] | None] = contextvars.ContextVar(
+    "_RETRY_GATE", default=None
+)
+
+
+@dataclass(frozen=True)
+class Timeout:
+    """Connect and read timeout in seconds of the requests to an endpoint
+
+    The read timeout limits the wait for each chunk of the response, not the whole call,
+    use a deadline for that.
+    """
+
+    connect: float = 5.0
+    read: float = float(_DEFAULT_TIMEOUT)
+
+
+class _BoundedRetry(Retry):
+    """urllib3 Retry which stops retrying at the deadline of the request being sent,
+    when the retry budget is used up or when the circuit of the endpoint opened"""
+
+    @staticmethod
+    def _remaining() -> float | None:
+        deadline = _DEADLINE.get()
+        return None if deadline is None else deadline - time.monotonic()
+
+    def is_exhausted(self) -> bool:
+        if super().is_exhausted():
+            return True
+
+        remaining = self._remaining()
+        if remaining is not None and remaining <= 0:
+            return True
+
+        # called once for every retry by increment(), which is when the retry is taken
+        gate = _RETRY_GATE.get()
+        return gate is not None and bool(self.history) and not gate()
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        remaining = self._remaining()
+        return backoff if remaining is None else max(0.0, min(backoff, remaining))
+
+    def get_retry_after(self, response: Any) -> float | None:
+        retry_after = super().get_retry_after(response)
+        remaining = self._remaining()
+        if retry_after is None or remaining is None:
+            return retry_after
+        return max(0.0, min(retry_after, remaining))
+
+
+def _is_timeout(error: Exception, deadline: float | None) -> bool:
+    """Check whether a requests error was caused by a timeout or the deadline"""
+    if deadline is not None and deadline <= time.monotonic():
+        return True
+
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(reason, (ConnectTimeoutError, ReadTimeoutError))
+
 
+def _validate_json(
+    model: type[BaseModel] | ModelAdapter[Any], body: bytes | str
+) -> Any:
+    if isinstance(model, ModelAdapter):
+        return model.validate_json(body)
+    return model.model_validate_json(body)
 
-class Http:
-    """API Request Class"""
+
+def _validate_python(model: type[BaseModel] | ModelAdapter[Any], data: Any) -> Any:
+    if isinstance(model, ModelAdapter):
+        return model.validate_python(data)
+    return model.model_validate(data)
+
+
+class BaseHttp:
+    """Transport independent state and helpers of the API client.
+
+    Everything in here works without doing any I/O, so that the blocking
+    ``Http`` client and the asyncio based ``AsyncHttp`` client share the same
+    OAuth, URL and payload handling.
+    """
 
     _refresh_at: datetime
-    _session: requests.Session
     _headers: dict[str, str]
-    _username: str
-    _password: str
-    _id: int
+    _id: int | None
     _token_refresh: str | None = None
     _x_api: bool | None = None
     _user_code: str | None = None
@@ -141,78 +269,131 @@ class Http:
         DeviceActivationStatus.NOT_STARTED
     )
     _expires_at: datetime | None = None
+    _device_flow_data: dict[str, Any]
+    # home id and generation as written to the token file
+    _saved_home: tuple[int | None, bool | None] = (None, None)
+    # False while a home loaded from the token file has not been confirmed by the API
+    _home_verified: bool = True
 
     def __init__(
         self,
         token_file_path: str | None = None,
-        saved_refresh_token: str | None = None,
-        http_session: requests.Session | None = None,
         debug: bool = False,
         user_agent: str | None = None,
+        response_cache: "ResponseCache | None" = None,
+        rate_limiter: RateLimiter | None = None,
+        json_codec: JsonCodec | str = "json",
+        timeout: Timeout = Timeout(),
+        endpoint_timeouts: Mapping[str, Timeout] | None = None,
+        deadline: float | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        observers: Iterable[Observer] | None = None,
     ) -> None:
-        """
-        Initialize the HTTP client for interacting with the Tado API.
-
-        Args:
-            token_file_path (str | None): Path to the file where the token is stored.
-                If None, the token will not be saved to a file.
-            saved_refresh_token (str | None): A previously saved refresh token to use for
-                authentication. If None, a new token will be requested.
-            http_session (requests.Session | None): An optional pre-configured HTTP session.
-                If None, a new session will be created.
-            debug (bool): If True, enables debug logging. Defaults to False.
-            user_agent (str | None): Optional user-agent header to use for the HTTP requests.
-                If None, a default user-agent PyTado/<PyTado-version> will be used.
-
-        Returns:
-            None
-        """
-
         if debug:
             _LOGGER.setLevel(logging.DEBUG)
         else:
             _LOGGER.setLevel(logging.WARNING)
 
-        self._retries = Retry(
-            total=_DEFAULT_RETRIES,
-            backoff_factor=0.1,
-            backoff_jitter=0.5,
-            backoff_max=120,
-            status_forcelist=[502, 503, 504],
-        )
-
-        self._http_adapter = requests.adapters.HTTPAdapter(
-            max_retries=self._retries,
-        )
-
         self._refresh_at = datetime.now(timezone.utc) + timedelta(minutes=10)
-        self._session = http_session or self._create_session()
-        self._session.hooks["response"].append(self._log_response)
         self._headers = {
             "Referer": "https://app.tado.com/",
             "user-agent": user_agent or f"PyTado/{__version__}",
         }
 
-        self._user_code: str | None = None
-        self._device_verification_url: str | None = None
+        self._user_code = None
+        self._device_verification_url = None
         self._device_activation_status = DeviceActivationStatus.NOT_STARTED
-        self._expires_at: datetime | None = None
+        self._expires_at = None
 
-        self._id: int | None = None
-        self._token_refresh: str | None = None
-        self._x_api: bool | None = None
+        self._id = None
+        self._token_refresh = None
+        self._x_api = None
         self._token_file_path = token_file_path
+        self._response_cache = response_cache
+        self._rate_limiter = rate_limiter or RateLimiter()
+        self._codec = get_codec(json_codec)
+        self._timeout = timeout
+        self._endpoint_timeouts = dict(endpoint_timeouts or {})
+        self._deadline = deadline
+        self._circuit_breaker = circuit_breaker or CircuitBreaker()
+        self._observers: tuple[Observer, ...] = tuple(observers or ())
+
+    def quota_status(self) -> dict[str, QuotaStatus]:
+        """
+        Return the request accounting of the account and of every endpoint used so far.
 
-        self._session.mount("https://", self._http_adapter)
-        self._session.mount("http://", self._http_adapter)
+        The keys are RateLimiter.ACCOUNT and the Endpoint URLs, e.g.
+        `http.quota_status()[Endpoint.MY_API].remaining`. The limit, remaining quota and
+        reset time are taken from the rate limit headers of the API when it sends them.
+        """
+        return self._rate_limiter.quota_status()
 
-        if saved_refresh_token or self._load_token():
-            if self._refresh_token(
-                refresh_token=saved_refresh_token, force_refresh=True
-            ):
-                self._device_ready()
-        else:
-            self._device_activation_status = self._login_device_flow()
+    def circuit_status(self) -> dict[str, CircuitStatus]:
+        """
+        Return the circuit breaker state of every endpoint called so far.
+
+        The keys are the Endpoint URLs, e.g. `http.circuit_status()[Endpoint.HOPS_API].state`.
+        """
+        return self._circuit_breaker.status()
+
+    def retry_budget_status(self) -> RetryBudgetStatus:
+        """Return how many retries were sent, and may still be sent, in the current window"""
+        return self._circuit_breaker.retry_budget()
+
+    def add_observer(self, observer: Observer) -> None:
+        """Send the metrics of the following API calls to the observer as well"""
+        self._observers = (*self._observers, observer)
+
+    def remove_observer(self, observer: Observer) -> None:
+        """Stop sending metrics to the observer"""
+        self._observers = tuple(
+            item for item in self._observers if item is not observer
+        )
+
+    @staticmethod
+    def _command_template(request: TadoRequest) -> str:
+        """Return the command of a request as a template, e.g. zones/{id}/state"""
+        if request.domain == Domain.ME:
+            return str(request.domain)
+        if request.domain in (Domain.DEVICES, Domain.HOME_BY_BRIDGE):
+            return command_template(f"{request.domain}/{{id}}/{request.command}")
+        return command_template(request.command or "")
+
+    def _observe_validation(self, request: TadoRequest) -> None:
+        """Attribute the validation of the response of the request to its command"""
+        if self._observers:
+            set_validation_target(
+                self._observers, request.endpoint, self._command_template(request)
+            )
+
+    def _notify_request(
+        self,
+        request: TadoRequest,
+        started: float,
+        status_code: int | None,
+        retries: int,
+        bytes_sent: int,
+        bytes_received: int,
+        error: BaseException | None,
+    ) -> None:
+        if not self._observers:
+            return
+
+        notify(
+            self._observers,
+            "on_request",
+            RequestMetrics(
+                endpoint=request.endpoint,
+                command=self._command_template(request),
+                method=str(request.action),
+                status_code=status_code,
+                duration=time.perf_counter() - started,
+                retries=retries,
+                bytes_sent=bytes_sent,
+                bytes_received=bytes_received,
+                error=None if error is None else type(error).__name__,
+            ),
+        )
 
     @property
     def is_x_line(self) -> bool | None:
@@ -266,59 +447,163 @@ class Http:
         """
         return self._token_refresh
 
-    def _create_session(self) -> requests.Session:
-        session = requests.Session()
-        session.hooks["response"].append(self._log_response)
-        session.mount("https://", self._http_adapter)
-        session.mount("http://", self._http_adapter)
-        return session
+    def _token_expired(self) -> bool:
+        return self._refresh_at < datetime.now(timezone.utc)
 
-    def _log_response(
-        self, response: requests.Response, *args: Any, **kwargs: Any
-    ) -> None:
-        og_request_method = response.request.method
-        og_request_url = response.request.url
-        og_request_headers = response.request.headers
-        response_status = response.status_code
+    def _refresh_token_params(self, refresh_token: str | None = None) -> dict[str, Any]:
+        return {
+            "client_id": CLIENT_ID_DEVICE,
+            "grant_type": "refresh_token",
+            "refresh_token": refresh_token or self._token_refresh,
+        }
 
-        if response.text is None or response.text == "":
-            response_data = {}
-        else:
-            response_data = response.json()
+    @staticmethod
+    def _device_authorize_params() -> dict[str, Any]:
+        return {
+            "client_id": CLIENT_ID_DEVICE,
+            "scope": "offline_access",
+        }
 
-        _LOGGER.debug(
-            f"\nRequest:\n\tMethod:{og_request_method}"
-            f"\n\tURL: {og_request_url}"
-            f"\n\tHeaders: {pprint.pformat(og_request_headers)}"
-            f"\nResponse:\n\tStatusCode: {response_status}"
-            f"\n\tData: {response_data}"
-        )
+    def _device_token_params(self) -> dict[str, Any]:
+        return {
+            "client_id": CLIENT_ID_DEVICE,
+            "device_code": self._device_flow_data["device_code"],
+            "grant_type": "urn:ietf:params:oauth:grant-type:device_code",
+        }
 
-    def request(self, request: TadoRequest) -> dict[str, Any] | list[Any] | str:
-        """Request something from the API with a TadoRequest"""
-        self._refresh_token()
+    def _check_device_flow_expired(self) -> None:
+        if self._expires_at is not None and datetime.timestamp(
+            datetime.now(timezone.utc)
+        ) > datetime.timestamp(self._expires_at):
+            raise TadoException("User took too long to enter key")
 
-        headers = self._headers
-        data = self._configure_payload(headers, request)
-        url = self._configure_url(request)
+    def _start_device_flow(self, device_flow_data: dict[str, Any]) -> None:
+        """Store the device authorization response and compute the verification url"""
 
-        http_request = requests.Request(
-            method=request.action, url=url, headers=headers, data=data
+        self._device_flow_data = device_flow_data
+        _LOGGER.debug("Device flow response: %s", self._device_flow_data)
+
+        user_code = urlencode({"user_code": self._device_flow_data["user_code"]})
+        visit_url = f"{self._device_flow_data['verification_uri']}?{user_code}"
+        self._user_code = self._device_flow_data["user_code"]
+        self._device_verification_url = visit_url
+
+        _LOGGER.info("Please visit the following URL: %s", visit_url)
+
+        expires_in_seconds = self._device_flow_data["expires_in"]
+        self._expires_at = datetime.now(timezone.utc) + timedelta(
+            seconds=expires_in_seconds
         )
-        prepped = http_request.prepare()
-        prepped.hooks["response"].append(self._log_response)
 
-        try:
-            response = self._session.send(prepped)
-        except TadoWrongCredentialsException as e:
-            _LOGGER.error("Credentials Exception: %s", e)
-            raise e
-        except MaxRetryError as e:
-            _LOGGER.error("Max retries exceeded: %s", e)
-            raise TadoException(e) from e
+        _LOGGER.info(
+            "Waiting for user to authorize the device. Expires at %s",
+            self._expires_at.strftime("%Y-%m-%d %H:%M:%S"),
+        )
+
+    def _complete_device_flow(self, home_id: int, x_api: bool) -> None:
+        """Mark the device as ready once home id and generation are known"""
+        self._id = home_id
+        self._x_api = x_api
+        self._user_code = None
+        self._device_verification_url = None
+        self._device_activation_status = DeviceActivationStatus.COMPLETED
 
-        if response.text == "":
-            if response.status_code == 204:
+        if self._saved_home != (home_id, x_api):
+            self._save_token()
+
+    def _resume_saved_home(self) -> bool:
+        """
+        Trust the home id and generation loaded from the token file.
+
+        Skips the token refresh and the lookup of the home on startup: the token is
+        refreshed with the first request and the home is looked up again only if the
+        API rejects the first request for it, see `_verify_saved_home()`.
+
+        Returns:
+            bool: True if the token file contained the home, False otherwise.
+        """
+
+        home_id, x_api = self._saved_home
+        if home_id is None or x_api is None:
+            return False
+
+        _LOGGER.debug("Using home %d from %s", home_id, self._token_file_path)
+
+        self._refresh_at = datetime.now(timezone.utc)
+        self._home_verified = False
+        self._complete_device_flow(home_id, x_api)
+
+        return True
+
+    def _verify_saved_home(self, request: TadoRequest, status_code: int) -> bool:
+        """Return True if the home loaded from the token file has to be looked up again"""
+
+        if self._home_verified or request.domain != Domain.HOME:
+            return False
+
+        if status_code in HTTP_CODES_OK:
+            self._home_verified = True
+        elif status_code in (403, 404):
+            _LOGGER.warning("Home %s from the token file was rejected", self._id)
+            self._home_verified = True
+            return True
+
+        return False
+
+    @staticmethod
+    def _me_request() -> TadoRequest:
+        request = TadoRequest()
+        request.action = Action.GET
+        request.domain = Domain.ME
+        return request
+
+    @staticmethod
+    def _home_request() -> TadoRequest:
+        request = TadoRequest()
+        request.action = Action.GET
+        request.domain = Domain.HOME
+        request.command = ""
+        return request
+
+    @staticmethod
+    def _parse_home_id(response: dict[str, Any] | list[Any] | str) -> int:
+        if not isinstance(response, dict):
+            raise TadoException("Unexpected response type")
+
+        homes_ = response["homes"]
+
+        return int(homes_[0]["id"])
+
+    @staticmethod
+    def _parse_x_line_generation(home_: dict[str, Any] | list[Any] | str) -> bool:
+        if not isinstance(home_, dict):
+            raise TadoException("Unexpected response type")
+
+        return "generation" in home_ and home_["generation"] == "LINE_X"
+
+    def _parse_response(
+        self, url: str, status_code: int, body: bytes | str
+    ) -> dict[str, Any] | list[Any] | str:
+        """Convert the status code and body of an API response to the result of request()"""
+
+        checked = self._check_response(url, status_code, body)
+        if isinstance(checked, dict):
+            return checked
+
+        response_json = self._codec.loads(checked)
+        if isinstance(response_json, (dict, list, str)):
+            return response_json
+
+        raise TadoException("Unexpected response type")
+
+    @staticmethod
+    def _check_response(
+        url: str, status_code: int, body: bytes | str
+    ) -> dict[str, Any] | bytes | str:
+        """Return the body of a successful API response, the result of request() if empty"""
+
+        if not body:
+            if status_code == 204:
                 # Tado changed some (all?) APIs from HTTP 200 to HTTP 204.
                 # Make sure that PyTado returns {"success": True} if Tado returns HTTP 204
                 # to ensure that the interface of this library is not changed. Can be removed
@@ -326,22 +611,16 @@ class Http:
                 return {"success": True}
             return {}
 
-        if response.status_code not in HTTP_CODES_OK:
+        if status_code not in HTTP_CODES_OK:
             _LOGGER.error(
                 "Request %s failed with status code %d: %s",
                 url,
-                response.status_code,
-                response.json(),
-            )
-            raise TadoException(
-                f"Request failed with status code {response.status_code}"
+                status_code,
+                body.decode("utf-8", "replace") if isinstance(body, bytes) else body,
             )
+            raise TadoException(f"Request failed with status code {status_code}")
 
-        response_json = response.json()
-        if isinstance(response_json, (dict, list, str)):
-            return response_json
-
-        raise TadoException("Unexpected response type")
+        return body
 
     def _configure_url(self, request: TadoRequest) -> str:
         if request.endpoint == Endpoint.MOBILE:
@@ -363,18 +642,71 @@ class Http:
 
         return url
 
-    def _configure_payload(
-        self, headers: dict[str, str], request: TadoRequest
-    ) -> bytes:
+    def _configure_payload(self, request: TadoRequest) -> tuple[dict[str, str], bytes]:
+        """Return the headers and body of a request, the shared headers are left untouched"""
+        headers = dict(self._headers)
+
         if request.payload is None:
-            return b""
+            return headers, b""
 
         if request.mode == Mode.PLAIN:
             headers["Content-Type"] = "text/plain;charset=UTF-8"
         else:
             headers["Content-Type"] = "application/json;charset=UTF-8"
         headers["Mime-Type"] = "application/json;charset=UTF-8"
-        return json.dumps(request.payload).encode("utf8")
+        return headers, self._codec.dumps(request.payload)
+
+    def _deadline_of(self, request: TadoRequest) -> float | None:
+        """Return the time.monotonic() deadline of a request starting now, if any"""
+        seconds = request.deadline if request.deadline is not None else self._deadline
+        return None if seconds is None else time.monotonic() + seconds
+
+    @staticmethod
+    def _remaining(deadline: float | None, url: str) -> float | None:
+        """Return the seconds left until the deadline, raise if it has passed"""
+        if deadline is None:
+            return None
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TadoTimeoutException(f"Deadline exceeded for {url}")
+        return remaining
+
+    def _timeout_of(
+        self, request: TadoRequest, deadline: float | None, url: str
+    ) -> Timeout:
+        """Return the timeout of the endpoint, shortened to the time left until the deadline"""
+        timeout = self._endpoint_timeouts.get(request.endpoint, self._timeout)
+
+        remaining = self._remaining(deadline, url)
+        if remaining is None:
+            return timeout
+
+        return Timeout(
+            connect=min(timeout.connect, remaining), read=min(timeout.read, remaining)
+        )
+
+    @staticmethod
+    def _can_coalesce(request: TadoRequest) -> bool:
+        """Identical GET requests without a body can share one upstream call"""
+        return request.action == Action.GET and request.payload is None
+
+    def _cached_response(
+        self, method: str, url: str
+    ) -> dict[str, Any] | list[Any] | str | None:
+        if self._response_cache is None or method != Action.GET:
+            return None
+        return self._response_cache.get(url)
+
+    def _update_cache(
+        self, method: str, url: str, response: dict[str, Any] | list[Any] | str
+    ) -> None:
+        if self._response_cache is None:
+            return
+        if method == Action.GET:
+            self._response_cache.put(url, response)
+        else:
+            self._response_cache.invalidate(url)
 
     def _set_oauth_header(self, data: dict[str, Any]) -> str:
         """Set the OAuth header and return the refresh token"""
@@ -384,13 +716,19 @@ class Http:
         refresh_token = data["refresh_token"]
 
         self._token_refresh = refresh_token
-        self._refresh_at = datetime.now(timezone.utc)
-        self._refresh_at = self._refresh_at + timedelta(seconds=expires_in)
+
+        # Replace instead of update the headers, requests in flight keep the copy they
+        # started with and never see a half updated dict.
+        self._headers = {**self._headers, "Authorization": f"Bearer {access_token}"}
+
         # We subtract 30 seconds from the correct refresh time.
         # Then we have a 30 seconds timespan to get a new refresh_token
-        self._refresh_at = self._refresh_at - timedelta(seconds=30)
-
-        self._headers["Authorization"] = f"Bearer {access_token}"
+        # The expiry is set last, so the new header is in place once it is visible.
+        self._refresh_at = (
+            datetime.now(timezone.utc)
+            + timedelta(seconds=expires_in)
+            - timedelta(seconds=30)
+        )
 
         self._save_token()
 
@@ -404,22 +742,460 @@ class Http:
 
         try:
             with open(self._token_file_path, encoding="utf-8") as f:
-                data = json_load(f)
+                data = self._codec.loads(f.read())
                 self._token_refresh = data.get("refresh_token")
 
+            home_id = data.get("home_id")
+            x_api = data.get("is_x_line")
+            if isinstance(home_id, int) and isinstance(x_api, bool):
+                self._saved_home = (home_id, x_api)
+
             _LOGGER.debug("Refresh token loaded from %s", self._token_file_path)
 
             return True
-        except (OSError, json.JSONDecodeError) as e:
+        except (OSError, ValueError) as e:
             _LOGGER.error("Failed to load refresh token: %s", e)
             raise TadoException(e) from e
 
+    def _save_token(self) -> None:
+        """Save the refresh token, and the home once it is known, to a file."""
+        if not self._token_file_path or not self._token_refresh:
+            return
+
+        data: dict[str, Any] = {"refresh_token": self._token_refresh}
+        if self._id is not None and self._x_api is not None:
+            data["home_id"] = self._id
+            data["is_x_line"] = self._x_api
+
+        try:
+            token_dir = os.path.dirname(self._token_file_path)
+            if token_dir and not os.path.exists(token_dir):
+                Path(token_dir).mkdir(parents=True, exist_ok=True)
+
+            with open(self._token_file_path, "w", encoding="utf-8") as f:
+                f.write(self._codec.dumps(data).decode("utf-8"))
+
+            self._saved_home = (self._id, self._x_api)
+            _LOGGER.debug("Refresh token saved to %s", self._token_file_path)
+        except Exception as e:
+            _LOGGER.error("Failed to save refresh token: %s", e)
+            raise TadoException(e) from e
+
+
+class Http(BaseHttp):
+    """API Request Class
+
+    An instance can be shared between threads: requests use their own copy of the
+    headers and an expired token is refreshed once, while the other callers wait for it.
+    Identical GET requests that are in flight at the same time share one upstream call.
+    """
+
+    _session: requests.Session
+
+    def __init__(
+        self,
+        token_file_path: str | None = None,
+        saved_refresh_token: str | None = None,
+        http_session: requests.Session | None = None,
+        debug: bool = False,
+        user_agent: str | None = None,
+        response_cache: "ResponseCache | None" = None,
+        rate_limiter: RateLimiter | None = None,
+        json_codec: JsonCodec | str = "json",
+        timeout: Timeout = Timeout(),
+        endpoint_timeouts: Mapping[str, Timeout] | None = None,
+        deadline: float | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        observers: Iterable[Observer] | None = None,
+    ) -> None:
+        """
+        Initialize the HTTP client for interacting with the Tado API.
+
+        Args:
+            token_file_path (str | None): Path to the file where the token is stored.
+                If None, the token will not be saved to a file.
+            saved_refresh_token (str | None): A previously saved refresh token to use for
+                authentication. If None, a new token will be requested.
+            http_session (requests.Session | None): An optional pre-configured HTTP session.
+                If None, a new session will be created.
+            debug (bool): If True, enables debug logging. Defaults to False.
+            user_agent (str | None): Optional user-agent header to use for the HTTP requests.
+                If None, a default user-agent PyTado/<PyTado-version> will be used.
+            response_cache (ResponseCache | None): Optional cache for GET responses of slow
+                changing resources (zones, capabilities, ...). If None, nothing is cached.
+            rate_limiter (RateLimiter | None): Optional request budgets per account and
+                endpoint. If None, requests are only counted, see `quota_status()`.
+            json_codec (JsonCodec | str): JSON codec of the request and response bodies and
+                of the token file: "json" (default), "orjson", "msgspec", "auto" for the
+                fastest one installed, or a JsonCodec instance.
+            timeout (Timeout): Connect and read timeout of the requests, 5 and 10 seconds
+                by default.
+            endpoint_timeouts (Mapping[str, Timeout] | None): Timeouts of specific
+                endpoints, e.g. {Endpoint.MINDER: Timeout(read=30)}.
+            deadline (float | None): Seconds a call may take in total, including retries
+                and their backoff, unless the TadoRequest sets its own deadline. If None,
+                calls are only limited by the timeouts and the retries.
+            circuit_breaker (CircuitBreaker | None): Circuit breaker per endpoint and retry
+                budget. If None, a CircuitBreaker with its defaults is used.
+            observers (Iterable[Observer] | None): Receive the duration, status code,
+                retries and sizes of every API call and the time spent validating the
+                responses, e.g. a MetricsRecorder or PrometheusObserver from
+                PyTado.metrics. More can be added with `add_observer()`.
+
+        Returns:
+            None
+        """
+
+        super().__init__(
+            token_file_path=token_file_path,
+            debug=debug,
+            user_agent=user_agent,
+            response_cache=response_cache,
+            rate_limiter=rate_limiter,
+            json_codec=json_codec,
+            timeout=timeout,
+            endpoint_timeouts=endpoint_timeouts,
+            deadline=deadline,
+            circuit_breaker=circuit_breaker,
+            observers=observers,
+        )
+
+        self._refresh_lock = threading.Lock()
+        self._in_flight: dict[str, Future[Any]] = {}
+        self._in_flight_lock = threading.Lock()
+
+        self._retries = _BoundedRetry(
+            total=_DEFAULT_RETRIES,
+            backoff_factor=0.1,
+            backoff_jitter=0.5,
+            backoff_max=120,
+            status_forcelist=[502, 503, 504],
+        )
+
+        self._http_adapter = requests.adapters.HTTPAdapter(
+            max_retries=self._retries,
+        )
+
+        # The session and its adapter are kept for the whole lifetime of the client,
+        # so that token refreshes do not throw away the pooled connections.
+        self._session = http_session or requests.Session()
+        # Logs the OAuth requests sent with session.request(), the API requests are
+        # prepared separately and carry the hook themselves (session.send() does not
+        # merge the session hooks), so each response is logged once.
+        self._session.hooks["response"].append(self._log_response)
+
+        self._session.mount("https://", self._http_adapter)
+        self._session.mount("http://", self._http_adapter)
+
+        if saved_refresh_token or self._load_token():
+            # a home saved with the token is trusted, the refresh happens on first use
+            if not self._resume_saved_home() and self._refresh_token(
+                refresh_token=saved_refresh_token, force_refresh=True
+            ):
+                self._device_ready()
+        else:
+            self._device_activation_status = self._login_device_flow()
+
+    def connection_pool_stats(self) -> ConnectionPoolStats:
+        """Return how many requests reused a pooled connection versus opening a new one"""
+        pools = self._http_adapter.poolmanager.pools
+        stats = [pools[key] for key in pools.keys()]
+
+        return ConnectionPoolStats(
+            requests=sum(pool.num_requests for pool in stats),
+            new_connections=sum(pool.num_connections for pool in stats),
+        )
+
+    def _log_response(
+        self, response: requests.Response, *args: Any, **kwargs: Any
+    ) -> None:
+        # Called for every response, do nothing unless debug logging is enabled.
+        # The body is logged as received, it is only parsed once in request().
+        if not _LOGGER.isEnabledFor(logging.DEBUG):
+            return
+
+        _LOGGER.debug(
+            f"\nRequest:\n\tMethod:{response.request.method}"
+            f"\n\tURL: {response.request.url}"
+            f"\n\tHeaders: {pprint.pformat(response.request.headers)}"
+            f"\nResponse:\n\tStatusCode: {response.status_code}"
+            f"\n\tData: {response.text}"
+        )
+
+    def request(self, request: TadoRequest) -> dict[str, Any] | list[Any] | str:
+        """
+        Request something from the API with a TadoRequest
+
+        Raises:
+            TadoTimeoutException: If the request timed out or exceeded its deadline.
+        """
+        deadline = self._deadline_of(request)
+        self._refresh_token()
+        self._observe_validation(request)
+
+        url = self._configure_url(request)
+
+        cached = self._cached_response(str(request.action), url)
+        if cached is not None:
+            return cached
+
+        if self._can_coalesce(request):
+            return self._coalesce(
+                url, lambda: self._send_request(request, url, deadline), deadline
+            )
+
+        return self._send_request(request, url, deadline)
+
+    @overload
+    def request_model(self, request: TadoRequest, model: type[_M]) -> _M: ...
+
+    @overload
+    def request_model(self, request: TadoRequest, model: ModelAdapter[_T]) -> _T: ...
+
+    def request_model(
+        self, request: TadoRequest, model: type[BaseModel] | ModelAdapter[Any]
+    ) -> Any:
+        """
+        Request something from the API with a TadoRequest and validate the response
+
+        The body of the response is validated by pydantic straight from its bytes, it
+        is not decoded to python objects first. With a response cache, the decoded
+        responses are cached and validated from there.
+
+        Args:
+            request (TadoRequest): The request to send.
+            model (type[BaseModel] | ModelAdapter): The model or model adapter of the
+                response, e.g. ZoneState or Schedules.
+
+        Raises:
+            TadoTimeoutException: If the request timed out or exceeded its deadline.
+            pydantic.ValidationError: If the response does not match the model.
+        """
+        if self._response_cache is not None:
+            return _validate_python(model, self.request(request))
+
+        deadline = self._deadline_of(request)
+        self._refresh_token()
+        self._observe_validation(request)
+
+        url = self._configure_url(request)
+
+        def send() -> dict[str, Any] | bytes | str:
+            return self._send_raw_request(request, url, deadline)
+
+        if self._can_coalesce(request):
+            # not shared with request(), which hands out the decoded response
+            body = self._coalesce(url, send, deadline, key=f"raw {url}")
+        else:
+            body = send()
+
+        if isinstance(body, dict):
+            # the result of request() for a response without a body
+            return _validate_python(model, body)
+        return _validate_json(model, body)
+
+    def request_many(
+        self,
+        requests: Iterable[TadoRequest],  # pylint: disable=redefined-outer-name
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
+    ) -> list[dict[str, Any] | list[Any] | str | Exception]:
+        """
+        Send several requests in parallel over the shared connection pool.
+
+        Args:
+            requests (Iterable[TadoRequest]): The requests to send.
+            max_concurrency (int): Maximum number of requests in flight at once. More
+                than the 10 pooled connections per host are not reused.
+
+        Returns:
+            list: The results in the order of the requests. A request that failed has
+                its exception in its place instead, the other results are kept.
+        """
+
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        batch = list(requests)
+        if not batch:
+            return []
+
+        # refresh an expired token once, before the workers start
+        self._refresh_token()
+
+        def send(request: TadoRequest) -> dict[str, Any] | list[Any] | str | Exception:
+            try:
+                return self.request(request)
+            except Exception as e:  # pylint: disable=broad-except
+                return e
+
+        if max_concurrency == 1 or len(batch) == 1:
+            return [send(request) for request in batch]
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(batch)),
+            thread_name_prefix="PyTado",
+        ) as executor:
+            return list(executor.map(send, batch))
+
+    def _send_request(
+        self, request: TadoRequest, url: str, deadline: float | None = None
+    ) -> dict[str, Any] | list[Any] | str:
+        url, status_code, body = self._fetch(request, url, deadline)
+
+        result = self._parse_response(url, status_code, body)
+        self._update_cache(str(request.action), url, result)
+
+        return result
+
+    def _send_raw_request(
+        self, request: TadoRequest, url: str, deadline: float | None = None
+    ) -> dict[str, Any] | bytes | str:
+        """Send a request and return the body of the response as received"""
+        url, status_code, body = self._fetch(request, url, deadline)
+
+        return self._check_response(url, status_code, body)
+
+    def _fetch(
+        self, request: TadoRequest, url: str, deadline: float | None = None
+    ) -> tuple[str, int, bytes]:
+        """Send a request and return the URL, status code and body of its response"""
+        headers, data = self._configure_payload(request)
+
+        http_request = requests.Request(
+            method=request.action, url=url, headers=headers, data=data
+        )
+        prepped = http_request.prepare()
+        prepped.hooks["response"].append(self._log_response)
+
+        # calls failing fast on an open circuit or a passed deadline do not go out,
+        # so they take no request of the quota
+        remaining = self._remaining(deadline, url)
+        self._circuit_breaker.before_request(request.endpoint)
+        try:
+            delay = self._rate_limiter.acquire(request.endpoint, remaining)
+            if delay is None:
+                raise TadoTimeoutException(
+                    f"Deadline exceeded for {url}, the request budget frees up too late"
+                )
+            if delay > 0:
+                time.sleep(delay)
+
+            timeout = self._timeout_of(request, deadline, url)
+        except BaseException:
+            self._circuit_breaker.record_result(request.endpoint, None)
+            raise
+        retries = 0
+
+        def allow_retry() -> bool:
+            nonlocal retries
+            if not self._circuit_breaker.allow_retry(request.endpoint):
+                return False
+            retries += 1
+            return True
+
+        succeeded = False
+        status_code: int | None = None
+        bytes_received = 0
+        error: BaseException | None = None
+        started = time.perf_counter()
+        deadline_token = _DEADLINE.set(deadline)
+        gate_token = _RETRY_GATE.set(allow_retry)
+        try:
+            try:
+                response = self._session.send(
+                    prepped, timeout=(timeout.connect, timeout.read)
+                )
+                status_code = response.status_code
+                bytes_received = len(response.content)
+                succeeded = status_code < 500
+            except TadoWrongCredentialsException as e:
+                _LOGGER.error("Credentials Exception: %s", e)
+                raise e
+            except requests.exceptions.Timeout as e:
+                _LOGGER.error("Request %s timed out: %s", url, e)
+                raise TadoTimeoutException(e) from e
+            except (
+                requests.exceptions.ConnectionError,
+                requests.exceptions.RetryError,
+            ) as e:
+                if not _is_timeout(e, deadline):
+                    raise
+                _LOGGER.error("Request %s timed out: %s", url, e)
+                raise TadoTimeoutException(e) from e
+            except MaxRetryError as e:
+                _LOGGER.error("Max retries exceeded: %s", e)
+                raise TadoException(e) from e
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            _RETRY_GATE.reset(gate_token)
+            _DEADLINE.reset(deadline_token)
+            self._circuit_breaker.record_result(request.endpoint, succeeded)
+            self._notify_request(
+                request,
+                started,
+                status_code=status_code,
+                retries=retries,
+                bytes_sent=len(data),
+                bytes_received=bytes_received,
+                error=error,
+            )
+
+        self._rate_limiter.record_response(
+            request.endpoint, response.status_code, response.headers
+        )
+
+        if self._verify_saved_home(request, response.status_code):
+            home_id = self._id
+            self._device_ready()
+            if self._id != home_id:
+                return self._fetch(request, self._configure_url(request), deadline)
+
+        return url, response.status_code, response.content
+
+    def _coalesce(
+        self,
+        url: str,
+        send: Callable[[], _T],
+        deadline: float | None = None,
+        key: str | None = None,
+    ) -> _T:
+        """Share one upstream call between threads requesting the same URL at once"""
+        key = key or url
+        with self._in_flight_lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if future is None:
+                future = self._in_flight[key] = Future()
+
+        if not leader:
+            try:
+                result: _T = future.result(timeout=self._remaining(deadline, url))
+            except TimeoutError as e:
+                raise TadoTimeoutException(f"Deadline exceeded for {url}") from e
+            return copy.deepcopy(result)
+
+        try:
+            result = send()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[key]
+
     def _refresh_token(
         self, refresh_token: str | None = None, force_refresh: bool = False
     ) -> bool:
         """
         Refresh the OAuth token if it is about to expire or if forced.
 
+        Concurrent callers wait for a single refresh instead of each sending their own.
+
         Args:
             refresh_token (str | None, optional): The refresh token to use for obtaining a new
                 access token.
@@ -436,25 +1212,27 @@ class Http:
                 and force_refresh is False.
         """
 
-        if self._refresh_at >= datetime.now(timezone.utc) and not force_refresh:
+        if not self._token_expired() and not force_refresh:
             return True
 
-        url = "https://login.tado.com/oauth2/token"
-        data = {
-            "client_id": CLIENT_ID_DEVICE,
-            "grant_type": "refresh_token",
-            "refresh_token": refresh_token or self._token_refresh,
-        }
-        self._session.close()
-        self._session = self._create_session()
+        with self._refresh_lock:
+            # another thread may have refreshed the token while we were waiting
+            if not self._token_expired() and not force_refresh:
+                return True
+
+            return self._request_token(refresh_token, force_refresh)
+
+    def _request_token(self, refresh_token: str | None, force_refresh: bool) -> bool:
+        url = _OAUTH_TOKEN_URL
+        data = self._refresh_token_params(refresh_token)
 
         try:
             response = self._session.request(
                 "post",
                 url,
                 params=data,
-                timeout=_DEFAULT_TIMEOUT,
-                data=json.dumps({}).encode("utf8"),
+                timeout=(self._timeout.connect, self._timeout.read),
+                data=self._codec.dumps({}),
                 headers={
                     "Content-Type": "application/json",
                     "Referer": "https://app.tado.com/",
@@ -478,50 +1256,26 @@ class Http:
                 f"Status code: {response.status_code}"
             )
 
-        self._set_oauth_header(response.json())
+        self._set_oauth_header(self._codec.loads(response.content))
 
         return True
 
-    def _save_token(self) -> None:
-        """Save the refresh token to a file."""
-        if not self._token_file_path or not self._token_refresh:
-            return
-
-        try:
-            token_dir = os.path.dirname(self._token_file_path)
-            if token_dir and not os.path.exists(token_dir):
-                Path(token_dir).mkdir(parents=True, exist_ok=True)
-
-            with open(self._token_file_path, "w", encoding="utf-8") as f:
-                json_dump(
-                    {"refresh_token": self._token_refresh},
-                    f,
-                )
-
-            _LOGGER.debug("Refresh token saved to %s", self._token_file_path)
-        except Exception as e:
-            _LOGGER.error("Failed to save refresh token: %s", e)
-            raise TadoException(e) from e
-
     def _login_device_flow(self) -> DeviceActivationStatus:
         """Start the login to the API using the device flow"""
 
         if self._device_activation_status != DeviceActivationStatus.NOT_STARTED:
             raise TadoException("The device has been started already")
 
-        url = "https://login.tado.com/oauth2/device_authorize"
-        data = {
-            "client_id": CLIENT_ID_DEVICE,
-            "scope": "offline_access",
-        }
+        url = _OAUTH_DEVICE_AUTHORIZE_URL
+        data = self._device_authorize_params()
 
         try:
             response = self._session.request(
                 method="post",
                 url=url,
                 params=data,
-                timeout=_DEFAULT_TIMEOUT,
-                data=json.dumps({}).encode("utf8"),
+                timeout=(self._timeout.connect, self._timeout.read),
+                data=self._codec.dumps({}),
                 headers={
                     "Content-Type": "application/json",
                     "Referer": "https://app.tado.com/",
@@ -535,33 +1289,12 @@ class Http:
                 f"Login failed. Status code: {response.status_code} and reason: {response.reason}"
             )
 
-        self._device_flow_data = response.json()
-        _LOGGER.debug("Device flow response: %s", self._device_flow_data)
-
-        user_code = urlencode({"user_code": self._device_flow_data["user_code"]})
-        visit_url = f"{self._device_flow_data['verification_uri']}?{user_code}"
-        self._user_code = self._device_flow_data["user_code"]
-        self._device_verification_url = visit_url
-
-        _LOGGER.info("Please visit the following URL: %s", visit_url)
-
-        expires_in_seconds = self._device_flow_data["expires_in"]
-        self._expires_at = datetime.now(timezone.utc) + timedelta(
-            seconds=expires_in_seconds
-        )
-
-        _LOGGER.info(
-            "Waiting for user to authorize the device. Expires at %s",
-            self._expires_at.strftime("%Y-%m-%d %H:%M:%S"),
-        )
+        self._start_device_flow(self._codec.loads(response.content))
 
         return DeviceActivationStatus.PENDING
 
     def _check_device_activation(self) -> bool:
-        if self._expires_at is not None and datetime.timestamp(
-            datetime.now(timezone.utc)
-        ) > datetime.timestamp(self._expires_at):
-            raise TadoException("User took too long to enter key")
+        self._check_device_flow_expired()
 
         # Await the desired interval, before polling the API again
         time.sleep(self._device_flow_data.get("interval", 0))
@@ -569,24 +1302,22 @@ class Http:
         try:
             token_response = self._session.request(
                 method="post",
-                url="https://login.tado.com/oauth2/token",
-                params={
-                    "client_id": CLIENT_ID_DEVICE,
-                    "device_code": self._device_flow_data["device_code"],
-                    "grant_type": "urn:ietf:params:oauth:grant-type:device_code",
-                },
+                url=_OAUTH_TOKEN_URL,
+                params=self._device_token_params(),
+                timeout=(self._timeout.connect, self._timeout.read),
             )
         except requests.exceptions.ConnectionError as e:
             raise TadoException(e) from e
 
         if token_response.status_code == 200:
-            self._set_oauth_header(token_response.json())
+            self._set_oauth_header(self._codec.loads(token_response.content))
             return True
 
         # The user has not yet authorized the device, let's continue
         if (
             token_response.status_code == 400
-            and token_response.json()["error"] == "authorization_pending"
+            and self._codec.loads(token_response.content)["error"]
+            == "authorization_pending"
         ):
             _LOGGER.info(
                 "Authorization pending, waiting for user to authorize. Continue polling."
@@ -609,36 +1340,13 @@ class Http:
 
     def _device_ready(self) -> None:
         """after device refresh code has been obtained"""
-        self._id = self._get_id()
-        self._x_api = self._check_x_line_generation()
-        self._user_code = None
-        self._device_verification_url = None
-        self._device_activation_status = DeviceActivationStatus.COMPLETED
+        home_id = self._get_id()
+        self._id = home_id
+        self._complete_device_flow(home_id, self._check_x_line_generation())
 
     def _get_id(self) -> int:
-        request = TadoRequest()
-        request.action = Action.GET
-        request.domain = Domain.ME
-
-        response = self.request(request)
-
-        if not isinstance(response, dict):
-            raise TadoException("Unexpected response type")
-
-        homes_ = response["homes"]
-
-        return int(homes_[0]["id"])
+        return self._parse_home_id(self.request(self._me_request()))
 
     def _check_x_line_generation(self) -> bool:
         # get home info
-        request = TadoRequest()
-        request.action = Action.GET
-        request.domain = Domain.HOME
-        request.command = ""
-
-        home_ = self.request(request)
-
-        if not isinstance(home_, dict):
-            raise TadoException("Unexpected response type")
-
-        return "generation" in home_ and home_["generation"] == "LINE_X"
+        return self._parse_x_line_generation(self.request(self._home_request()))
@@ -4,9 +4,10 @@ Base class for Tado API classes.
 
 import logging
 from abc import ABCMeta, abstractmethod
+from collections.abc import Callable, Iterable
 from datetime import date, timedelta
 from functools import cached_property
-from typing import Any, Self, overload
+from typing import Any, Self, TypeVar, overload
 
 import requests
 
@@ -24,11 +25,15 @@ from PyTado.models import Climate, Historic, line_x, pre_line_x
 from PyTado.models.home import (
     AirComfort,
     EIQMeterReading,
+    EIQMeterReadings,
     EIQTariff,
+    EIQTariffs,
     HomeState,
     MobileDevice,
+    MobileDevices,
     RunningTimes,
     User,
+    Users,
     Weather,
 )
 from PyTado.models.line_x import Device as DeviceX
@@ -52,10 +57,13 @@ from PyTado.types import (
     ZoneType,
 )
 from PyTado.zone.hops_zone import TadoRoom
+from PyTado.zone.metadata import ZoneIdentityMap, ZoneMetadataCache
 from PyTado.zone.my_zone import TadoZone
 
 _LOGGER = Logger(__name__)
 
+_T = TypeVar("_T")
+
 
 class TadoBase(metaclass=ABCMeta):
     """Base class for Tado API classes.
@@ -158,7 +166,7 @@ class TadoBase(metaclass=ABCMeta):
         request.action = Action.GET
         request.domain = Domain.ME
 
-        return User.model_validate(self._http.request(request))
+        return self._http.request_model(request, User)
 
     @abstractmethod
     def get_devices(self) -> list[Device] | list[DeviceX]:
@@ -172,6 +180,10 @@ class TadoBase(metaclass=ABCMeta):
     def get_zone_states(self) -> dict[str, ZoneState] | dict[str, RoomState]:
         """Gets current state of Zone as a TadoZone object."""
 
+    @abstractmethod
+    def get_zone_snapshot(self) -> list[TadoZone] | list[TadoRoom]:
+        """Gets all zones with their state loaded in bulk, not with a request per zone."""
+
     def get_home_state(self) -> HomeState:
         """
         Gets current state of Home.
@@ -195,7 +207,7 @@ class TadoBase(metaclass=ABCMeta):
 
         request = TadoRequest()
         request.command = "state"
-        data = HomeState.model_validate(self._http.request(request))
+        data = self._http.request_model(request, HomeState)
         return data
 
     @cached_property
@@ -241,7 +253,10 @@ class TadoBase(metaclass=ABCMeta):
         request.action = Action.CHANGE
         request.payload = {"homePresence": presence}
 
-        return SuccessResult.model_validate(self._http.request(request))
+        result = SuccessResult.model_validate(self._http.request(request))
+        # the presence is part of the state of every zone
+        self._zone_map.invalidate()
+        return result
 
     def set_auto(self) -> None:
         """
@@ -254,7 +269,9 @@ class TadoBase(metaclass=ABCMeta):
             request.command = "presenceLock"
             request.action = Action.RESET
 
-            return self._http.request(request)
+            result = self._http.request(request)
+            self._zone_map.invalidate()
+            return result
         else:
             raise TadoNotSupportedException("Auto mode is not known to be supported.")
 
@@ -266,7 +283,7 @@ class TadoBase(metaclass=ABCMeta):
         request = TadoRequest()
         request.command = "weather"
 
-        return Weather.model_validate(self._http.request(request))
+        return self._http.request_model(request, Weather)
 
     @abstractmethod
     def get_air_comfort(self) -> AirComfort:
@@ -280,7 +297,7 @@ class TadoBase(metaclass=ABCMeta):
         request = TadoRequest()
         request.command = "users"
 
-        return [User.model_validate(user) for user in self._http.request(request)]
+        return self._http.request_model(request, Users)
 
     def get_mobile_devices(self) -> list[MobileDevice]:
         """
@@ -290,10 +307,7 @@ class TadoBase(metaclass=ABCMeta):
         request = TadoRequest()
         request.command = "mobileDevices"
 
-        return [
-            MobileDevice.model_validate(device)
-            for device in self._http.request(request)
-        ]
+        return self._http.request_model(request, MobileDevices)
 
     def get_running_times(self, from_date: date = date.today()) -> RunningTimes:
         """
@@ -306,13 +320,36 @@ class TadoBase(metaclass=ABCMeta):
         request.endpoint = Endpoint.MINDER
         request.params = {"from": from_date.strftime("%Y-%m-%d")}
 
-        return RunningTimes.model_validate(self._http.request(request))
+        return self._http.request_model(request, RunningTimes)
 
     # ------------- Zone methods -------------
 
     @abstractmethod
     def get_zone(self, zone: int) -> TadoZone | TadoRoom:
-        """Gets the specified zone as a TadoZone or TadoRoom object."""
+        """Gets the specified zone as a TadoZone or TadoRoom object.
+
+        Every call for a zone returns the same object, see invalidate_zones()."""
+
+    @cached_property
+    @abstractmethod
+    def _zone_metadata(self) -> ZoneMetadataCache[Any]:
+        """Metadata of the zones, shared by the zone objects"""
+
+    @cached_property
+    @abstractmethod
+    def _zone_map(self) -> ZoneIdentityMap[Any]:
+        """Zone objects handed out by get_zone()"""
+
+    def invalidate_zones(self, zones: Iterable[int] | None = None) -> None:
+        """
+        Drops the state cached by the zone objects, of all zones by default, so that it
+        is fetched again when read. Without zones, the zone metadata (names, types and
+        devices) is fetched again as well.
+        """
+
+        self._zone_map.invalidate(zones)
+        if zones is None:
+            self._zone_metadata.invalidate()
 
     @abstractmethod
     def get_zone_state(self, zone: int) -> ZoneState | RoomState:
@@ -326,6 +363,32 @@ class TadoBase(metaclass=ABCMeta):
         """Gets capabilities of the specified zone."""
         return self.get_zone(zone).get_capabilities()
 
+    @abstractmethod
+    def get_all_capabilities(
+        self, zones: Iterable[int] | None = None
+    ) -> dict[int, Capabilities]:
+        """Gets the capabilities of several zones at once, of all zones by default."""
+
+    def _zone_ids(self, zones: Iterable[int] | None) -> list[int]:
+        if zones is None:
+            return [zone.id for zone in self.get_zones()]
+        return list(zones)
+
+    def _request_many(
+        self,
+        requests: Iterable[TadoRequest],
+        validate: Callable[[Any], _T],
+    ) -> list[_T]:
+        """Send the requests in parallel, raises the first error after all are done"""
+
+        results = self._http.request_many(requests)
+
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+
+        return [validate(result) for result in results]
+
     def get_climate(self, zone: int) -> Climate:
         """Gets the climate for the specified zone."""
         return self.get_zone(zone).get_climate()
@@ -478,7 +541,7 @@ class TadoBase(metaclass=ABCMeta):
         request.domain = Domain.DEVICES
         request.device = device_id
 
-        return Device.model_validate(self._http.request(request))
+        return self._http.request_model(request, Device)
 
     @abstractmethod
     def set_temp_offset(
@@ -498,9 +561,7 @@ class TadoBase(metaclass=ABCMeta):
         request.action = Action.GET
         request.endpoint = Endpoint.EIQ
 
-        return [
-            EIQTariff.model_validate(tariff) for tariff in self._http.request(request)
-        ]
+        return self._http.request_model(request, EIQTariffs)
 
     def get_eiq_meter_readings(self) -> list[EIQMeterReading]:
         """
@@ -517,10 +578,7 @@ class TadoBase(metaclass=ABCMeta):
         if not isinstance(respones, dict):
             raise TadoException("Invalid response from Tado")
 
-        return [
-            EIQMeterReading.model_validate(reading)
-            for reading in respones.get("readings", [])
-        ]
+        return EIQMeterReadings.validate_python(respones.get("readings", []))
 
     def set_eiq_meter_readings(
         self, reading_date: date = date.today(), reading: int = 0
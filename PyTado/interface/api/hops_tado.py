@@ -2,23 +2,28 @@
 PyTado interface implementation for hops.tado.com (Tado X).
 """
 
+from collections.abc import Iterable
+from functools import cached_property
 from typing import Any, final
 
 import requests
 
+from PyTado.const import ZONE_METADATA_TTL, ZONE_STATE_MAX_AGE
 from PyTado.exceptions import TadoNotSupportedException
 from PyTado.http import Action, Domain, Endpoint, TadoXRequest
 from PyTado.interface.api.base_tado import TadoBase
 from PyTado.logger import Logger
 from PyTado.models.home import AirComfort
-from PyTado.models.line_x.device import Device, DevicesResponse
+from PyTado.models.line_x.device import Device, DevicesResponse, DevicesRooms
 from PyTado.models.line_x.installation import Installation
-from PyTado.models.line_x.room import RoomState
+from PyTado.models.line_x.room import RoomState, RoomStates
+from PyTado.models.pre_line_x import Capabilities
 from PyTado.models.pre_line_x.flow_temperature_optimization import (
     FlowTemperatureOptimization,
 )
 from PyTado.models.return_models import SuccessResult
 from PyTado.zone.hops_zone import TadoRoom
+from PyTado.zone.metadata import ZoneIdentityMap, ZoneMetadataCache
 
 _LOGGER = Logger(__name__)
 
@@ -49,15 +54,34 @@ class TadoX(TadoBase):
 
     # ------------------- Home methods -------------------
 
+    @cached_property
+    def _zone_metadata(self) -> ZoneMetadataCache[DevicesRooms]:
+        return ZoneMetadataCache(
+            lambda: self._rooms_by_id(self._fetch_rooms_and_devices()),
+            ZONE_METADATA_TTL,
+        )
+
+    @cached_property
+    def _zone_map(self) -> ZoneIdentityMap[TadoRoom]:
+        return ZoneIdentityMap(lambda zone: TadoRoom(self, zone), ZONE_STATE_MAX_AGE)
+
+    def _fetch_rooms_and_devices(self) -> DevicesResponse:
+        request = TadoXRequest()
+        request.command = "roomsAndDevices"
+
+        return self._http.request_model(request, DevicesResponse)
+
+    @staticmethod
+    def _rooms_by_id(rooms_and_devices: DevicesResponse) -> dict[int, DevicesRooms]:
+        return {room.room_id: room for room in rooms_and_devices.rooms}
+
     def get_devices(self) -> list[Device]:
         """
         Gets device information.
         """
 
-        request = TadoXRequest()
-        request.command = "roomsAndDevices"
-
-        rooms_and_devices = DevicesResponse.model_validate(self._http.request(request))
+        rooms_and_devices = self._fetch_rooms_and_devices()
+        self._zone_metadata.put(self._rooms_by_id(rooms_and_devices))
 
         devices = [
             device for room in rooms_and_devices.rooms for device in room.devices
@@ -71,23 +95,42 @@ class TadoX(TadoBase):
         Gets zones (or rooms in Tado X API) information.
         """
 
-        request = TadoXRequest()
-        request.command = "roomsAndDevices"
-        rooms_and_devices = DevicesResponse.model_validate(self._http.request(request))
+        rooms = self._rooms_by_id(self._fetch_rooms_and_devices())
+        self._zone_metadata.put(rooms)
 
-        return [TadoRoom(self, room.room_id) for room in rooms_and_devices.rooms]
+        return [self.get_zone(room_id) for room_id in rooms]
 
     def get_zone_states(self) -> dict[str, RoomState]:
         """
         Gets current states of all zones/rooms.
         """
 
+        return {room.name: room for room in self._fetch_room_states()}
+
+    def _fetch_room_states(self) -> list[RoomState]:
         request = TadoXRequest()
         request.command = "rooms"
 
-        rooms = [RoomState.model_validate(room) for room in self._http.request(request)]
+        return self._http.request_model(request, RoomStates)
 
-        return {room.name: room for room in rooms}
+    def get_zone_snapshot(self) -> list[TadoRoom]:
+        """
+        Gets all rooms with their current state, loaded with the single rooms request
+        and one request of the home state, which all rooms share. Reading the state of
+        the rooms sends no further request, until the update() of a room.
+        """
+
+        states = self._fetch_room_states()
+        home_state = self.get_home_state()
+
+        rooms = []
+        for state in states:
+            room = self.get_zone(state.id)
+            room._load_state(state)
+            room._home_state = home_state
+            rooms.append(room)
+
+        return rooms
 
     def get_zone_state(self, zone: int) -> RoomState:
         """
@@ -100,7 +143,7 @@ class TadoX(TadoBase):
         request = TadoXRequest()
         request.command = "airComfort"
 
-        return AirComfort.model_validate(self._http.request(request))
+        return self._http.request_model(request, AirComfort)
 
     # ------------------- Zone methods -------------------
 
@@ -108,7 +151,21 @@ class TadoX(TadoBase):
         """
         Gets zone/room.
         """
-        return TadoRoom(self, zone)
+        return self._zone_map.get(zone)
+
+    def get_all_capabilities(
+        self, zones: Iterable[int] | None = None
+    ) -> dict[int, Capabilities]:
+        """
+        Gets the capabilities of several rooms at once, of all rooms by default.
+
+        Tado X does not provide capabilities, no requests are sent for them.
+        """
+
+        return {
+            zone: self.get_zone(zone).get_capabilities()
+            for zone in self._zone_ids(zones)
+        }
 
     def get_state(self, zone: int) -> RoomState:
         """
@@ -117,16 +174,14 @@ class TadoX(TadoBase):
 
         request = TadoXRequest()
         request.command = f"rooms/{zone:d}"
-        data = self._http.request(request)
-
-        return RoomState.model_validate(data)
+        return self._http.request_model(request, RoomState)
 
     def get_open_window_detected(self, zone: int) -> dict[str, bool]:
         """
         Returns whether an open window is detected.
         """
 
-        return {"openWindowDetected": TadoRoom(self, zone).open_window}
+        return {"openWindowDetected": self.get_zone(zone).open_window}
 
     def set_open_window(self, zone: int) -> SuccessResult:
         """
@@ -137,7 +192,9 @@ class TadoX(TadoBase):
         request.command = f"rooms/{zone}/openWindow"
         request.action = Action.SET
 
-        return SuccessResult.model_validate(self._http.request(request))
+        result = SuccessResult.model_validate(self._http.request(request))
+        self._zone_map.invalidate([zone])
+        return result
 
     def reset_open_window(self, zone: int) -> SuccessResult:
         """
@@ -147,7 +204,9 @@ class TadoX(TadoBase):
         request.command = f"rooms/{zone}/openWindow"
         request.action = Action.RESET
 
-        return SuccessResult.model_validate(self._http.request(request))
+        result = SuccessResult.model_validate(self._http.request(request))
+        self._zone_map.invalidate([zone])
+        return result
 
     # ------------------- Device methods -------------------
 
@@ -158,7 +217,7 @@ class TadoX(TadoBase):
 
         request = TadoXRequest()
         request.command = f"devices/{device_id}"
-        return Device.model_validate(self._http.request(request))
+        return self._http.request_model(request, Device)
 
     def set_temp_offset(
         self, device_id: str, offset: float = 0, measure: str = ""
@@ -213,7 +272,7 @@ class TadoX(TadoBase):
         request.domain = Domain.HOME
         request.command = "settings/flowTemperatureOptimization"
 
-        return FlowTemperatureOptimization.model_validate(self._http.request(request))
+        return self._http.request_model(request, FlowTemperatureOptimization)
 
     def boost_all_heating(self) -> SuccessResult:
         """
@@ -400,6 +459,7 @@ class TadoX(TadoBase):
         request.payload = data1
 
         result = self._http.request(request)
+        self._zone_map.invalidate([room_id])
 
         if isinstance(result, str) and result.isdigit():
             return int(result)
@@ -415,4 +475,4 @@ class TadoX(TadoBase):
         request.action = Action.GET
         request.domain = Domain.HOME
 
-        return Installation.model_validate(self._http.request(request))
+        return self._http.request_model(request, Installation)
@@ -2,25 +2,48 @@
 PyTado interface implementation for app.tado.com.
 """
 
+from collections.abc import Iterable, Iterator
+from datetime import timedelta
+from functools import cached_property
+from itertools import islice
 from typing import Any, final
 
+from PyTado.const import (
+    ZONE_METADATA_TTL,
+    ZONE_OVERLAYS_PER_REQUEST,
+    ZONE_STATE_MAX_AGE,
+)
 from PyTado.exceptions import TadoException
 from PyTado.http import Action, Domain, Mode, TadoRequest
 from PyTado.interface.api.base_tado import TadoBase, Timetable
 from PyTado.models import pre_line_x
 from PyTado.models.home import AirComfort
 from PyTado.models.pre_line_x.boiler import MaxOutputTemp, WiringInstallationState
-from PyTado.models.pre_line_x.device import Device
+from PyTado.models.pre_line_x.device import Device, Devices
 from PyTado.models.pre_line_x.flow_temperature_optimization import (
     FlowTemperatureOptimization,
 )
-from PyTado.models.pre_line_x.home import HeatingCircuit
+from PyTado.models.pre_line_x.home import HeatingCircuit, HeatingCircuits
 from PyTado.models.pre_line_x.zone import (
+    Capabilities,
     ZoneControl,
     ZoneOverlayDefault,
+    Zones,
     ZoneState,
+    ZoneStatesResponse,
 )
 from PyTado.models.return_models import SuccessResult, TemperatureOffset
+from PyTado.types import (
+    FanLevel,
+    FanSpeed,
+    HorizontalSwing,
+    HvacMode,
+    OverlayMode,
+    Power,
+    VerticalSwing,
+    ZoneType,
+)
+from PyTado.zone.metadata import ZoneIdentityMap, ZoneMetadataCache
 from PyTado.zone.my_zone import TadoZone
 
 
@@ -54,20 +77,32 @@ class Tado(TadoBase):
 
         request = TadoRequest()
         request.command = "devices"
-        return [Device.model_validate(device) for device in self._http.request(request)]
+        return self._http.request_model(request, Devices)
+
+    @cached_property
+    def _zone_metadata(self) -> ZoneMetadataCache[pre_line_x.Zone]:
+        return ZoneMetadataCache(self._fetch_zones, ZONE_METADATA_TTL)
+
+    @cached_property
+    def _zone_map(self) -> ZoneIdentityMap[TadoZone]:
+        return ZoneIdentityMap(lambda zone: TadoZone(self, zone), ZONE_STATE_MAX_AGE)
+
+    def _fetch_zones(self) -> dict[int, pre_line_x.Zone]:
+        request = TadoRequest()
+        request.command = "zones"
+
+        zones = self._http.request_model(request, Zones)
+        return {zone.id: zone for zone in zones}
 
     def get_zones(self) -> list[TadoZone]:
         """
         Gets zones information.
         """
 
-        request = TadoRequest()
-        request.command = "zones"
+        zones = self._fetch_zones()
+        self._zone_metadata.put(zones)
 
-        return [
-            TadoZone(self, pre_line_x.Zone.model_validate(zone).id)
-            for zone in self._http.request(request)
-        ]
+        return [self.get_zone(zone_id) for zone_id in zones]
 
     def get_zone_states(self) -> dict[str, ZoneState]:
         """
@@ -77,21 +112,28 @@ class Tado(TadoBase):
         request = TadoRequest()
         request.command = "zoneStates"
 
-        response = self._http.request(request)
+        return self._http.request_model(request, ZoneStatesResponse).zone_states
 
-        if not isinstance(response, dict):
-            raise TadoException("Invalid response from Tado API")
+    def get_zone_snapshot(self) -> list[TadoZone]:
+        """
+        Gets all zones with their current state, loaded with the single zoneStates
+        request. Reading the state of the zones sends no further request, until the
+        update() of a zone.
+        """
 
-        return {
-            key: ZoneState.model_validate(value)
-            for key, value in response["zoneStates"].items()
-        }
+        zones = []
+        for zone_id, state in self.get_zone_states().items():
+            zone = self.get_zone(int(zone_id))
+            zone._load_state(state)
+            zones.append(zone)
+
+        return zones
 
     def get_air_comfort(self) -> AirComfort:
         request = TadoRequest()
         request.command = "airComfort"
 
-        return AirComfort.model_validate(self._http.request(request))
+        return self._http.request_model(request, AirComfort)
 
     def get_heating_circuits(self) -> list[HeatingCircuit]:
         """
@@ -101,12 +143,12 @@ class Tado(TadoBase):
         request = TadoRequest()
         request.command = "heatingCircuits"
 
-        return [HeatingCircuit.model_validate(d) for d in self._http.request(request)]
+        return self._http.request_model(request, HeatingCircuits)
 
     # ----------------- Zone methods -----------------
 
     def get_zone(self, zone: int) -> TadoZone:
-        return TadoZone(self, zone)
+        return self._zone_map.get(zone)
 
     def get_zone_state(self, zone: int) -> ZoneState:
         """
@@ -123,7 +165,25 @@ class Tado(TadoBase):
         request = TadoRequest()
         request.command = f"zones/{zone}/state"
 
-        return ZoneState.model_validate(self._http.request(request))
+        return self._http.request_model(request, ZoneState)
+
+    def get_all_capabilities(
+        self, zones: Iterable[int] | None = None
+    ) -> dict[int, Capabilities]:
+        """
+        Gets the capabilities of several zones at once, of all zones by default.
+        """
+
+        zone_ids = self._zone_ids(zones)
+        requests = []
+        for zone in zone_ids:
+            request = TadoRequest()
+            request.command = f"zones/{zone:d}/capabilities"
+            requests.append(request)
+
+        return dict(
+            zip(zone_ids, self._request_many(requests, Capabilities.model_validate))
+        )
 
     def get_timetable(self, zone: int) -> Timetable:
         """
@@ -172,7 +232,105 @@ class Tado(TadoBase):
         request = TadoRequest()
         request.command = f"zones/{zone:d}/defaultOverlay"
 
-        return ZoneOverlayDefault.model_validate(self._http.request(request))
+        return self._http.request_model(request, ZoneOverlayDefault)
+
+    def get_zone_overlay_defaults(
+        self, zones: Iterable[int] | None = None
+    ) -> dict[int, ZoneOverlayDefault]:
+        """
+        Get the overlay default settings of several zones at once, of all zones by default.
+        """
+
+        zone_ids = self._zone_ids(zones)
+        requests = []
+        for zone in zone_ids:
+            request = TadoRequest()
+            request.command = f"zones/{zone:d}/defaultOverlay"
+            requests.append(request)
+
+        return dict(
+            zip(
+                zone_ids,
+                self._request_many(requests, ZoneOverlayDefault.model_validate),
+            )
+        )
+
+    def set_zone_overlays(
+        self,
+        zones: Iterable[int],
+        overlay_mode: OverlayMode,
+        set_temp: float | None = None,
+        duration: timedelta | None = None,
+        power: Power = Power.ON,
+        device_type: ZoneType | None = None,
+        mode: HvacMode | None = None,
+        fan_speed: FanSpeed | None = None,
+        swing: Any = None,
+        fan_level: FanLevel | None = None,
+        vertical_swing: VerticalSwing | None = None,
+        horizontal_swing: HorizontalSwing | None = None,
+    ) -> None:
+        """
+        Sets the same overlay on several zones with the overlay request of the home,
+        which takes the overlays of up to ZONE_OVERLAYS_PER_REQUEST zones at once.
+        Without device_type, the type of each zone is taken from the zone metadata.
+        """
+
+        payloads = {
+            zone: TadoZone._build_overlay_payload(
+                zone_type=device_type or self.get_zone(zone)._raw_room.type,
+                overlay_mode=overlay_mode,
+                set_temp=set_temp,
+                duration=duration,
+                power=power,
+                mode=mode,
+                fan_speed=fan_speed,
+                swing=swing,
+                fan_level=fan_level,
+                vertical_swing=vertical_swing,
+                horizontal_swing=horizontal_swing,
+            )
+            for zone in zones
+        }
+
+        for chunk in self._overlay_chunks(payloads):
+            request = TadoRequest()
+            request.command = "overlay"
+            request.action = Action.SET
+            request.payload = {
+                "overlays": [
+                    {"room": zone, "overlay": payloads[zone]} for zone in chunk
+                ]
+            }
+            self._http.request(request)
+
+            for zone in chunk:
+                self.get_zone(zone)._apply_overlay(
+                    None, payloads[zone], overlay_mode, duration
+                )
+
+    def reset_zone_overlays(self, zones: Iterable[int]) -> None:
+        """
+        Deletes the overlays of several zones (Resume Schedule) with the overlay request
+        of the home, which takes up to ZONE_OVERLAYS_PER_REQUEST zones at once.
+        """
+
+        for chunk in self._overlay_chunks(dict.fromkeys(zones)):
+            request = TadoRequest()
+            request.command = "overlay"
+            request.action = Action.RESET
+            request.mode = Mode.PLAIN
+            request.params = {"rooms": ",".join(str(zone) for zone in chunk)}
+            self._http.request(request)
+
+            for zone in chunk:
+                self.get_zone(zone)._apply_overlay_reset()
+
+    @staticmethod
+    def _overlay_chunks(zones: Iterable[int]) -> Iterator[list[int]]:
+        remaining = iter(zones)
+        while chunk := list(islice(remaining, ZONE_OVERLAYS_PER_REQUEST)):
+            yield chunk
 
     def get_open_window_detected(self, zone: int) -> dict[str, bool]:
         """
@@ -200,7 +358,9 @@ class Tado(TadoBase):
         request.action = Action.SET
         request.mode = Mode.PLAIN
 
-        return SuccessResult.model_validate(self._http.request(request))
+        result = SuccessResult.model_validate(self._http.request(request))
+        self._zone_map.invalidate([zone])
+        return result
 
     def reset_open_window(self, zone: int) -> SuccessResult:
         """
@@ -212,7 +372,9 @@ class Tado(TadoBase):
         request.action = Action.RESET
         request.mode = Mode.PLAIN
 
-        return SuccessResult.model_validate(self._http.request(request))
+        result = SuccessResult.model_validate(self._http.request(request))
+        self._zone_map.invalidate([zone])
+        return result
 
     def get_zone_control(self, zone: int) -> ZoneControl:
         """
@@ -222,7 +384,7 @@ class Tado(TadoBase):
         request = TadoRequest()
         request.command = f"zones/{zone:d}/control"
 
-        return ZoneControl.model_validate(self._http.request(request))
+        return self._http.request_model(request, ZoneControl)
 
     def set_zone_heating_circuit(self, zone: int, heating_circuit: int) -> ZoneControl:
         """
@@ -262,7 +424,7 @@ class Tado(TadoBase):
         request.domain = Domain.DEVICES
         request.device = device_id
 
-        return TemperatureOffset.model_validate(self._http.request(request))
+        return self._http.request_model(request, TemperatureOffset)
 
     def set_temp_offset(
         self, device_id: str, offset: float = 0, measure: str = "celsius"
@@ -296,7 +458,7 @@ class Tado(TadoBase):
         request.command = "boilerWiringInstallationState"
         request.params = {"authKey": auth_key}
 
-        return WiringInstallationState.model_validate(self._http.request(request))
+        return self._http.request_model(request, WiringInstallationState)
 
     def get_boiler_max_output_temperature(
         self, bridge_id: str, auth_key: str
@@ -312,7 +474,7 @@ class Tado(TadoBase):
         request.command = "boilerMaxOutputTemperature"
         request.params = {"authKey": auth_key}
 
-        return MaxOutputTemp.model_validate(self._http.request(request))
+        return self._http.request_model(request, MaxOutputTemp)
 
     def set_boiler_max_output_temperature(
         self, bridge_id: str, auth_key: str, temperature_in_celcius: float
@@ -360,4 +522,4 @@ class Tado(TadoBase):
         request.domain = Domain.HOME
         request.command = "flowTemperatureOptimization"
 
-        return FlowTemperatureOptimization.model_validate(self._http.request(request))
+        return self._http.request_model(request, FlowTemperatureOptimization)
@@ -0,0 +1,392 @@
+"""
+Request and model validation metrics, with optional Prometheus and OpenTelemetry adapters
+"""
+
+import contextvars
+import math
+import re
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from PyTado.logger import Logger
+
+_LOGGER = Logger(__name__)
+
+# upper bounds in seconds of the duration histogram buckets
+DURATION_BUCKETS: tuple[float, ...] = (
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    math.inf,
+)
+
+_ID_SEGMENT = re.compile(r"^(\d+|[0-9A-Fa-f-]{32,36}|[A-Z]{2}\d{6,})$")
+
+
+def command_template(command: str) -> str:
+    """
+    Return the command of a request with its ids replaced by {id} and without query.
+
+    e.g. "zones/1/dayReport?date=2024-01-01" -> "zones/{id}/dayReport"
+    """
+
+    path = command.split("?", 1)[0]
+    return "/".join(
+        "{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/")
+    )
+
+
+@dataclass(frozen=True)
+class RequestMetrics:
+    """Metrics of one API call
+
+    endpoint: Endpoint URL
+    command: command template, e.g. "zones/{id}/state"
+    method: HTTP method
+    status_code: status code of the final response, None if no response was received
+    duration: seconds from sending the first attempt to receiving the final response
+    retries: attempts after the first one
+    bytes_sent: size of the request body
+    bytes_received: size of the response body
+    error: name of the exception raised by the transport, if any
+    """
+
+    endpoint: str
+    command: str
+    method: str
+    status_code: int | None
+    duration: float
+    retries: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class ValidationMetrics:
+    """Metrics of the validation of an API response into a model
+
+    model: name of the model class
+    duration: seconds spent validating
+    endpoint, command: the last API call of the thread or task, which usually
+        returned the validated data
+    """
+
+    model: str
+    duration: float
+    endpoint: str
+    command: str
+
+
+class Observer:
+    """Receives the metrics of an Http client, override the methods you need
+
+    Observers are called synchronously on the thread (or event loop) of the request,
+    they should return quickly. Exceptions raised by an observer are logged and ignored.
+
+    Example usage: http = Http(observers=[PrometheusObserver()])
+    """
+
+    def on_request(self, metrics: RequestMetrics) -> None:
+        """Called after every API call sent, whether it succeeded or not"""
+
+    def on_validation(self, metrics: ValidationMetrics) -> None:
+        """Called after an API response was validated into a model"""
+
+
+def notify(observers: Iterable[Observer], event: str, metrics: Any) -> None:
+    """Call the event method of every observer, an observer can not break the request"""
+    for observer in observers:
+        try:
+            getattr(observer, event)(metrics)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Observer %r failed on %s", observer, event)
+
+
+@dataclass(frozen=True)
+class _ValidationTarget:
+    observers: tuple[Observer, ...]
+    endpoint: str
+    command: str
+
+
+# the last API call of the thread or task, set by the Http clients with observers
+_VALIDATION_TARGET: contextvars.ContextVar[_ValidationTarget | None] = (
+    contextvars.ContextVar("_VALIDATION_TARGET", default=None)
+)
+_IN_VALIDATION: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "_IN_VALIDATION", default=False
+)
+
+
+def set_validation_target(
+    observers: tuple[Observer, ...], endpoint: str, command: str
+) -> None:
+    """Attribute the following model validations to an API call"""
+    _VALIDATION_TARGET.set(_ValidationTarget(observers, endpoint, command))
+
+
+def validation_timer() -> Callable[[str], None] | None:
+    """
+    Start timing a model validation, None if it is not observed or nested in another one.
+
+    Call the returned function with the name of the model when the validation is done.
+    """
+
+    target = _VALIDATION_TARGET.get()
+    if target is None or _IN_VALIDATION.get():
+        return None
+
+    token = _IN_VALIDATION.set(True)
+    start = time.perf_counter()
+
+    def stop(model: str) -> None:
+        duration = time.perf_counter() - start
+        _IN_VALIDATION.reset(token)
+        notify(
+            target.observers,
+            "on_validation",
+            ValidationMetrics(
+                model=model,
+                duration=duration,
+                endpoint=target.endpoint,
+                command=target.command,
+            ),
+        )
+
+    return stop
+
+
+@dataclass
+class EndpointMetrics:
+    """Aggregated metrics of the calls of an endpoint and command template
+
+    duration_buckets: number of calls per upper bound of DURATION_BUCKETS
+    """
+
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    duration_total: float = 0.0
+    duration_max: float = 0.0
+    duration_buckets: list[int] = field(
+        default_factory=lambda: [0] * len(DURATION_BUCKETS)
+    )
+    status_codes: dict[int, int] = field(default_factory=dict)
+    validations: int = 0
+    validation_total: float = 0.0
+
+
+class MetricsRecorder(Observer):
+    """Observer keeping aggregated metrics in memory, per endpoint and command template
+
+    Example usage: recorder = MetricsRecorder()
+                   http = Http(observers=[recorder])
+                   recorder.snapshot()[(Endpoint.MY_API, "zones/{id}/state")].duration_max
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._metrics: dict[tuple[str, str], EndpointMetrics] = {}
+
+    def _of(self, endpoint: str, command: str) -> EndpointMetrics:
+        return self._metrics.setdefault((endpoint, command), EndpointMetrics())
+
+    def on_request(self, metrics: RequestMetrics) -> None:
+        with self._lock:
+            recorded = self._of(metrics.endpoint, metrics.command)
+            recorded.requests += 1
+            recorded.retries += metrics.retries
+            recorded.bytes_sent += metrics.bytes_sent
+            recorded.bytes_received += metrics.bytes_received
+            recorded.duration_total += metrics.duration
+            recorded.duration_max = max(recorded.duration_max, metrics.duration)
+            recorded.duration_buckets[
+                next(
+                    index
+                    for index, bound in enumerate(DURATION_BUCKETS)
+                    if metrics.duration <= bound
+                )
+            ] += 1
+
+            if metrics.status_code is not None:
+                recorded.status_codes[metrics.status_code] = (
+                    recorded.status_codes.get(metrics.status_code, 0) + 1
+                )
+            if metrics.error is not None or (metrics.status_code or 0) >= 400:
+                recorded.errors += 1
+
+    def on_validation(self, metrics: ValidationMetrics) -> None:
+        with self._lock:
+            recorded = self._of(metrics.endpoint, metrics.command)
+            recorded.validations += 1
+            recorded.validation_total += metrics.duration
+
+    def snapshot(self) -> dict[tuple[str, str], EndpointMetrics]:
+        """Return a copy of the metrics, keyed by endpoint and command template"""
+        with self._lock:
+            return {
+                key: EndpointMetrics(
+                    **{
+                        **vars(value),
+                        "duration_buckets": list(value.duration_buckets),
+                        "status_codes": dict(value.status_codes),
+                    }
+                )
+                for key, value in self._metrics.items()
+            }
+
+    def reset(self) -> None:
+        """Drop all recorded metrics"""
+        with self._lock:
+            self._metrics.clear()
+
+
+class PrometheusObserver(Observer):
+    """Observer exporting the metrics with prometheus_client, which has to be installed
+
+    Example usage: http = Http(observers=[PrometheusObserver()])
+                   prometheus_client.start_http_server(8000)
+    """
+
+    def __init__(self, registry: Any = None, namespace: str = "pytado") -> None:
+        try:
+            import prometheus_client
+        except ImportError as e:
+            raise ImportError(
+                "PrometheusObserver requires prometheus_client, "
+                "install it with 'pip install prometheus-client'"
+            ) from e
+
+        kwargs = {} if registry is None else {"registry": registry}
+        labels = ["endpoint", "command", "method"]
+
+        self._duration = prometheus_client.Histogram(
+            f"{namespace}_request_duration_seconds",
+            "Duration of the API calls, including retries",
+            labels,
+            buckets=DURATION_BUCKETS,
+            **kwargs,
+        )
+        self._requests = prometheus_client.Counter(
+            f"{namespace}_requests",
+            "API calls by status code, 0 if no response was received",
+            [*labels, "status_code"],
+            **kwargs,
+        )
+        self._retries = prometheus_client.Counter(
+            f"{namespace}_request_retries", "Retries of the API calls", labels, **kwargs
+        )
+        self._bytes_sent = prometheus_client.Counter(
+            f"{namespace}_request_sent_bytes", "Request body bytes", labels, **kwargs
+        )
+        self._bytes_received = prometheus_client.Counter(
+            f"{namespace}_response_received_bytes",
+            "Response body bytes",
+            labels,
+            **kwargs,
+        )
+        self._validation = prometheus_client.Histogram(
+            f"{namespace}_model_validation_seconds",
+            "Duration of the validation of API responses into models",
+            ["endpoint", "command", "model"],
+            buckets=DURATION_BUCKETS,
+            **kwargs,
+        )
+
+    def on_request(self, metrics: RequestMetrics) -> None:
+        labels = (metrics.endpoint, metrics.command, metrics.method)
+        self._duration.labels(*labels).observe(metrics.duration)
+        self._requests.labels(*labels, str(metrics.status_code or 0)).inc()
+        self._retries.labels(*labels).inc(metrics.retries)
+        self._bytes_sent.labels(*labels).inc(metrics.bytes_sent)
+        self._bytes_received.labels(*labels).inc(metrics.bytes_received)
+
+    def on_validation(self, metrics: ValidationMetrics) -> None:
+        self._validation.labels(
+            metrics.endpoint, metrics.command, metrics.model
+        ).observe(metrics.duration)
+
+
+class OpenTelemetryObserver(Observer):
+    """Observer recording the metrics with the OpenTelemetry API, which has to be installed
+
+    Example usage: http = Http(observers=[OpenTelemetryObserver()])
+    """
+
+    def __init__(self, meter: Any = None) -> None:
+        try:
+            from opentelemetry import metrics
+        except ImportError as e:
+            raise ImportError(
+                "OpenTelemetryObserver requires opentelemetry-api, "
+                "install it with 'pip install opentelemetry-api'"
+            ) from e
+
+        from PyTado import __version__
+
+        meter = meter or metrics.get_meter("PyTado", __version__)
+
+        self._duration = meter.create_histogram(
+            "pytado.request.duration",
+            unit="s",
+            description="Duration of the API calls, including retries",
+        )
+        self._requests = meter.create_counter(
+            "pytado.requests", unit="{request}", description="API calls"
+        )
+        self._retries = meter.create_counter(
+            "pytado.request.retries",
+            unit="{retry}",
+            description="Retries of the API calls",
+        )
+        self._bytes_sent = meter.create_counter(
+            "pytado.request.body.size", unit="By", description="Request body bytes"
+        )
+        self._bytes_received = meter.create_counter(
+            "pytado.response.body.size", unit="By", description="Response body bytes"
+        )
+        self._validation = meter.create_histogram(
+            "pytado.model.validation.duration",
+            unit="s",
+            description="Duration of the validation of API responses into models",
+        )
+
+    def on_request(self, metrics: RequestMetrics) -> None:
+        attributes: dict[str, str | int] = {
+            "endpoint": metrics.endpoint,
+            "command": metrics.command,
+            "http.request.method": metrics.method,
+        }
+        if metrics.status_code is not None:
+            attributes["http.response.status_code"] = metrics.status_code
+        if metrics.error is not None:
+            attributes["error.type"] = metrics.error
+
+        self._duration.record(metrics.duration, attributes)
+        self._requests.add(1, attributes)
+        self._retries.add(metrics.retries, attributes)
+        self._bytes_sent.add(metrics.bytes_sent, attributes)
+        self._bytes_received.add(metrics.bytes_received, attributes)
+
+    def on_validation(self, metrics: ValidationMetrics) -> None:
+        self._validation.record(
+            metrics.duration,
+            {
+                "endpoint": metrics.endpoint,
+                "command": metrics.command,
+                "model": metrics.model,
+            },
+        )
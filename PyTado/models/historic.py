@@ -1,8 +1,12 @@
-from datetime import datetime
-from typing import Generic, TypeVar
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from enum import Enum
+from typing import Any, Generic, TypeVar
 
 from pydantic import Field
+from pydantic.alias_generators import to_camel
 
+from PyTado.models.lazy import raw_value
 from PyTado.models.util import Base
 from PyTado.types import Power, StrEnumMissing, ZoneType
 
@@ -126,6 +130,99 @@ class Weather(Base):
     slots: Slots
 
 
+@dataclass(frozen=True)
+class PointArrays:
+    """Data points as NumPy arrays: timestamps (datetime64[ms], UTC) and float64 values"""
+
+    timestamps: Any
+    values: Any
+
+
+@dataclass(frozen=True)
+class IntervalArrays:
+    """Data intervals as NumPy arrays: start and end (datetime64[ms], UTC), the values
+    (str), and for settings and weather conditions the temperature (float64 celsius, NaN
+    if none)"""
+
+    start: Any
+    end: Any
+    values: Any
+    celsius: Any = None
+
+
+@dataclass(frozen=True)
+class HistoricArrays:
+    """The time series of a day report as NumPy arrays, see Historic.to_arrays()"""
+
+    inside_temperature: PointArrays
+    humidity: PointArrays
+    stripes: IntervalArrays
+    settings: IntervalArrays
+    call_for_heat: IntervalArrays
+    weather_condition: IntervalArrays
+
+
+# rows of a time series: (timestamp, value) per point,
+# (start, end, value, celsius) per interval
+_Point = tuple[datetime | str, float]
+_Interval = tuple[datetime | str, datetime | str, str, float | None]
+
+
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "Historic.to_arrays requires numpy, install it with 'pip install numpy'"
+        ) from e
+    return numpy
+
+
+def _utc(timestamp: datetime | str) -> datetime | str:
+    """Return a timestamp as a naive UTC datetime or ISO string, as NumPy expects them"""
+    if isinstance(timestamp, str):
+        if timestamp.endswith("Z"):
+            return timestamp[:-1]
+        timestamp = datetime.fromisoformat(timestamp)
+    if timestamp.tzinfo is None:
+        return timestamp
+    return timestamp.astimezone(UTC).replace(tzinfo=None)
+
+
+def _text(value: Any) -> str:
+    return str(value.value if isinstance(value, Enum) else value)
+
+
+def _get(data: dict[str, Any], name: str) -> Any:
+    """Return a field of a JSON object by its camelCase or snake_case name, None if missing"""
+    camel = to_camel(name)
+    return data[camel] if camel in data else data.get(name)
+
+
+def _point_arrays(np: Any, points: list[_Point]) -> PointArrays:
+    return PointArrays(
+        timestamps=np.array([_utc(point[0]) for point in points], "datetime64[ms]"),
+        values=np.array([point[1] for point in points], np.float64),
+    )
+
+
+def _interval_arrays(
+    np: Any, intervals: list[_Interval], celsius: bool = False
+) -> IntervalArrays:
+    return IntervalArrays(
+        start=np.array([_utc(row[0]) for row in intervals], "datetime64[ms]"),
+        end=np.array([_utc(row[1]) for row in intervals], "datetime64[ms]"),
+        values=np.array([row[2] for row in intervals], np.str_),
+        celsius=(
+            np.array(
+                [np.nan if row[3] is None else row[3] for row in intervals], np.float64
+            )
+            if celsius
+            else None
+        ),
+    )
+
+
 class Historic(Base):
     zone_type: ZoneType
     interval: Interval
@@ -135,3 +232,140 @@ class Historic(Base):
     settings: DataIntervalBase[Setting]
     call_for_heat: DataIntervalBase[str]
     weather: Weather
+
+    def to_arrays(self) -> HistoricArrays:
+        """Return the time series of the day report as contiguous NumPy arrays
+
+        Requires numpy (pip install python-tado[numpy]). With lazy validation (see
+        PyTado.models.util.lazy_validation) the series are read from the JSON of the
+        response, without validating a model per data point, as long as none of them
+        was read from the model before.
+        """
+        np = _numpy()
+        try:
+            series = self._raw_series()
+        except (KeyError, TypeError, ValueError, AttributeError):
+            # let the validation of the models raise the error
+            series = None
+        if series is None:
+            series = self._model_series()
+        points, intervals = series
+
+        return HistoricArrays(
+            inside_temperature=_point_arrays(np, points["inside_temperature"]),
+            humidity=_point_arrays(np, points["humidity"]),
+            stripes=_interval_arrays(np, intervals["stripes"]),
+            settings=_interval_arrays(np, intervals["settings"], celsius=True),
+            call_for_heat=_interval_arrays(np, intervals["call_for_heat"]),
+            weather_condition=_interval_arrays(
+                np, intervals["weather_condition"], celsius=True
+            ),
+        )
+
+    def _model_series(
+        self,
+    ) -> tuple[dict[str, list[_Point]], dict[str, list[_Interval]]]:
+        measured = self.measured_data
+        points: dict[str, list[_Point]] = {
+            "inside_temperature": [
+                (point.timestamp, point.value.celsius)
+                for point in measured.inside_temperature.data_points or []
+            ],
+            "humidity": [
+                (point.timestamp, point.value)
+                for point in measured.humidity.data_points or []
+            ],
+        }
+        intervals: dict[str, list[_Interval]] = {
+            "stripes": [
+                (item.from_date, item.to_date, _text(item.value.stripe_type), None)
+                for item in self.stripes.data_intervals
+            ],
+            "settings": [
+                (
+                    item.from_date,
+                    item.to_date,
+                    _text(item.value.power),
+                    (
+                        None
+                        if item.value.temperature is None
+                        else item.value.temperature.celsius
+                    ),
+                )
+                for item in self.settings.data_intervals
+            ],
+            "call_for_heat": [
+                (item.from_date, item.to_date, item.value, None)
+                for item in self.call_for_heat.data_intervals
+            ],
+            "weather_condition": [
+                (
+                    item.from_date,
+                    item.to_date,
+                    _text(item.value.state),
+                    item.value.temperature.celsius,
+                )
+                for item in self.weather.condition.data_intervals
+            ],
+        }
+        return points, intervals
+
+    def _raw_series(
+        self,
+    ) -> tuple[dict[str, list[_Point]], dict[str, list[_Interval]]] | None:
+        """Return the series from the JSON of a lazy report, None if it was validated"""
+        raw = {
+            name: raw_value(self, name)
+            for name in (
+                "measured_data",
+                "stripes",
+                "settings",
+                "call_for_heat",
+                "weather",
+            )
+        }
+        if any(value is None for value in raw.values()):
+            return None
+
+        measured = raw["measured_data"]
+        temperature = _get(measured, "inside_temperature")
+        humidity = _get(measured, "humidity")
+        points: dict[str, list[_Point]] = {
+            "inside_temperature": [
+                (point["timestamp"], float(point["value"]["celsius"]))
+                for point in _get(temperature, "data_points") or []
+            ],
+            "humidity": [
+                (point["timestamp"], float(point["value"]))
+                for point in _get(humidity, "data_points") or []
+            ],
+        }
+        intervals: dict[str, list[_Interval]] = {
+            "stripes": [
+                (item["from"], item["to"], _get(item["value"], "stripe_type"), None)
+                for item in _get(raw["stripes"], "data_intervals")
+            ],
+            "settings": [
+                (
+                    item["from"],
+                    item["to"],
+                    item["value"]["power"],
+                    (item["value"].get("temperature") or {}).get("celsius"),
+                )
+                for item in _get(raw["settings"], "data_intervals")
+            ],
+            "call_for_heat": [
+                (item["from"], item["to"], item["value"], None)
+                for item in _get(raw["call_for_heat"], "data_intervals")
+            ],
+            "weather_condition": [
+                (
+                    item["from"],
+                    item["to"],
+                    item["value"]["state"],
+                    item["value"]["temperature"]["celsius"],
+                )
+                for item in _get(raw["weather"]["condition"], "data_intervals")
+            ],
+        }
+        return points, intervals
@@ -3,7 +3,7 @@ from typing import Any, Dict
 
 from pydantic import model_validator
 
-from PyTado.models.util import Base
+from PyTado.models.util import Base, ModelAdapter
 from PyTado.types import BatteryState, Presence
 
 
@@ -204,3 +204,9 @@ class ActionableDevice:
     needs_mounting: bool
     isOffline: bool
     batteryState: BatteryState
+
+
+Users = ModelAdapter(list[User])
+MobileDevices = ModelAdapter(list[MobileDevice])
+EIQTariffs = ModelAdapter(list[EIQTariff])
+EIQMeterReadings = ModelAdapter(list[EIQMeterReading])
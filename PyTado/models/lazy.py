@@ -0,0 +1,278 @@
+"""Lazy validation of the models, see PyTado.models.util.lazy_validation
+
+A lazy model is an instance of the model class holding the decoded JSON of the response.
+A field is validated on its first access and stored in the instance like a field of an
+eagerly validated model, so it is validated once. A nested model, or a list or dict of
+them, is lazy as well: reading the temperature of a zone state validates the temperature
+alone, not the rest of the state.
+
+Models with validators of their own, and the models nested in them, are always
+validated eagerly, as their validators may need the whole input. So are the models
+without nested models, which pydantic validates faster at once than field by field.
+"""
+
+import threading
+import types
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Annotated, Any, Union, get_args, get_origin
+
+from pydantic import AliasChoices, BaseModel, TypeAdapter
+from pydantic.fields import FieldInfo
+
+# key of the LazyData of a lazy model in its __dict__
+LAZY = "__lazy__"
+
+# the model validators of PyTado.models.util.Base, run when a lazy model is created
+_BASE_VALIDATORS = {"log_unexpected_keys"}
+
+
+@dataclass(frozen=True)
+class Shape:
+    """The models a value may hold: a model, or a list or dict of models"""
+
+    model: type[BaseModel]
+    # list or dict
+    container: type | None = None
+    optional: bool = False
+
+
+@dataclass(frozen=True)
+class LazyField:
+    """A field of a lazy model: its keys in the JSON and how to validate its value"""
+
+    name: str
+    info: FieldInfo
+    keys: tuple[str, ...]
+    shape: Shape | None
+
+    def validate(self, value: Any) -> Any:
+        return lazy_value(self.shape, value, self._adapter)
+
+    def _adapter(self) -> TypeAdapter[Any]:
+        return _field_adapter(self.info)
+
+
+@dataclass(frozen=True)
+class LazyData:
+    """The JSON of a lazy model, and the fields that were not validated yet"""
+
+    data: dict[str, Any]
+    fields: dict[str, LazyField]
+
+
+@dataclass(frozen=True)
+class LazyModel:
+    """How to create the lazy instances of a model class"""
+
+    fields: dict[str, LazyField]
+    # field name by JSON key
+    names: dict[str, str]
+    required: frozenset[str]
+    validators: tuple[Callable[[Any], Any], ...]
+
+
+_LOCK = threading.Lock()
+_MODELS: dict[type[BaseModel], LazyModel | None] = {}
+_ADAPTERS: dict[int, TypeAdapter[Any]] = {}
+
+
+def _keys(name: str, info: FieldInfo) -> tuple[str, ...] | None:
+    """Return the keys a field is validated from, None if they are not plain keys"""
+    alias = info.validation_alias or info.alias or name
+    if isinstance(alias, str):
+        return (alias,)
+    if isinstance(alias, AliasChoices) and all(
+        isinstance(choice, str) for choice in alias.choices
+    ):
+        return tuple(str(choice) for choice in alias.choices)
+    return None
+
+
+def _build_spec(model: type[BaseModel]) -> LazyModel | None:
+    decorators = model.__pydantic_decorators__
+    if (
+        decorators.validators
+        or decorators.field_validators
+        or decorators.root_validators
+        or set(decorators.model_validators) - _BASE_VALIDATORS
+        or model.__private_attributes__
+    ):
+        return None
+
+    fields: dict[str, LazyField] = {}
+    names: dict[str, str] = {}
+    for name, info in model.model_fields.items():
+        keys = _keys(name, info)
+        if keys is None:
+            return None
+        fields[name] = LazyField(name, info, keys, lazy_shape(info.annotation))
+        for key in keys:
+            names.setdefault(key, name)
+
+    if all(field.shape is None for field in fields.values()):
+        # a model without nested models is validated faster by pydantic at once
+        return None
+
+    return LazyModel(
+        fields=fields,
+        names=names,
+        required=frozenset(
+            name for name, field in fields.items() if field.info.is_required()
+        ),
+        validators=tuple(
+            decorator.func for decorator in decorators.model_validators.values()
+        ),
+    )
+
+
+def lazy_spec(model: type[BaseModel]) -> LazyModel | None:
+    """Return how to create lazy instances of a model, None if it has to be validated eagerly"""
+    try:
+        return _MODELS[model]
+    except KeyError:
+        pass
+
+    lazy = _build_spec(model)
+    with _LOCK:
+        _MODELS[model] = lazy
+    return lazy
+
+
+def _field_adapter(info: FieldInfo) -> TypeAdapter[Any]:
+    adapter = _ADAPTERS.get(id(info))
+    if adapter is None:
+        annotation: Any = info.annotation
+        if info.metadata:
+            annotation = Annotated[(annotation, *info.metadata)]
+        adapter = TypeAdapter(annotation)
+        with _LOCK:
+            # the FieldInfo lives as long as its model class, its id is not reused
+            _ADAPTERS[id(info)] = adapter
+    return adapter
+
+
+def _is_model(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+def lazy_shape(annotation: Any) -> Shape | None:
+    """Return the models a value of a type may hold lazily, None if it holds none"""
+    optional = False
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = get_args(annotation)
+        others = [arg for arg in args if arg is not type(None)]
+        if len(others) != 1:
+            return None
+        annotation, optional = others[0], len(others) < len(args)
+
+    if _is_model(annotation):
+        return Shape(annotation, optional=optional)
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is list and len(args) == 1 and _is_model(args[0]):
+        return Shape(args[0], list, optional)
+    if origin is dict and len(args) == 2 and args[0] is str and _is_model(args[1]):
+        return Shape(args[1], dict, optional)
+    return None
+
+
+def lazy_value(
+    shape: Shape | None, value: Any, adapter: Callable[[], TypeAdapter[Any]]
+) -> Any:
+    """
+    Return the lazy model, or list or dict of lazy models, of a JSON value of a shape,
+    else the value validated eagerly by the adapter (a function returning the TypeAdapter
+    of the value).
+    """
+    if shape is not None:
+        if value is None and shape.optional:
+            return None
+        if shape.container is None:
+            instance = lazy_model(shape.model, value)
+            if instance is not None:
+                return instance
+        elif shape.container is list and isinstance(value, list):
+            items = [lazy_model(shape.model, item) for item in value]
+            if all(item is not None for item in items):
+                return items
+        elif shape.container is dict and isinstance(value, dict):
+            values = {key: lazy_model(shape.model, item) for key, item in value.items()}
+            if all(item is not None for item in values.values()):
+                return values
+
+    return adapter().validate_python(value)
+
+
+def lazy_model(model: type[BaseModel], data: Any) -> Any:
+    """
+    Return a lazy instance of a model holding the JSON data, None if the model has to be
+    validated eagerly or a required field is missing in the data.
+    """
+    lazy = lazy_spec(model)
+    if lazy is None or not isinstance(data, dict):
+        return None
+
+    names = lazy.names
+    fields_set = {names[key] for key in data if key in names}
+    if not lazy.required <= fields_set:
+        # let the eager validation raise the error
+        return None
+
+    instance = model.__new__(model)
+    extra = {key: value for key, value in data.items() if key not in names}
+    object.__setattr__(instance, "__dict__", {LAZY: LazyData(data, lazy.fields)})
+    object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(instance, "__pydantic_extra__", extra)
+    object.__setattr__(instance, "__pydantic_private__", None)
+
+    for validator in lazy.validators:
+        validator(instance)
+    return instance
+
+
+def resolve(instance: BaseModel, lazy: LazyData, name: str) -> Any:
+    """Validate a field of a lazy model and store it in the model"""
+    field = lazy.fields[name]
+    for key in field.keys:
+        if key in lazy.data:
+            value = field.validate(lazy.data[key])
+            break
+    else:
+        value = field.info.get_default(call_default_factory=True)
+
+    instance.__dict__[name] = value
+    return value
+
+
+def raw_value(instance: BaseModel, name: str) -> Any:
+    """Return the JSON of a field of a lazy model not validated yet, else None"""
+    lazy = instance.__dict__.get(LAZY)
+    if lazy is None or name in instance.__dict__:
+        return None
+    for key in lazy.fields[name].keys:
+        if key in lazy.data:
+            return lazy.data[key]
+    return None
+
+
+def materialize(instance: BaseModel) -> None:
+    """Validate all fields of a lazy model, and of the lazy models nested in it"""
+    lazy = instance.__dict__.get(LAZY)
+    if lazy is None:
+        return
+
+    for name in lazy.fields:
+        if name not in instance.__dict__:
+            resolve(instance, lazy, name)
+
+    # in the order of the fields, as in an eagerly validated model
+    values = {name: instance.__dict__[name] for name in lazy.fields}
+    instance.__dict__.clear()
+    instance.__dict__.update(values)
+
+    for value in values.values():
+        items = value.values() if isinstance(value, dict) else value
+        for item in items if isinstance(value, (list, dict)) else [value]:
+            if isinstance(item, BaseModel):
+                materialize(item)
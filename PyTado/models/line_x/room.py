@@ -1,7 +1,7 @@
 from datetime import datetime
 
 from PyTado.models.line_x.device import Connection
-from PyTado.models.util import Base
+from PyTado.models.util import Base, ModelAdapter
 from PyTado.types import OverlayMode, Power
 
 
@@ -88,3 +88,6 @@ class RoomState(Base):
     balance_control: str | None = None
     manual_control_termination: ManualControlTermination | None = None
     boost_mode: ManualControlTermination | None = None
+
+
+RoomStates = ModelAdapter(list[RoomState])
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from PyTado.models.util import Base
+from PyTado.models.util import Base, ModelAdapter
 from PyTado.types import BatteryState
 
 
@@ -40,3 +40,6 @@ class Device(Base):
     child_lock_enabled: bool | None = None
     orientation: str | None = None
     duties: list[str] | None = None
+
+
+Devices = ModelAdapter(list[Device])
@@ -1,7 +1,10 @@
-from PyTado.models.util import Base
+from PyTado.models.util import Base, ModelAdapter
 
 
 class HeatingCircuit(Base):
     number: int
     driverSerialNo: str
     driverShortSerialNo: str
+
+
+HeatingCircuits = ModelAdapter(list[HeatingCircuit])
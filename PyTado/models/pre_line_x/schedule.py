@@ -1,9 +1,7 @@
 from typing import List, TypeAlias
 
-from pydantic import TypeAdapter
-
 from PyTado.models.common.schedule import ScheduleElement
-from PyTado.models.util import Base
+from PyTado.models.util import Base, ModelAdapter
 
 
 class TempValue(Base):
@@ -14,4 +12,4 @@ class TempValue(Base):
 
 
 Schedule: TypeAlias = ScheduleElement[TempValue]
-Schedules = TypeAdapter(List[Schedule])
+Schedules = ModelAdapter(List[Schedule])
@@ -5,7 +5,7 @@ from pydantic import AliasChoices, Field
 from PyTado.const import DEFAULT_TADO_PRECISION
 from PyTado.models.home import Temperature, TempPrecision
 from PyTado.models.pre_line_x.device import Device
-from PyTado.models.util import Base
+from PyTado.models.util import Base, ModelAdapter
 from PyTado.types import (
     FanLevel,
     FanSpeed,
@@ -286,3 +286,13 @@ class Capabilities(Base):
         default=None, validation_alias=AliasChoices("dry", "DRY")
     )
     initial_states: AirConditioningInitialStates | None = None
+
+
+class ZoneStatesResponse(Base):
+    """ZoneStatesResponse model represents the states of all zones of a home."""
+
+    zone_states: dict[str, ZoneState]
+
+
+Zones = ModelAdapter(list[Zone])
+ZoneStates = ModelAdapter(dict[str, ZoneState])
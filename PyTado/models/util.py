@@ -7,32 +7,140 @@ centered around Pydantic for data validation and serialization. It includes:
   - Automatic camelCase/snake_case field name conversion
   - Flexible extra field handling
   - JSON serialization utilities
-- Debug-focused validation wrapper that logs:
+- Debug-focused validation hooks that log:
   - Extra fields present in the data but not in the model
   - Fields defined in the model but not present in the data
   - Validation errors with detailed context
+- ModelAdapter, validating list and dict responses of models with the same hooks
+- A trusted validation mode skipping that debug bookkeeping, for responses of the API
+  which are known to match the models (see trusted_validation)
+- A lazy validation mode validating the fields of a model on first access, for callers
+  reading a few fields of large responses (see lazy_validation)
 
 This module serves as the backbone for all data models in PyTado, ensuring consistent
 handling of API data and providing helpful debugging information during development.
 """
 
-from typing import Any, Self
+import contextlib
+import contextvars
+import logging
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING, Any, Generic, Self, TypeVar, get_args, get_origin
 
 from pydantic import (
     AliasChoices,
     AliasGenerator,
     BaseModel,
     ConfigDict,
-    ModelWrapValidatorHandler,
+    TypeAdapter,
     ValidationError,
     model_validator,
 )
 from pydantic.alias_generators import to_camel
+from pydantic_core import from_json
 
 from PyTado.logger import Logger
+from PyTado.metrics import validation_timer
+from PyTado.models.lazy import (
+    LAZY,
+    lazy_model,
+    lazy_shape,
+    lazy_value,
+    materialize,
+    resolve,
+)
 
 LOGGER = Logger(__name__)
 
+_T = TypeVar("_T")
+
+_trusted_default = False
+# overrides _trusted_default in the current thread or task, see trusted_validation()
+_TRUSTED: contextvars.ContextVar[bool | None] = contextvars.ContextVar(
+    "_TRUSTED", default=None
+)
+
+
+def set_trusted_validation(enabled: bool) -> None:
+    """Enable or disable trusted validation for the whole process, see trusted_validation"""
+    global _trusted_default  # pylint: disable=global-statement
+    _trusted_default = enabled
+
+
+@contextlib.contextmanager
+def trusted_validation(enabled: bool = True) -> Iterator[None]:
+    """Enable or disable trusted validation in the current thread or task
+
+    In trusted validation the models are validated by pydantic alone: the debug logging
+    of extra keys, unused keys and validation errors is skipped, which makes validating
+    large responses like Historic several times faster. Validation errors are raised as
+    before, and validations observed by the Http client are still timed.
+    """
+    token = _TRUSTED.set(enabled)
+    try:
+        yield
+    finally:
+        _TRUSTED.reset(token)
+
+
+def _is_trusted() -> bool:
+    trusted = _TRUSTED.get()
+    return _trusted_default if trusted is None else trusted
+
+
+_lazy_default = False
+# overrides _lazy_default in the current thread or task, see lazy_validation()
+_LAZY: contextvars.ContextVar[bool | None] = contextvars.ContextVar(
+    "_LAZY", default=None
+)
+
+
+def set_lazy_validation(enabled: bool) -> None:
+    """Enable or disable lazy validation for the whole process, see lazy_validation"""
+    global _lazy_default  # pylint: disable=global-statement
+    _lazy_default = enabled
+
+
+@contextlib.contextmanager
+def lazy_validation(enabled: bool = True) -> Iterator[None]:
+    """Enable or disable lazy validation in the current thread or task
+
+    In lazy validation a model keeps the decoded JSON of the response and validates a
+    field on its first access, once: reading the temperature of a zone state validates
+    the temperature alone. Nested models, and lists and dicts of them, are lazy as well.
+    This saves time and memory for callers reading a few fields of large responses like
+    Historic or the states of all zones.
+
+    A field failing to validate raises the ValidationError on its access instead of
+    while the response is validated. Dumping or comparing a model validates all its
+    fields first. Models with validators of their own are validated eagerly, see
+    PyTado.models.lazy.
+    """
+    token = _LAZY.set(enabled)
+    try:
+        yield
+    finally:
+        _LAZY.reset(token)
+
+
+def _is_lazy() -> bool:
+    lazy = _LAZY.get()
+    return _lazy_default if lazy is None else lazy
+
+
+def _observe(name: str, data: Any, validate: Callable[[], _T]) -> _T:
+    """Run a validation, timed for the observers of the Http client and logged if it fails"""
+    stop_timer = validation_timer()
+    try:
+        return validate()
+    except ValidationError:
+        if not _is_trusted():
+            LOGGER.error("Model %s failed to validate with data %r", name, data)
+        raise
+    finally:
+        if stop_timer is not None:
+            stop_timer(name)
+
 
 class Base(BaseModel):
     """Base model for all models in PyTado.
@@ -59,35 +167,126 @@ class Base(BaseModel):
     def to_dict(self) -> dict[str, Any]:
         return self.model_dump(by_alias=True)
 
-    @model_validator(mode="wrap")
     @classmethod
-    def log_failed_validation(
-        cls, data: Any, handler: ModelWrapValidatorHandler[Self]
+    def model_validate(cls, obj: Any, **kwargs: Any) -> Self:
+        validate = super().model_validate
+        if _is_lazy() and not kwargs and type(obj) is dict:
+            return _observe(cls.__name__, obj, lambda: cls._lazy(obj, validate))
+        return _observe(cls.__name__, obj, lambda: validate(obj, **kwargs))
+
+    @classmethod
+    def model_validate_json(
+        cls, json_data: str | bytes | bytearray, **kwargs: Any
     ) -> Self:
+        if _is_lazy() and not kwargs:
+            return cls.model_validate(from_json(json_data))
+        validate = super().model_validate_json
+        return _observe(cls.__name__, json_data, lambda: validate(json_data, **kwargs))
+
+    @classmethod
+    def _lazy(cls, obj: dict[str, Any], validate: Callable[[Any], Self]) -> Self:
+        """Return a lazy instance of the model, or the model validated eagerly"""
+        instance: Self | None = lazy_model(cls, obj)
+        return validate(obj) if instance is None else instance
+
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> Any:
+            lazy = self.__dict__.get(LAZY)
+            if lazy is not None and name in lazy.fields:
+                return resolve(self, lazy, name)
+            return super().__getattr__(name)
+
+    def model_dump(self, **kwargs: Any) -> dict[str, Any]:
+        materialize(self)
+        return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        materialize(self)
+        return super().model_dump_json(**kwargs)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, BaseModel):
+            materialize(self)
+            materialize(other)
+        return super().__eq__(other)
+
+    def __iter__(self) -> Any:
+        materialize(self)
+        return super().__iter__()
+
+    def __repr_args__(self) -> Any:
+        materialize(self)
+        return super().__repr_args__()
+
+    @model_validator(mode="after")
+    def log_unexpected_keys(self) -> Self:
         """Model validation debug helper.
         Logs in the following cases:
-            - (Debug) Keys in data that are not in the model
+            - (Warning) Keys in data that are not in the model
             - (Debug) Keys in the model that are not in the data
-            - (Error) Validation errors
+        Validation errors are logged by model_validate() and model_validate_json().
         (This is just for debugging and development, can be removed if not needed anymore)
+        Skipped in trusted validation, see trusted_validation().
+
+        An after validator, unlike a wrap validator, does not make pydantic convert the
+        input of every nested model to python objects when validating JSON.
         """
-        try:
-            model: Self = handler(data)
+        if not _is_trusted():
+            self._log_model_keys()
+        return self
 
-            extra = model.model_extra
+    def _log_model_keys(self) -> None:
+        cls = type(self)
+        extra = self.model_extra
 
-            if extra:
-                for key, value in extra.items():
-                    if value is not None:
-                        LOGGER.warning(
-                            "Model %s has extra key: %s with value %r", cls, key, value
-                        )
+        if extra:
+            for key, value in extra.items():
+                if value is not None:
+                    LOGGER.warning(
+                        "Model %s has extra key: %s with value %r", cls, key, value
+                    )
 
-            unused_keys = model.model_fields.keys() - model.model_fields_set
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            unused_keys = cls.model_fields.keys() - self.model_fields_set
             if unused_keys:
                 LOGGER.debug("Model %s has unused keys: %r", cls, unused_keys)
 
-            return model
-        except ValidationError:
-            LOGGER.error("Model %s failed to validate with data %r", cls, data)
-            raise
+
+def _type_name(type_: Any) -> str:
+    """Return a short name of a type, e.g. list[Zone]"""
+    origin = get_origin(type_)
+    if origin is None:
+        return getattr(type_, "__name__", repr(type_))
+    return f"{_type_name(origin)}[{', '.join(map(_type_name, get_args(type_)))}]"
+
+
+class ModelAdapter(Generic[_T]):
+    """Validates a list or dict of models, e.g. a response listing all zones of a home
+
+    Validates the whole response in one call, with the logging and the timing of
+    Base.model_validate(), which are skipped when a pydantic TypeAdapter validates
+    models nested in a list or dict.
+
+    Example usage: Zones = ModelAdapter(list[Zone])
+                   zones = Zones.validate_json(body)
+    """
+
+    def __init__(self, type_: type[_T]) -> None:
+        self._adapter = TypeAdapter(type_)
+        self._shape = lazy_shape(type_)
+        self._name = _type_name(type_)
+
+    def _validate(self, data: Any) -> _T:
+        if _is_lazy():
+            result: _T = lazy_value(self._shape, data, lambda: self._adapter)
+            return result
+        return self._adapter.validate_python(data)
+
+    def validate_python(self, data: Any) -> _T:
+        return _observe(self._name, data, lambda: self._validate(data))
+
+    def validate_json(self, data: str | bytes | bytearray) -> _T:
+        if _is_lazy():
+            return self.validate_python(from_json(data))
+        return _observe(self._name, data, lambda: self._adapter.validate_json(data))
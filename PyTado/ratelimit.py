@@ -0,0 +1,295 @@
+"""
+Client side request budgets and API quota accounting
+"""
+
+import re
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+
+from PyTado.exceptions import TadoRateLimitException
+
+_SECONDS_PER_DAY = 86400
+_STRUCTURED_PARAMETER = re.compile(r";\s*([a-z]+)\s*=\s*(\d+(?:\.\d+)?)")
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Request budget, None means unlimited"""
+
+    per_minute: int | None = None
+    per_day: int | None = None
+
+
+@dataclass(frozen=True)
+class QuotaStatus:
+    """Request accounting of an endpoint (or the whole account)
+
+    requests_today: requests sent today (UTC)
+    limit: daily quota reported by the API, the configured daily budget otherwise
+    remaining: remaining quota reported by the API, estimated from the budget otherwise
+    reset_in: seconds until the quota resets, if known
+    """
+
+    requests_today: int
+    limit: int | None = None
+    remaining: int | None = None
+    reset_in: float | None = None
+
+
+def parse_rate_limit_headers(
+    headers: Mapping[str, str],
+) -> tuple[int | None, int | None, float | None] | None:
+    """
+    Return limit, remaining and reset (in seconds) from rate limit response headers.
+
+    Supports the structured fields of the IETF draft (`RateLimit-Policy: "day";q=100;w=86400`
+    and `RateLimit: "day";r=42;t=3600`), its older `RateLimit-Limit/-Remaining/-Reset`
+    variant and the common `X-RateLimit-*` headers. Returns None without such headers.
+    """
+
+    lowered = {key.lower(): value for key, value in headers.items()}
+
+    if "ratelimit" in lowered:
+        state = _structured_parameters(lowered["ratelimit"])
+        policy = _structured_parameters(lowered.get("ratelimit-policy", ""))
+        limit = policy.get("q")
+        remaining = state.get("r")
+        reset = state.get("t")
+        return (
+            int(limit) if limit is not None else None,
+            int(remaining) if remaining is not None else None,
+            reset,
+        )
+
+    for prefix in ("ratelimit-", "x-ratelimit-"):
+        if f"{prefix}remaining" in lowered or f"{prefix}limit" in lowered:
+            return (
+                _int_or_none(lowered.get(f"{prefix}limit")),
+                _int_or_none(lowered.get(f"{prefix}remaining")),
+                _float_or_none(lowered.get(f"{prefix}reset")),
+            )
+
+    return None
+
+
+def _structured_parameters(value: str) -> dict[str, float]:
+    # only the first policy of a list is used
+    first = value.split(",", 1)[0]
+    return {key: float(number) for key, number in _STRUCTURED_PARAMETER.findall(first)}
+
+
+def _int_or_none(value: str | None) -> int | None:
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _float_or_none(value: str | None) -> float | None:
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class _TokenBucket:
+    def __init__(self, capacity: int, period: float, now: float) -> None:
+        self._capacity = float(capacity)
+        self._rate = capacity / period
+        self._tokens = float(capacity)
+        self._updated = now
+
+    def delay(self, now: float) -> float:
+        """Seconds until a token is available, tokens can be reserved ahead (negative)"""
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+        return 0.0 if self._tokens >= 1 else (1 - self._tokens) / self._rate
+
+    def take(self) -> None:
+        self._tokens -= 1
+
+
+@dataclass
+class _ServerQuota:
+    limit: int | None
+    remaining: int | None
+    reset_at: float | None
+
+
+class RateLimiter:
+    """Token bucket rate limiter per account and per Endpoint
+
+    Every request takes a token of the account bucket and of the bucket of its endpoint.
+    If a bucket is empty, `acquire()` returns how long the caller has to wait for its
+    turn, if that is longer than `max_wait` a TadoRateLimitException is raised instead.
+    The quota reported by the API in the rate limit headers is respected as well.
+
+    A RateLimiter belongs to one account, share it between the Http clients of an account.
+
+    Example usage: limiter = RateLimiter(RateLimit(per_minute=20, per_day=5000))
+                   http = Http(rate_limiter=limiter)
+                   http.quota_status()
+    """
+
+    ACCOUNT = "account"
+
+    def __init__(
+        self,
+        limit: RateLimit = RateLimit(),
+        endpoint_limits: Mapping[str, RateLimit] | None = None,
+        max_wait: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._limits = {self.ACCOUNT: limit, **(endpoint_limits or {})}
+        self._max_wait = max_wait
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buckets: dict[str, list[_TokenBucket]] = {}
+        self._server_quota: dict[str, _ServerQuota] = {}
+        self._requests_today: dict[str, int] = {}
+        self._today: date | None = None
+
+    def _buckets_of(self, key: str, now: float) -> list[_TokenBucket]:
+        buckets = self._buckets.get(key)
+        if buckets is None:
+            limit = self._limits.get(key, RateLimit())
+            buckets = self._buckets[key] = [
+                _TokenBucket(capacity, period, now)
+                for capacity, period in (
+                    (limit.per_minute, 60),
+                    (limit.per_day, _SECONDS_PER_DAY),
+                )
+                if capacity
+            ]
+        return buckets
+
+    def _count(self, key: str) -> None:
+        today = datetime.now(timezone.utc).date()
+        if today != self._today:
+            self._today = today
+            self._requests_today.clear()
+        self._requests_today[key] = self._requests_today.get(key, 0) + 1
+
+    def _server_delay(self, key: str, now: float) -> float:
+        quota = self._server_quota.get(key)
+        if quota is None or quota.remaining is None or quota.remaining > 0:
+            return 0.0
+        if quota.reset_at is None:
+            return 0.0
+        return max(0.0, quota.reset_at - now)
+
+    def acquire(self, endpoint: str, max_delay: float | None = None) -> float | None:
+        """
+        Reserve a request to the endpoint and return the seconds to wait before sending it.
+
+        max_delay: the longest wait the caller accepts, e.g. the time left until its
+            deadline; None is returned without reserving the request if it is exceeded.
+
+        Raises:
+            TadoRateLimitException: If the wait would be longer than max_wait.
+        """
+
+        with self._lock:
+            now = self._clock()
+            keys = (self.ACCOUNT, endpoint)
+            buckets = [bucket for key in keys for bucket in self._buckets_of(key, now)]
+
+            delay = max(
+                [bucket.delay(now) for bucket in buckets]
+                + [self._server_delay(key, now) for key in keys]
+            )
+            if delay > self._max_wait:
+                raise TadoRateLimitException(
+                    f"Request budget for {endpoint} exhausted, retry in {delay:.0f} seconds"
+                )
+            if max_delay is not None and delay >= max_delay:
+                return None
+
+            for bucket in buckets:
+                bucket.take()
+            for key in keys:
+                self._count(key)
+
+            return delay
+
+    def record_response(
+        self, endpoint: str, status_code: int, headers: Mapping[str, str]
+    ) -> None:
+        """Update the quota of the endpoint from the rate limit headers of a response"""
+
+        parsed = parse_rate_limit_headers(headers)
+
+        if status_code == 429:
+            limit, _, reset = parsed or (None, None, None)
+            retry_after = _float_or_none(
+                {key.lower(): value for key, value in headers.items()}.get(
+                    "retry-after"
+                )
+            )
+            parsed = (limit, 0, retry_after if retry_after is not None else reset)
+
+        if parsed is None:
+            return
+
+        limit, remaining, reset = parsed
+        with self._lock:
+            self._server_quota[endpoint] = _ServerQuota(
+                limit=limit,
+                remaining=remaining,
+                reset_at=self._clock() + reset if reset is not None else None,
+            )
+
+    def quota_status(self) -> dict[str, QuotaStatus]:
+        """Return the quota status of the account and of every endpoint used so far"""
+
+        with self._lock:
+            now = self._clock()
+            if self._today != datetime.now(timezone.utc).date():
+                self._requests_today.clear()
+
+            keys = dict.fromkeys(
+                [
+                    self.ACCOUNT,
+                    *self._limits,
+                    *self._requests_today,
+                    *self._server_quota,
+                ]
+            )
+            return {key: self._status(key, now) for key in keys}
+
+    def _status(self, key: str, now: float) -> QuotaStatus:
+        requests_today = self._requests_today.get(key, 0)
+        quota = self._server_quota.get(key)
+
+        if quota is not None:
+            return QuotaStatus(
+                requests_today=requests_today,
+                limit=quota.limit,
+                remaining=quota.remaining,
+                reset_in=(
+                    max(0.0, quota.reset_at - now)
+                    if quota.reset_at is not None
+                    else None
+                ),
+            )
+
+        per_day = self._limits.get(key, RateLimit()).per_day
+        if per_day is None:
+            return QuotaStatus(requests_today=requests_today)
+
+        midnight = datetime.combine(
+            datetime.now(timezone.utc).date() + timedelta(days=1),
+            datetime.min.time(),
+            tzinfo=timezone.utc,
+        )
+        return QuotaStatus(
+            requests_today=requests_today,
+            limit=per_day,
+            remaining=max(0, per_day - requests_today),
+            reset_in=(midnight - datetime.now(timezone.utc)).total_seconds(),
+        )
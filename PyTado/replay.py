@@ -0,0 +1,402 @@
+"""
+Record API exchanges into a cassette file and replay them without network access
+"""
+
+import gzip
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+import requests.adapters
+from requests.structures import CaseInsensitiveDict
+
+from PyTado.const import CLIENT_ID_DEVICE
+from PyTado.http import _OAUTH_TOKEN_URL
+
+CASSETTE_VERSION = 1
+REDACTED = "REDACTED"
+
+# query parameters and JSON keys whose values are secrets
+_SECRET_KEYS = frozenset(
+    ("access_token", "refresh_token", "id_token", "device_code", "code")
+)
+
+
+def _is_kept_header(name: str) -> bool:
+    """Only the response headers PyTado reads are recorded"""
+    lowered = name.lower()
+    return lowered in ("content-type", "retry-after") or "ratelimit" in lowered
+
+
+def scrub_url(url: str) -> str:
+    """Replace the values of the secret query parameters of a URL"""
+    parts = urlsplit(url)
+    if not parts.query:
+        return url
+
+    query = [
+        (key, REDACTED if key in _SECRET_KEYS else value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+    ]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def scrub_json(data: Any) -> Any:
+    """Replace the values of the secret keys of a decoded JSON body"""
+    if isinstance(data, dict):
+        return {
+            key: REDACTED if key in _SECRET_KEYS else scrub_json(value)
+            for key, value in data.items()
+        }
+    if isinstance(data, list):
+        return [scrub_json(item) for item in data]
+    return data
+
+
+@dataclass(frozen=True)
+class Interaction:
+    """A recorded API call
+
+    method: HTTP method, upper case
+    url: URL with its secret query parameters scrubbed
+    status: status code of the response
+    headers: content type and rate limit headers of the response
+    body: response body, a decoded JSON body has its secrets scrubbed
+    duration: seconds the call took when it was recorded
+    """
+
+    method: str
+    url: str
+    status: int = 200
+    headers: Mapping[str, str] = field(default_factory=dict)
+    body: bytes = b""
+    duration: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        data: dict[str, Any] = {
+            "method": self.method,
+            "url": self.url,
+            "status": self.status,
+        }
+        if self.headers:
+            data["headers"] = dict(self.headers)
+        if self.duration:
+            data["duration"] = round(self.duration, 6)
+
+        if self.body:
+            try:
+                # JSON bodies are stored decoded, the file stays readable and diffable
+                data["json"] = json.loads(self.body)
+            except ValueError:
+                data["text"] = self.body.decode("utf-8", errors="replace")
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "Interaction":
+        if "json" in data:
+            body = json.dumps(data["json"], separators=(",", ":")).encode("utf-8")
+        else:
+            body = data.get("text", "").encode("utf-8")
+
+        return cls(
+            method=data["method"],
+            url=data["url"],
+            status=data.get("status", 200),
+            headers=dict(data.get("headers", {})),
+            body=body,
+            duration=data.get("duration", 0.0),
+        )
+
+
+class Cassette:
+    """Recorded API calls, in the order they were sent
+
+    Tokens are never written: the request headers are not recorded, and the secret
+    query parameters and JSON keys (access_token, refresh_token, ...) are replaced by
+    "REDACTED". Cassettes are saved as compact JSON, gzipped when the file name ends
+    with ".gz".
+
+    Example usage: cassette = Cassette()
+                   tado = Tado(http_session=RecordingSession(cassette))
+                   ...
+                   cassette.save("benchmarks/home.json.gz")
+    """
+
+    def __init__(self, interactions: list[Interaction] | None = None) -> None:
+        self._lock = threading.Lock()
+        self._interactions: list[Interaction] = list(interactions or [])
+
+    def __len__(self) -> int:
+        return len(self._interactions)
+
+    def __iter__(self) -> Iterator[Interaction]:
+        with self._lock:
+            return iter(list(self._interactions))
+
+    def append(self, interaction: Interaction) -> None:
+        """Add an interaction, its URL and JSON body are scrubbed"""
+        body = interaction.body
+        if body:
+            try:
+                body = json.dumps(
+                    scrub_json(json.loads(body)), separators=(",", ":")
+                ).encode("utf-8")
+            except ValueError:
+                pass
+
+        scrubbed = Interaction(
+            method=interaction.method.upper(),
+            url=scrub_url(interaction.url),
+            status=interaction.status,
+            headers={
+                key: value
+                for key, value in interaction.headers.items()
+                if _is_kept_header(key)
+            },
+            body=body,
+            duration=interaction.duration,
+        )
+        with self._lock:
+            self._interactions.append(scrubbed)
+
+    def add(
+        self,
+        method: str,
+        url: str,
+        json_body: Any = None,
+        status: int = 200,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        """Add a JSON response for a call, e.g. to build a workload by hand"""
+        self.append(
+            Interaction(
+                method=method,
+                url=url,
+                status=status,
+                headers=headers or {"Content-Type": "application/json;charset=UTF-8"},
+                body=(
+                    b""
+                    if json_body is None
+                    else json.dumps(json_body, separators=(",", ":")).encode("utf-8")
+                ),
+            )
+        )
+
+    def add_token(self, expires_in: int = 600) -> None:
+        """Add the response of a refresh of the OAuth token"""
+        params = {
+            "client_id": CLIENT_ID_DEVICE,
+            "grant_type": "refresh_token",
+            "refresh_token": REDACTED,
+        }
+        self.add(
+            "POST",
+            f"{_OAUTH_TOKEN_URL}?{urlencode(params)}",
+            {
+                "access_token": REDACTED,
+                "expires_in": expires_in,
+                "refresh_token": REDACTED,
+                "token_type": "Bearer",
+            },
+        )
+
+    def record(self, response: requests.Response) -> None:
+        """Add the exchange of a response received by requests"""
+        request = response.request
+        self.append(
+            Interaction(
+                method=str(request.method),
+                url=str(request.url),
+                status=response.status_code,
+                headers=dict(response.headers),
+                body=response.content or b"",
+                duration=response.elapsed.total_seconds(),
+            )
+        )
+
+    def save(self, path: str | Path) -> None:
+        """Write the cassette to a file, gzipped if its name ends with .gz"""
+        data = json.dumps(
+            {
+                "version": CASSETTE_VERSION,
+                "interactions": [item.to_dict() for item in self],
+            },
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+        path = Path(path)
+        if path.suffix == ".gz":
+            data = gzip.compress(data, mtime=0)
+        path.write_bytes(data)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Cassette":
+        """Read a cassette written by save()"""
+        path = Path(path)
+        data = path.read_bytes()
+        if path.suffix == ".gz":
+            data = gzip.decompress(data)
+
+        cassette = json.loads(data)
+        if cassette.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version {cassette.get('version')}")
+
+        return cls([Interaction.from_dict(item) for item in cassette["interactions"]])
+
+    @classmethod
+    def from_fixtures(
+        cls, routes: Mapping[str, str], directory: str | Path, token: bool = True
+    ) -> "Cassette":
+        """
+        Build a cassette from JSON fixture files, like the ones in tests/fixtures.
+
+        Args:
+            routes (Mapping[str, str]): Fixture file, relative to the directory, of
+                every call: "https://my.tado.com/api/v2/homes/1234/zones/1/state" for a
+                GET or "PUT https://..." for another method.
+            directory (str | Path): Directory of the fixtures.
+            token (bool): Add the response of a refresh of the OAuth token, so that an
+                Http with any saved refresh token authenticates against the cassette.
+        """
+
+        cassette = cls()
+        if token:
+            cassette.add_token()
+
+        for route, fixture in routes.items():
+            method, _, url = route.rpartition(" ")
+            with open(Path(directory, fixture), encoding="utf-8") as f:
+                cassette.add(method or "GET", url, json.load(f))
+
+        return cassette
+
+
+class RecordingAdapter(requests.adapters.BaseAdapter):
+    """Transport adapter adding every response of the adapter it wraps to a cassette"""
+
+    def __init__(self, adapter: requests.adapters.BaseAdapter, cassette: Cassette):
+        super().__init__()
+        self._adapter = adapter
+        self._cassette = cassette
+
+    def send(
+        self, request: requests.PreparedRequest, *args: Any, **kwargs: Any
+    ) -> requests.Response:
+        started = time.perf_counter()
+        response = self._adapter.send(request, *args, **kwargs)
+        # requests only sets elapsed after the adapter returned
+        response.elapsed = timedelta(seconds=time.perf_counter() - started)
+        self._cassette.record(response)
+        return response
+
+    def close(self) -> None:
+        self._adapter.close()
+
+
+class RecordingSession(requests.Session):
+    """Session recording the calls into a cassette, pass it as http_session to Http
+
+    The calls still go to the API through the adapter mounted by Http, with its
+    retries, only their final responses are recorded.
+    """
+
+    def __init__(self, cassette: Cassette | None = None) -> None:
+        super().__init__()
+        self.cassette = cassette if cassette is not None else Cassette()
+        self._recording_adapters: dict[int, RecordingAdapter] = {}
+
+    def get_adapter(self, url: str) -> requests.adapters.BaseAdapter:
+        adapter = super().get_adapter(url)
+        recording = self._recording_adapters.get(id(adapter))
+        if recording is None:
+            recording = self._recording_adapters[id(adapter)] = RecordingAdapter(
+                adapter, self.cassette
+            )
+        return recording
+
+
+class ReplayAdapter(requests.adapters.BaseAdapter):
+    """Transport adapter answering from a cassette instead of the network
+
+    Calls are matched on their method and scrubbed URL. Calls to the same URL get the
+    recorded responses in order, the last one is repeated once the others are used up,
+    unless repeat is False.
+
+    latency: seconds every response is delayed, None to delay each response by the
+        duration it took when it was recorded
+    """
+
+    def __init__(
+        self, cassette: Cassette, latency: float | None = 0.0, repeat: bool = True
+    ) -> None:
+        super().__init__()
+        self._latency = latency
+        self._repeat = repeat
+        self._lock = threading.Lock()
+        self._responses: dict[tuple[str, str], deque[Interaction]] = defaultdict(deque)
+        for interaction in cassette:
+            self._responses[(interaction.method, interaction.url)].append(interaction)
+
+    def _next(self, method: str, url: str) -> Interaction:
+        with self._lock:
+            recorded = self._responses.get((method, url))
+            if not recorded:
+                raise requests.exceptions.ConnectionError(
+                    f"No recorded response for {method} {url}"
+                )
+            if len(recorded) > 1 or not self._repeat:
+                return recorded.popleft()
+            return recorded[0]
+
+    def send(
+        self, request: requests.PreparedRequest, *args: Any, **kwargs: Any
+    ) -> requests.Response:
+        interaction = self._next(
+            str(request.method).upper(), scrub_url(str(request.url))
+        )
+
+        delay = interaction.duration if self._latency is None else self._latency
+        if delay > 0:
+            time.sleep(delay)
+
+        response = requests.Response()
+        response.status_code = interaction.status
+        response.reason = "OK" if interaction.status < 400 else "Error"
+        response.headers = CaseInsensitiveDict(interaction.headers)
+        response.url = str(request.url)
+        response.request = request
+        response.encoding = "utf-8"
+        response._content = interaction.body
+        return response
+
+    def close(self) -> None:
+        return None
+
+
+class ReplaySession(requests.Session):
+    """Session replaying a cassette, pass it as http_session to Http
+
+    Every call is answered by a ReplayAdapter, whatever adapter is mounted, so no
+    request leaves the process.
+
+    Example usage: cassette = Cassette.load("benchmarks/home.json.gz")
+                   http = Http(saved_refresh_token="any",
+                               http_session=ReplaySession(cassette, latency=0.05))
+    """
+
+    def __init__(
+        self, cassette: Cassette, latency: float | None = 0.0, repeat: bool = True
+    ) -> None:
+        super().__init__()
+        self.adapter = ReplayAdapter(cassette, latency=latency, repeat=repeat)
+
+    def get_adapter(self, url: str) -> requests.adapters.BaseAdapter:
+        return self.adapter
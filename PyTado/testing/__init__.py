@@ -0,0 +1,5 @@
+"""Tools to test and benchmark clients of the Tado API without network access."""
+
+from .fake_server import FakeHome, FakeServerSession, FakeTadoServer
+
+__all__ = ["FakeHome", "FakeServerSession", "FakeTadoServer"]
@@ -0,0 +1,791 @@
+"""
+Local stand-in for the Tado API, to load and soak test clients without network access
+"""
+
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+
+from PyTado.http import _OAUTH_DEVICE_AUTHORIZE_URL, _OAUTH_TOKEN_URL, Endpoint, Http
+
+_TIMESTAMP = "2024-01-01T00:00:00.000Z"
+_NEXT_CHANGE = "2030-01-01T17:00:00Z"
+
+# the hosts rerouted to the server, longest prefix first
+_REROUTED = ("https://login.tado.com/", *sorted(Endpoint, key=len, reverse=True))
+
+
+@dataclass
+class FakeHome:
+    """A simulated home and its mutable state
+
+    id: home id
+    is_x_line: True for a tado X home served by HOPS_API, False for a MY_API home
+    zones: number of heating zones (rooms for tado X), numbered from 1
+    """
+
+    id: int
+    is_x_line: bool = False
+    zones: int = 3
+    presence: str = "HOME"
+    presence_locked: bool = False
+    # manual overlay (manual control for tado X) of the zones that have one
+    overlays: dict[int, dict[str, Any]] = field(default_factory=dict)
+
+    def inside_temperature(self, zone: int) -> float:
+        """Deterministic temperature of a zone, between 17.0 and 22.9"""
+        return 17.0 + (self.id * 7 + zone * 13) % 60 / 10
+
+
+@dataclass(frozen=True)
+class _Response:
+    status: int
+    body: Any = None
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+def _errors(status: int, code: str) -> _Response:
+    return _Response(status, {"errors": [{"code": code, "title": code}]})
+
+
+# ------------- JSON shapes of tests/fixtures -------------
+
+
+def _me(home: FakeHome) -> dict[str, Any]:
+    return {
+        "name": f"Home {home.id}",
+        "email": f"home-{home.id}@example.com",
+        "username": f"home-{home.id}@example.com",
+        "id": f"user{home.id}",
+        "homes": [{"id": home.id, "name": f"Home {home.id}"}],
+        "locale": "en_US",
+        "mobileDevices": [],
+    }
+
+
+def _home(home: FakeHome) -> dict[str, Any]:
+    data: dict[str, Any] = {
+        "id": home.id,
+        "name": f"Home {home.id}",
+        "dateTimeZone": "Europe/Berlin",
+        "dateCreated": _TIMESTAMP,
+        "temperatureUnit": "CELSIUS",
+        "partner": None,
+        "simpleSmartScheduleEnabled": True,
+        "awayRadiusInMeters": 400.0,
+        "installationCompleted": True,
+        "incidentDetection": {"supported": False, "enabled": True},
+        "zonesCount": home.zones,
+        "language": "en-US",
+        "skills": [],
+        "christmasModeEnabled": False,
+        "showAutoAssistReminders": True,
+        "consentGrantSkippable": True,
+        "enabledFeatures": [],
+        "isAirComfortEligible": False,
+        "isBalanceAcEligible": False,
+        "isEnergyIqEligible": True,
+        "isHeatSourceInstalled": False,
+        "isHeatPumpInstalled": False,
+    }
+    if home.is_x_line:
+        data["generation"] = "LINE_X"
+    return data
+
+
+def _zone(zone: int) -> dict[str, Any]:
+    return {
+        "id": zone,
+        "name": f"Zone {zone}",
+        "type": "HEATING",
+        "dateCreated": _TIMESTAMP,
+        "deviceTypes": ["VA02"],
+        "devices": [],
+        "reportAvailable": False,
+        "showScheduleSetup": False,
+        "supportsDazzle": True,
+        "dazzleEnabled": True,
+        "dazzleMode": {"supported": True, "enabled": True},
+        "openWindowDetection": {"supported": True},
+    }
+
+
+def _celsius(value: float) -> dict[str, float]:
+    return {"celsius": value, "fahrenheit": round(value * 9 / 5 + 32, 2)}
+
+
+def _zone_state(home: FakeHome, zone: int) -> dict[str, Any]:
+    schedule = {"type": "HEATING", "power": "ON", "temperature": _celsius(20.0)}
+    overlay = home.overlays.get(zone)
+
+    return {
+        "tadoMode": home.presence,
+        "geolocationOverride": False,
+        "geolocationOverrideDisableTime": None,
+        "preparation": None,
+        "setting": overlay["setting"] if overlay else schedule,
+        "overlayType": "MANUAL" if overlay else None,
+        "overlay": overlay,
+        "openWindow": None,
+        "nextScheduleChange": {"start": _NEXT_CHANGE, "setting": schedule},
+        "nextTimeBlock": {"start": _NEXT_CHANGE},
+        "link": {"state": "ONLINE"},
+        "activityDataPoints": {
+            "heatingPower": {
+                "type": "PERCENTAGE",
+                "percentage": 0.0,
+                "timestamp": _TIMESTAMP,
+            }
+        },
+        "sensorDataPoints": {
+            "insideTemperature": {
+                **_celsius(home.inside_temperature(zone)),
+                "timestamp": _TIMESTAMP,
+                "type": "TEMPERATURE",
+                "precision": {"celsius": 0.1, "fahrenheit": 0.1},
+            },
+            "humidity": {
+                "type": "PERCENTAGE",
+                "percentage": 45.0,
+                "timestamp": _TIMESTAMP,
+            },
+        },
+    }
+
+
+def _capabilities() -> dict[str, Any]:
+    return {
+        "type": "HEATING",
+        "temperatures": {
+            "celsius": {"min": 5, "max": 25, "step": 0.1},
+            "fahrenheit": {"min": 41, "max": 77, "step": 0.1},
+        },
+    }
+
+
+def _room_state(home: FakeHome, room: int) -> dict[str, Any]:
+    schedule = {"power": "ON", "temperature": {"value": 20.0}}
+    overlay = home.overlays.get(room)
+
+    return {
+        "id": room,
+        "name": f"Room {room}",
+        "sensorDataPoints": {
+            "insideTemperature": {"value": home.inside_temperature(room)},
+            "humidity": {"percentage": 45},
+        },
+        "setting": overlay["setting"] if overlay else schedule,
+        "manualControlTermination": overlay["termination"] if overlay else None,
+        "boostMode": None,
+        "heatingPower": {"percentage": 0},
+        "connection": {"state": "CONNECTED"},
+        "openWindow": None,
+        "nextScheduleChange": {"start": _NEXT_CHANGE, "setting": schedule},
+        "nextTimeBlock": {"start": _NEXT_CHANGE},
+        "balanceControl": None,
+    }
+
+
+def _rooms_and_devices(home: FakeHome) -> dict[str, Any]:
+    return {
+        "otherDevices": [],
+        "rooms": [
+            {
+                "deviceManualControlTermination": {
+                    "durationInSeconds": None,
+                    "type": "MANUAL",
+                },
+                "devices": [
+                    {
+                        "batteryState": "NORMAL",
+                        "childLockEnabled": False,
+                        "connection": {"state": "CONNECTED"},
+                        "firmwareVersion": "243.1",
+                        "mountingState": "CALIBRATED",
+                        "serialNumber": f"VA{home.id:06d}{room:04d}",
+                        "temperatureAsMeasured": home.inside_temperature(room),
+                        "temperatureOffset": 0.0,
+                        "type": "VA04",
+                    }
+                ],
+                "roomId": room,
+                "roomName": f"Room {room}",
+                "zoneControllerAssignable": False,
+                "zoneControllers": [],
+            }
+            for room in range(1, home.zones + 1)
+        ],
+    }
+
+
+def _running_times(home: FakeHome, day: str) -> dict[str, Any]:
+    zones = [
+        {"id": zone, "runningTimeInSeconds": 0} for zone in range(1, home.zones + 1)
+    ]
+    return {
+        "lastUpdated": _TIMESTAMP,
+        "runningTimes": [
+            {
+                "startTime": f"{day} 00:00:00",
+                "endTime": f"{day} 23:59:59",
+                "runningTimeInSeconds": 0,
+                "zones": zones,
+            }
+        ],
+        "summary": {
+            "startTime": f"{day} 00:00:00",
+            "endTime": f"{day} 23:59:59",
+            "meanInSecondsPerDay": 0,
+            "totalRunningTimeInSeconds": 0,
+        },
+    }
+
+
+# ------------- routes -------------
+
+
+@dataclass(frozen=True)
+class _Call:
+    """An authorized API call matched to a route"""
+
+    server: "FakeTadoServer"
+    home: FakeHome
+    match: re.Match[str]
+    body: Any
+    query: dict[str, list[str]]
+
+    @property
+    def zone(self) -> int:
+        return int(self.match["zone"])
+
+
+_Handler = Callable[[_Call], _Response]
+_ROUTES: list[tuple[str, str, re.Pattern[str], _Handler]] = []
+
+
+def _route(method: str, endpoint: str, pattern: str) -> Callable[[_Handler], _Handler]:
+    def register(handler: _Handler) -> _Handler:
+        _ROUTES.append((method, endpoint, re.compile(pattern), handler))
+        return handler
+
+    return register
+
+
+def _ok(body: Any = None) -> _Response:
+    return _Response(200 if body is not None else 204, body)
+
+
+@_route("GET", Endpoint.MY_API, r"me")
+def _get_me(call: _Call) -> _Response:
+    return _ok(_me(call.home))
+
+
+@_route("GET", Endpoint.MY_API, r"homes/(?P<home>\d+)/?")
+def _get_home(call: _Call) -> _Response:
+    return _ok(_home(call.home))
+
+
+@_route("GET", Endpoint.MY_API, r"homes/(?P<home>\d+)/state")
+def _get_home_state(call: _Call) -> _Response:
+    return _ok(
+        {"presence": call.home.presence, "presenceLocked": call.home.presence_locked}
+    )
+
+
+@_route("PUT", Endpoint.MY_API, r"homes/(?P<home>\d+)/presenceLock")
+def _lock_presence(call: _Call) -> _Response:
+    with call.server.lock:
+        call.home.presence = call.body["homePresence"]
+        call.home.presence_locked = True
+    return _ok()
+
+
+@_route("DELETE", Endpoint.MY_API, r"homes/(?P<home>\d+)/presenceLock")
+def _unlock_presence(call: _Call) -> _Response:
+    with call.server.lock:
+        call.home.presence_locked = False
+    return _ok()
+
+
+@_route("GET", Endpoint.MY_API, r"homes/(?P<home>\d+)/zones")
+def _get_zones(call: _Call) -> _Response:
+    return _ok([_zone(zone) for zone in range(1, call.home.zones + 1)])
+
+
+@_route("GET", Endpoint.MY_API, r"homes/(?P<home>\d+)/zoneStates")
+def _get_zone_states(call: _Call) -> _Response:
+    with call.server.lock:
+        return _ok(
+            {
+                "zoneStates": {
+                    str(zone): _zone_state(call.home, zone)
+                    for zone in range(1, call.home.zones + 1)
+                }
+            }
+        )
+
+
+@_route("GET", Endpoint.MY_API, r"homes/(?P<home>\d+)/zones/(?P<zone>\d+)/state")
+def _get_zone_state(call: _Call) -> _Response:
+    with call.server.lock:
+        return _ok(_zone_state(call.home, call.zone))
+
+
+@_route("GET", Endpoint.MY_API, r"homes/(?P<home>\d+)/zones/(?P<zone>\d+)/capabilities")
+def _get_capabilities(call: _Call) -> _Response:
+    return _ok(_capabilities())
+
+
+@_route(
+    "GET", Endpoint.MY_API, r"homes/(?P<home>\d+)/zones/(?P<zone>\d+)/defaultOverlay"
+)
+def _get_default_overlay(call: _Call) -> _Response:
+    return _ok({"terminationCondition": {"type": "MANUAL"}})
+
+
+def _overlay(body: dict[str, Any]) -> dict[str, Any]:
+    setting = dict(body["setting"])
+    if "temperature" in setting:
+        setting["temperature"] = _celsius(setting["temperature"]["celsius"])
+    return {
+        "type": "MANUAL",
+        "setting": setting,
+        "termination": {
+            "type": body["termination"]["typeSkillBasedApp"],
+            "typeSkillBasedApp": body["termination"]["typeSkillBasedApp"],
+            "projectedExpiry": None,
+        },
+    }
+
+
+@_route("PUT", Endpoint.MY_API, r"homes/(?P<home>\d+)/zones/(?P<zone>\d+)/overlay")
+def _set_overlay(call: _Call) -> _Response:
+    overlay = _overlay(call.body)
+    with call.server.lock:
+        call.home.overlays[call.zone] = overlay
+    return _ok(overlay)
+
+
+@_route("DELETE", Endpoint.MY_API, r"homes/(?P<home>\d+)/zones/(?P<zone>\d+)/overlay")
+def _reset_overlay(call: _Call) -> _Response:
+    with call.server.lock:
+        call.home.overlays.pop(call.zone, None)
+    return _ok()
+
+
+@_route("POST", Endpoint.MY_API, r"homes/(?P<home>\d+)/overlay")
+def _set_overlays(call: _Call) -> _Response:
+    overlays = {
+        item["room"]: _overlay(item["overlay"]) for item in call.body["overlays"]
+    }
+    with call.server.lock:
+        call.home.overlays.update(overlays)
+    return _ok()
+
+
+@_route("DELETE", Endpoint.MY_API, r"homes/(?P<home>\d+)/overlay")
+def _reset_overlays(call: _Call) -> _Response:
+    rooms = call.query.get("rooms", [""])[0].split(",")
+    with call.server.lock:
+        for room in filter(None, rooms):
+            call.home.overlays.pop(int(room), None)
+    return _ok()
+
+
+# TadoX.get_installation() requests the home without a command
+@_route("GET", Endpoint.HOPS_API, r"homes/(?P<home>\d+)/?(None)?")
+def _get_installation(call: _Call) -> _Response:
+    return _ok(
+        {
+            "id": call.home.id,
+            "name": f"Home {call.home.id}",
+            "roomCount": call.home.zones,
+            "isHeatSourceInstalled": False,
+            "isHeatPumpInstalled": False,
+            "supportsFlowTemperatureOptimization": False,
+        }
+    )
+
+
+@_route("GET", Endpoint.HOPS_API, r"homes/(?P<home>\d+)/roomsAndDevices")
+def _get_rooms_and_devices(call: _Call) -> _Response:
+    return _ok(_rooms_and_devices(call.home))
+
+
+@_route("GET", Endpoint.HOPS_API, r"homes/(?P<home>\d+)/rooms")
+def _get_rooms(call: _Call) -> _Response:
+    with call.server.lock:
+        return _ok(
+            [_room_state(call.home, room) for room in range(1, call.home.zones + 1)]
+        )
+
+
+@_route("GET", Endpoint.HOPS_API, r"homes/(?P<home>\d+)/rooms/(?P<zone>\d+)")
+def _get_room(call: _Call) -> _Response:
+    with call.server.lock:
+        return _ok(_room_state(call.home, call.zone))
+
+
+@_route(
+    "POST", Endpoint.HOPS_API, r"homes/(?P<home>\d+)/rooms/(?P<zone>\d+)/manualControl"
+)
+def _set_manual_control(call: _Call) -> _Response:
+    setting: dict[str, Any] = {"power": call.body["setting"]["power"]}
+    if "temperature" in call.body["setting"]:
+        setting["temperature"] = {"value": call.body["setting"]["temperature"]["value"]}
+    with call.server.lock:
+        call.home.overlays[call.zone] = {
+            "setting": setting,
+            "termination": {
+                "type": call.body["termination"]["type"],
+                "remainingTimeInSeconds": call.body["termination"].get(
+                    "durationInSeconds"
+                ),
+                "projectedExpiry": None,
+            },
+        }
+    return _ok()
+
+
+@_route(
+    "POST", Endpoint.HOPS_API, r"homes/(?P<home>\d+)/rooms/(?P<zone>\d+)/resumeSchedule"
+)
+def _resume_schedule(call: _Call) -> _Response:
+    with call.server.lock:
+        call.home.overlays.pop(call.zone, None)
+    return _ok()
+
+
+@_route("GET", Endpoint.MINDER, r"homes/(?P<home>\d+)/runningTimes")
+def _get_running_times(call: _Call) -> _Response:
+    return _ok(_running_times(call.home, call.query.get("from", ["2024-01-01"])[0]))
+
+
+@_route("GET", Endpoint.EIQ, r"homes/(?P<home>\d+)/tariffs")
+def _get_tariffs(call: _Call) -> _Response:
+    return _ok([])
+
+
+@_route("GET", Endpoint.EIQ, r"homes/(?P<home>\d+)/meterReadings")
+def _get_meter_readings(call: _Call) -> _Response:
+    return _ok({"homeId": call.home.id, "readings": []})
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "_HTTPServer"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        return None
+
+    def _handle(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        # the path is the URL of the Tado API without its scheme, see FakeTadoServer
+        url = f"https://{self.path.lstrip('/')}"
+
+        response = self.server.fake.handle(
+            self.command, url, self.headers.get("Authorization"), body
+        )
+
+        content = b"" if response.body is None else json.dumps(response.body).encode()
+        self.send_response(response.status)
+        for key, value in response.headers.items():
+            self.send_header(key, value)
+        if content:
+            self.send_header("Content-Type", "application/json;charset=UTF-8")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_POST = do_PUT = do_DELETE = do_PATCH = _handle
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+    fake: "FakeTadoServer"
+
+
+class FakeServerSession(requests.Session):
+    """Session sending the requests for the Tado hosts to a FakeTadoServer"""
+
+    def __init__(self, base_url: str) -> None:
+        super().__init__()
+        self._base_url = base_url
+        # never send the local requests through a proxy of the environment
+        self.trust_env = False
+
+    def send(
+        self, request: requests.PreparedRequest, **kwargs: Any
+    ) -> requests.Response:
+        url = str(request.url)
+        if url.startswith(_REROUTED):
+            request = request.copy()
+            request.url = f"{self._base_url}/{url.removeprefix('https://')}"
+        return super().send(request, **kwargs)
+
+
+class FakeTadoServer:
+    """Local HTTP server emulating the Tado API for many simulated homes
+
+    Serves MY_API, HOPS_API, MINDER and EIQ with the JSON shapes of tests/fixtures, and
+    the OAuth device flow and token refresh of login.tado.com. Writes (overlays, manual
+    control, presence) change the state served afterwards. Clients reach it through
+    the session returned by session(), which reroutes the Tado URLs to the server.
+
+    Every account has one home: the refresh token of refresh_token(home_id) logs into
+    it, and the device flows are assigned the homes in turn.
+
+    Args:
+        homes (Iterable[FakeHome] | int): The homes, or a number of pre tado X homes
+            numbered from 1.
+        latency (float): Seconds every API response is delayed.
+        jitter (float): Up to this many seconds are added to the latency at random.
+        error_rate (float): Share of the API calls answered with error_status.
+        error_status (int): Status code of the injected errors, 503 by default, which
+            Http retries.
+        rate_limit_rate (float): Share of the API calls answered with a 429 and rate
+            limit headers.
+        retry_after (int): Seconds of the Retry-After header of the 429 responses.
+        device_flow_polls (int): Polls of a device flow answered with
+            authorization_pending before it is authorized.
+        seed (int | None): Seed of the injected latency and errors.
+
+    Example usage: with FakeTadoServer(homes=1000, latency=0.05, error_rate=0.01) as server:
+                       tado = Tado.from_http(server.http(home_id=42))
+                       tado.get_zone_states()
+    """
+
+    def __init__(
+        self,
+        homes: Iterable[FakeHome] | int = 1,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        rate_limit_rate: float = 0.0,
+        retry_after: int = 1,
+        device_flow_polls: int = 0,
+        seed: int | None = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        if isinstance(homes, int):
+            homes = [FakeHome(id=home_id) for home_id in range(1, homes + 1)]
+        self.homes: dict[int, FakeHome] = {home.id: home for home in homes}
+        if not self.homes:
+            raise ValueError("FakeTadoServer needs at least one home")
+
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.device_flow_polls = device_flow_polls
+
+        self.lock = threading.Lock()
+        self._random = random.Random(seed)  # nosec B311
+        self._tokens = 0
+        self._device_flows: dict[str, int] = {}
+        self._status_counts: Counter[int] = Counter()
+
+        self._server = _HTTPServer((host, port), _RequestHandler)
+        self._server.fake = self
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def start(self) -> None:
+        """Serve in a background thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever, name="FakeTadoServer", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving and close the socket"""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeTadoServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def session(self) -> FakeServerSession:
+        """Return a new session for the http_session of Http, Tado or TadoX"""
+        return FakeServerSession(self.url)
+
+    @staticmethod
+    def refresh_token(home_id: int) -> str:
+        """Return a refresh token logging into the account of a home"""
+        return f"refresh-{home_id}"
+
+    def http(self, home_id: int, **kwargs: Any) -> Http:
+        """Return an Http client logged into the account of a home"""
+        return Http(
+            saved_refresh_token=self.refresh_token(home_id),
+            http_session=self.session(),
+            **kwargs,
+        )
+
+    def status_counts(self) -> dict[int, int]:
+        """Return the number of responses sent per status code"""
+        with self.lock:
+            return dict(self._status_counts)
+
+    def handle(
+        self, method: str, url: str, authorization: str | None, body: bytes
+    ) -> _Response:
+        """Answer an API call, url is the URL the client requested"""
+        response = self._dispatch(method, url, authorization, body)
+        with self.lock:
+            self._status_counts[response.status] += 1
+        return response
+
+    def _dispatch(
+        self, method: str, url: str, authorization: str | None, body: bytes
+    ) -> _Response:
+        parts = urlsplit(url)
+        path = f"{parts.scheme}://{parts.netloc}{parts.path}"
+        query = parse_qs(parts.query)
+
+        if path == _OAUTH_DEVICE_AUTHORIZE_URL and method == "POST":
+            return self._device_authorize()
+        if path == _OAUTH_TOKEN_URL and method == "POST":
+            return self._token(query)
+
+        home = self._authorized_home(authorization)
+        if home is None:
+            return _errors(401, "unauthorized")
+
+        delay, injected = self._inject()
+        if delay > 0:
+            time.sleep(delay)
+        if injected is not None:
+            return injected
+
+        try:
+            payload = json.loads(body) if body else None
+        except ValueError:
+            payload = None
+
+        for route_method, endpoint, pattern, handler in _ROUTES:
+            if route_method != method or not path.startswith(endpoint):
+                continue
+            match = pattern.fullmatch(path.removeprefix(endpoint))
+            if match is None:
+                continue
+            if "home" in match.groupdict() and int(match["home"]) != home.id:
+                return _errors(403, "accessDenied")
+            if (
+                "zone" in match.groupdict()
+                and not 1 <= int(match["zone"]) <= home.zones
+            ):
+                return _errors(404, "notFound")
+            try:
+                return handler(_Call(self, home, match, payload, query))
+            except (KeyError, TypeError):
+                return _errors(422, "invalidPayload")
+
+        return _errors(404, "notFound")
+
+    def _inject(self) -> tuple[float, _Response | None]:
+        with self.lock:
+            delay = self.latency + (
+                self._random.uniform(0, self.jitter) if self.jitter else 0
+            )
+            draw = self._random.random()
+
+        if draw < self.rate_limit_rate:
+            return delay, _Response(
+                429,
+                {"errors": [{"code": "tooManyRequests"}]},
+                {
+                    "Retry-After": str(self.retry_after),
+                    "X-RateLimit-Limit": "100",
+                    "X-RateLimit-Remaining": "0",
+                    "X-RateLimit-Reset": str(self.retry_after),
+                },
+            )
+        if draw < self.rate_limit_rate + self.error_rate:
+            return delay, _errors(self.error_status, "serverError")
+        return delay, None
+
+    def _authorized_home(self, authorization: str | None) -> FakeHome | None:
+        match = re.fullmatch(r"Bearer access-(\d+)-\d+", authorization or "")
+        return None if match is None else self.homes.get(int(match[1]))
+
+    def _tokens_of(self, home: FakeHome) -> _Response:
+        with self.lock:
+            self._tokens += 1
+            token = self._tokens
+        return _ok(
+            {
+                "access_token": f"access-{home.id}-{token}",
+                "expires_in": 600,
+                "refresh_token": self.refresh_token(home.id),
+                "token_type": "Bearer",
+            }
+        )
+
+    def _device_authorize(self) -> _Response:
+        with self.lock:
+            flow = len(self._device_flows)
+            homes = list(self.homes)
+            device_code = f"device-{homes[flow % len(homes)]}-{flow}"
+            self._device_flows[device_code] = 0
+
+        return _ok(
+            {
+                "device_code": device_code,
+                "user_code": f"FAKE{flow}",
+                "verification_uri": "https://login.tado.com/oauth2/device",
+                "expires_in": 300,
+                "interval": 0,
+            }
+        )
+
+    def _token(self, query: dict[str, list[str]]) -> _Response:
+        grant = query.get("grant_type", [""])[0]
+
+        if grant == "refresh_token":
+            match = re.fullmatch(r"refresh-(\d+)", query.get("refresh_token", [""])[0])
+            home = None if match is None else self.homes.get(int(match[1]))
+            if home is None:
+                return _Response(400, {"error": "invalid_grant"})
+            return self._tokens_of(home)
+
+        device_code = query.get("device_code", [""])[0]
+        with self.lock:
+            polls = self._device_flows.get(device_code)
+            if polls is not None:
+                self._device_flows[device_code] = polls + 1
+
+        if polls is None:
+            return _Response(400, {"error": "invalid_grant"})
+        if polls < self.device_flow_polls:
+            return _Response(400, {"error": "authorization_pending"})
+        return self._tokens_of(self.homes[int(device_code.split("-")[1])])
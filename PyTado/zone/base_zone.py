@@ -67,6 +67,8 @@ class BaseZone:
 
     _home: "Tado | TadoX"
     _http: Http
+    # the cached state holds a change of this client that no read has confirmed yet
+    _provisional: bool = False
 
     def __init__(self, home: "Tado | TadoX", id: int):
         """Initialize a new BaseZone instance.
@@ -79,6 +81,17 @@ class BaseZone:
         self._http = home._http  # type: ignore
         self._id = id
 
+    @property
+    def id(self) -> int:
+        """The unique identifier of the zone/room"""
+        return self._id
+
+    @property
+    def provisional(self) -> bool:
+        """True while the state shows a change sent by this client, computed locally
+        instead of read from the API. It is read from the API again after update()."""
+        return self._provisional
+
     def update(self) -> None:
         """Force update of the zone's cached state.
 
@@ -86,15 +99,42 @@ class BaseZone:
         fetch on the next access. This is useful when the zone's state
         might have changed externally.
         """
+        self._invalidate_state()
         try:
-            del self._raw_state
+            del self._raw_room
         except AttributeError:
             pass
+
+    def _invalidate_state(self) -> None:
+        """Drop the cached state after a change, the next read fetches it again"""
+        self._provisional = False
         try:
-            del self._raw_room
+            del self._raw_state
         except AttributeError:
             pass
 
+    def _load_state(self, state: line_x.RoomState | pre_line_x.ZoneState) -> None:
+        """Cache a state read from the API, e.g. with the states of all zones"""
+        self._raw_state = state
+        self._provisional = False
+        self._state_loaded()
+
+    def _state_loaded(self) -> None:
+        """Mark the cached state as fresh in the zone objects of the home"""
+        self._home._zone_map.touch(self._id, self)
+
+    def _apply_state(self, **changes: Any) -> None:
+        """Apply a change sent to the API to the cached state, marked provisional
+
+        Without a cached state there is nothing to change, the next read fetches it.
+        """
+        state = self.__dict__.get("_raw_state")
+        if state is None:
+            return
+        self._raw_state = state.model_copy(update=changes)
+        self._provisional = True
+        self._state_loaded()
+
     @cached_property
     @abstractmethod
     def _raw_state(self) -> line_x.RoomState | pre_line_x.ZoneState:
@@ -339,7 +379,7 @@ class BaseZone:
         request.command = (
             f"zones/{self._id:d}/dayReport?date={day_report_date.strftime('%Y-%m-%d')}"
         )
-        return Historic.model_validate(self._http.request(request))
+        return self._http.request_model(request, Historic)
 
     @overload
     def get_schedule(
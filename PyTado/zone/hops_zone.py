@@ -3,7 +3,7 @@ Adapter to represent a tado zones and state for hops.tado.com (Tado X) API.
 """
 
 import logging
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from functools import cached_property
 from typing import TYPE_CHECKING, Any, final, overload
 
@@ -12,8 +12,13 @@ from PyTado.exceptions import TadoException
 from PyTado.http import Action, Mode, TadoXRequest
 from PyTado.models import pre_line_x
 from PyTado.models.home import HomeState
-from PyTado.models.line_x.device import Device, DevicesResponse, DevicesRooms
-from PyTado.models.line_x.room import RoomState
+from PyTado.models.line_x.device import Device, DevicesRooms
+from PyTado.models.line_x.room import (
+    InsideTemperature,
+    ManualControlTermination,
+    RoomState,
+    Setting,
+)
 from PyTado.models.line_x.schedule import Schedule as ScheduleX
 from PyTado.models.line_x.schedule import SetSchedule
 from PyTado.models.pre_line_x.schedule import Schedule
@@ -57,21 +62,13 @@ class TadoRoom(BaseZone):
         print("Getting room state for room %s", self._id)
         request = TadoXRequest()
         request.command = f"rooms/{self._id:d}"
-        data = self._http.request(request)
-
-        return RoomState.model_validate(data)
+        state = self._http.request_model(request, RoomState)
+        self._state_loaded()
+        return state
 
     @cached_property
     def _raw_room(self) -> DevicesRooms:
-        print("Getting room data for room %s", self._id)
-        request = TadoXRequest()
-        request.command = "roomsAndDevices"
-
-        rooms_and_devices = DevicesResponse.model_validate(self._http.request(request))
-
-        room = next(
-            filter(lambda x: x.room_id == self._id, rooms_and_devices.rooms), None
-        )
+        room = self._home._zone_metadata.get(self._id)
         if room is None:
             raise TadoException(
                 f"Room {self._id} not found in roomsAndDevices response"
@@ -252,7 +249,7 @@ class TadoRoom(BaseZone):
         request = TadoXRequest()
         request.command = f"rooms/{self._id:d}/schedule"
 
-        return ScheduleX.model_validate(self._http.request(request))
+        return self._http.request_model(request, ScheduleX)
 
     @overload
     def set_schedule(
@@ -275,6 +272,7 @@ class TadoRoom(BaseZone):
             request.payload = data.model_dump(by_alias=True, exclude_defaults=True)
             request.mode = Mode.OBJECT
             self._http.request(request)
+            self._invalidate_state()
             return None
         raise TadoException("Invalid data type for set_schedule for Tado X API")
 
@@ -288,6 +286,8 @@ class TadoRoom(BaseZone):
         request.action = Action.SET
 
         self._http.request(request)
+        # the setting of the schedule is only known after the next read
+        self._apply_state(manual_control_termination=None, boost_mode=None)
 
     @overload
     def set_zone_overlay(
@@ -331,6 +331,63 @@ class TadoRoom(BaseZone):
         vertical_swing: VerticalSwing | None = None,
         horizontal_swing: HorizontalSwing | None = None,
     ) -> None | dict[str, Any]:
+        post_data = self._build_overlay_payload(
+            overlay_mode=overlay_mode,
+            set_temp=set_temp,
+            duration=duration,
+            power=power,
+            is_boost=is_boost,
+        )
+
+        request = TadoXRequest()
+        request.command = f"rooms/{self._id:d}/manualControl"
+        request.action = Action.SET
+        request.payload = post_data
+
+        self._http.request(request)
+
+        termination = ManualControlTermination(
+            type=overlay_mode,
+            remaining_time_in_seconds=(
+                None if duration is None else round(duration.total_seconds())
+            ),
+            projected_expiry=(
+                None if duration is None else datetime.now(UTC) + duration
+            ),
+        )
+        if is_boost:
+            self._apply_state(
+                setting=Setting(power=power),
+                manual_control_termination=None,
+                boost_mode=termination,
+            )
+        else:
+            self._apply_state(
+                setting=Setting(
+                    power=power,
+                    temperature=(
+                        None
+                        if set_temp is None or power == Power.OFF
+                        else InsideTemperature(value=set_temp)
+                    ),
+                ),
+                manual_control_termination=termination,
+                boost_mode=None,
+            )
+        return None
+
+    @staticmethod
+    def _build_overlay_payload(
+        overlay_mode: OverlayMode,
+        set_temp: float | None = None,
+        duration: timedelta | None = None,
+        power: Power = Power.ON,
+        is_boost: bool | None = None,
+    ) -> dict[str, Any]:
+        """
+        Build the manual control payload for a room
+        """
+
         post_data: dict[str, Any] = {
             "setting": {"power": power},
             "termination": {"type": overlay_mode},
@@ -351,10 +408,4 @@ class TadoRoom(BaseZone):
                 duration.total_seconds()
             )
 
-        request = TadoXRequest()
-        request.command = f"rooms/{self._id:d}/manualControl"
-        request.action = Action.SET
-        request.payload = post_data
-
-        self._http.request(request)
-        return None
+        return post_data
@@ -0,0 +1,205 @@
+"""
+Caches of a home shared by its zone (room) objects: the metadata (name, type, devices)
+of the zones, and the zone objects themselves
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from PyTado.zone.base_zone import BaseZone  # pragma: no cover
+
+_M = TypeVar("_M")
+_Z = TypeVar("_Z", bound="BaseZone")
+
+
+class ZoneMetadataCache(Generic[_M]):
+    """Metadata of the zones (rooms for Tado X) of a home by id, fetched at most once per ttl
+
+    All zone objects of a home read their metadata from the cache of the home, so
+    iterating the zones fetches the zone list once instead of once per zone. Concurrent
+    readers of an expired cache wait for a single fetch.
+
+    fetch: returns the metadata of all zones of the home by zone id
+    ttl: seconds the fetched metadata is used before it is fetched again
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], Mapping[int, _M]],
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._fetch = fetch
+        self._ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._zones: Mapping[int, _M] = {}
+        self._unknown: set[int] = set()
+        self._expiry = float("-inf")
+
+    def _refresh(self) -> None:
+        self._zones = self._fetch()
+        self._unknown = set()
+        self._expiry = self._clock() + self._ttl
+
+    def get(self, zone: int) -> _M | None:
+        """Return the metadata of a zone, None if the home has no such zone
+
+        An unknown zone triggers a fetch, as the zone may have been added since, unless
+        the metadata was just fetched. A zone that is still unknown after the fetch is
+        not fetched for again until the metadata expires.
+        """
+        with self._lock:
+            fetched = self._expiry <= self._clock()
+            if fetched:
+                self._refresh()
+
+            metadata = self._zones.get(zone)
+            if metadata is None and not fetched and zone not in self._unknown:
+                self._refresh()
+                metadata = self._zones.get(zone)
+            if metadata is None:
+                self._unknown.add(zone)
+
+        return metadata
+
+    def put(self, zones: Mapping[int, _M]) -> None:
+        """Replace the cached metadata with metadata fetched elsewhere"""
+        with self._lock:
+            self._zones = dict(zones)
+            self._unknown = set()
+            self._expiry = self._clock() + self._ttl
+
+    def invalidate(self) -> None:
+        """Drop the cached metadata, the next read fetches it again"""
+        with self._lock:
+            self._zones = {}
+            self._unknown = set()
+            self._expiry = float("-inf")
+
+
+class AsyncZoneMetadataCache(Generic[_M]):
+    """Metadata of the zones of a home by id for the asyncio API, see ZoneMetadataCache
+
+    fetch: coroutine function returning the metadata of all zones of the home by zone id
+    ttl: seconds the fetched metadata is used before it is fetched again
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], Awaitable[Mapping[int, _M]]],
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._fetch = fetch
+        self._ttl = ttl
+        self._clock = clock
+        self._lock = asyncio.Lock()
+        self._zones: Mapping[int, _M] = {}
+        self._unknown: set[int] = set()
+        self._expiry = float("-inf")
+
+    async def _refresh(self) -> None:
+        self._zones = await self._fetch()
+        self._unknown = set()
+        self._expiry = self._clock() + self._ttl
+
+    async def get(self, zone: int) -> _M | None:
+        """Return the metadata of a zone, None if the home has no such zone
+
+        An unknown zone triggers a fetch, as the zone may have been added since, unless
+        the metadata was just fetched. A zone that is still unknown after the fetch is
+        not fetched for again until the metadata expires.
+        """
+        async with self._lock:
+            fetched = self._expiry <= self._clock()
+            if fetched:
+                await self._refresh()
+
+            metadata = self._zones.get(zone)
+            if metadata is None and not fetched and zone not in self._unknown:
+                await self._refresh()
+                metadata = self._zones.get(zone)
+            if metadata is None:
+                self._unknown.add(zone)
+
+        return metadata
+
+    def put(self, zones: Mapping[int, _M]) -> None:
+        """Replace the cached metadata with metadata fetched elsewhere"""
+        self._zones = dict(zones)
+        self._unknown = set()
+        self._expiry = self._clock() + self._ttl
+
+    def invalidate(self) -> None:
+        """Drop the cached metadata, the next read fetches it again"""
+        self._zones = {}
+        self._unknown = set()
+        self._expiry = float("-inf")
+
+
+class ZoneIdentityMap(Generic[_Z]):
+    """The zone objects of a home by id, one object per zone shared by all callers
+
+    The state a zone object caches is shared as well, so repeated calls through the home
+    do not fetch it again. A zone handed out again more than max_age seconds after it
+    was last updated, or its state last loaded, is updated first, so state read through
+    the home is never older than max_age.
+
+    factory: creates the zone object of a zone id
+    max_age: seconds after which a zone object is updated before it is handed out again
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[int], _Z],
+        max_age: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._factory = factory
+        self._max_age = max_age
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._zones: dict[int, tuple[float, _Z]] = {}
+
+    def get(self, zone: int) -> _Z:
+        """Return the object of a zone, created on first use"""
+        with self._lock:
+            now = self._clock()
+            entry = self._zones.get(zone)
+            if entry is None:
+                instance = self._factory(zone)
+            else:
+                updated, instance = entry
+                if now - updated < self._max_age:
+                    return instance
+                instance.update()
+
+            self._zones[zone] = (now, instance)
+            return instance
+
+    def touch(self, zone: int, instance: object) -> None:
+        """Restart the max age of a zone object, e.g. after its state was loaded"""
+        with self._lock:
+            entry = self._zones.get(zone)
+            if entry is not None and entry[1] is instance:
+                self._zones[zone] = (self._clock(), instance)
+
+    def invalidate(self, zones: Iterable[int] | None = None) -> None:
+        """Update the objects of the zones, of all zones by default
+
+        The next read of their state fetches it again. Zones without an object are
+        skipped.
+        """
+        with self._lock:
+            now = self._clock()
+            selected = list(self._zones) if zones is None else zones
+            for zone in selected:
+                entry = self._zones.get(zone)
+                if entry is not None:
+                    entry[1].update()
+                    self._zones[zone] = (now, entry[1])
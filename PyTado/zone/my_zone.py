@@ -3,9 +3,11 @@ Adapter to represent a tado zones and state for my.tado.com API.
 """
 
 import logging
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from functools import cached_property
-from typing import Any, final, overload
+from typing import TYPE_CHECKING, Any, final, overload
+
+from pydantic import ValidationError
 
 from PyTado.const import (
     FAN_SPEED_TO_FAN_LEVEL,
@@ -15,7 +17,12 @@ from PyTado.exceptions import TadoException
 from PyTado.http import Action, Mode, TadoRequest
 from PyTado.models import line_x, pre_line_x
 from PyTado.models.pre_line_x.schedule import Schedule, Schedules
-from PyTado.models.pre_line_x.zone import Capabilities, ZoneControl
+from PyTado.models.pre_line_x.zone import (
+    Capabilities,
+    OpenWindow,
+    Overlay,
+    ZoneControl,
+)
 from PyTado.types import (
     DayType,
     FanLevel,
@@ -33,6 +40,9 @@ from PyTado.types import (
 )
 from PyTado.zone.base_zone import BaseZone
 
+if TYPE_CHECKING:
+    from PyTado.interface.api.my_tado import Tado  # pragma: no cover
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -40,22 +50,20 @@ _LOGGER = logging.getLogger(__name__)
 class TadoZone(BaseZone):
     """Tado Zone data structure for my.tado.com."""
 
+    _home: "Tado"
+
     @cached_property
     def _raw_state(self) -> pre_line_x.ZoneState:
         request = TadoRequest()
         request.command = f"zones/{self._id}/state"
 
-        return pre_line_x.ZoneState.model_validate(self._http.request(request))
+        state = self._http.request_model(request, pre_line_x.ZoneState)
+        self._state_loaded()
+        return state
 
     @cached_property
     def _raw_room(self) -> pre_line_x.Zone:
-        request = TadoRequest()
-        request.command = "zones"
-
-        zones = [
-            pre_line_x.Zone.model_validate(zone) for zone in self._http.request(request)
-        ]
-        zone = next(filter(lambda z: z.id == self._id, zones), None)
+        zone = self._home._zone_metadata.get(self._id)
         if zone is None:
             raise TadoException(f"Zone with id {self._id} not found")
 
@@ -183,7 +191,7 @@ class TadoZone(BaseZone):
         request = TadoRequest()
         request.command = f"zones/{self._id}/defaultOverlay"
 
-        return pre_line_x.ZoneOverlayDefault.model_validate(self._http.request(request))
+        return self._http.request_model(request, pre_line_x.ZoneOverlayDefault)
 
     @property
     def default_overlay_termination_type(self) -> OverlayMode:
@@ -295,7 +303,7 @@ class TadoZone(BaseZone):
         request = TadoRequest()
         request.command = f"zones/{self._id:d}/capabilities"
 
-        return Capabilities.model_validate(self._http.request(request))
+        return self._http.request_model(request, Capabilities)
 
     def get_timetable(self) -> Timetable:
         """
@@ -342,7 +350,7 @@ class TadoZone(BaseZone):
             )
         request.mode = Mode.PLAIN
 
-        return Schedules.validate_python(self._http.request(request))
+        return self._http.request_model(request, Schedules)
 
     @overload
     def set_schedule(
@@ -369,7 +377,9 @@ class TadoZone(BaseZone):
             )
             request.action = Action.CHANGE
             request.payload = [schedule.model_dump(by_alias=True) for schedule in data]
-            return [Schedule.model_validate(s) for s in self._http.request(request)]
+            schedules = Schedules.validate_python(self._http.request(request))
+            self._invalidate_state()
+            return schedules
         raise TadoException("Invalid data type for set_schedule for pre line x")
 
     def reset_zone_overlay(self) -> None:
@@ -383,6 +393,12 @@ class TadoZone(BaseZone):
         request.mode = Mode.PLAIN
 
         self._http.request(request)
+        self._apply_overlay_reset()
+
+    def _apply_overlay_reset(self) -> None:
+        """Clear the overlay of the cached state after it was deleted"""
+        # the setting of the schedule is only known after the next read
+        self._apply_state(overlay=None, overlay_type=None)
 
     @overload
     def set_zone_overlay(
@@ -426,8 +442,84 @@ class TadoZone(BaseZone):
         vertical_swing: VerticalSwing | None = None,
         horizontal_swing: HorizontalSwing | None = None,
     ) -> None | dict[str, Any] | list[Any] | str:
+        post_data = self._build_overlay_payload(
+            zone_type=device_type or self._raw_room.type,
+            overlay_mode=overlay_mode,
+            set_temp=set_temp,
+            duration=duration,
+            power=power,
+            mode=mode,
+            fan_speed=fan_speed,
+            swing=swing,
+            fan_level=fan_level,
+            vertical_swing=vertical_swing,
+            horizontal_swing=horizontal_swing,
+        )
+
+        request = TadoRequest()
+        request.command = f"zones/{self._id:d}/overlay"
+        request.action = Action.CHANGE
+        request.payload = post_data
+
+        response = self._http.request(request)
+        self._apply_overlay(response, post_data, overlay_mode, duration)
+        return response
+
+    def _apply_overlay(
+        self,
+        response: Any,
+        post_data: dict[str, Any],
+        overlay_mode: OverlayMode,
+        duration: timedelta | None,
+    ) -> None:
+        """Apply the overlay the API returned, or the one sent, to the cached state"""
+
+        if isinstance(response, dict) and "setting" in response:
+            overlay_data = response
+        else:
+            termination: dict[str, Any] = {
+                "type": overlay_mode,
+                "typeSkillBasedApp": overlay_mode,
+            }
+            if duration is not None:
+                termination["remainingTimeInSeconds"] = round(duration.total_seconds())
+                termination["projectedExpiry"] = datetime.now(UTC) + duration
+            overlay_data = {
+                "type": OverlayMode.MANUAL,
+                "setting": post_data["setting"],
+                "termination": termination,
+            }
+
+        try:
+            overlay = Overlay.model_validate(overlay_data)
+        except ValidationError:
+            self._invalidate_state()
+            return
+
+        self._apply_state(
+            setting=overlay.setting, overlay=overlay, overlay_type=overlay.type
+        )
+
+    @staticmethod
+    def _build_overlay_payload(
+        zone_type: ZoneType,
+        overlay_mode: OverlayMode,
+        set_temp: float | None = None,
+        duration: timedelta | None = None,
+        power: Power = Power.ON,
+        mode: HvacMode | None = None,
+        fan_speed: FanSpeed | None = None,
+        swing: Any = None,
+        fan_level: FanLevel | None = None,
+        vertical_swing: VerticalSwing | None = None,
+        horizontal_swing: HorizontalSwing | None = None,
+    ) -> dict[str, Any]:
+        """
+        Build the overlay payload for a zone of the given type
+        """
+
         post_data: dict[str, Any] = {
-            "setting": {"type": device_type or self._raw_room.type, "power": power},
+            "setting": {"type": zone_type, "power": power},
             "termination": {"typeSkillBasedApp": overlay_mode},
         }
 
@@ -451,12 +543,7 @@ class TadoZone(BaseZone):
         if duration is not None:
             post_data["termination"]["durationInSeconds"] = duration.total_seconds()
 
-        request = TadoRequest()
-        request.command = f"zones/{self._id:d}/overlay"
-        request.action = Action.CHANGE
-        request.payload = post_data
-
-        return self._http.request(request)
+        return post_data
 
     def set_open_window(self) -> None:
         """
@@ -471,6 +558,21 @@ class TadoZone(BaseZone):
 
         self._http.request(request)
 
+        if "_raw_state" not in self.__dict__:
+            # nothing to update, and reading the timeout would fetch the zones
+            return
+
+        timeout = self._raw_room.open_window_detection.timeout_in_seconds
+        now = datetime.now(UTC)
+        self._apply_state(
+            open_window=OpenWindow(
+                detected_time=now,
+                duration_in_seconds=timeout,
+                expiry=now + timedelta(seconds=timeout),
+                remaining_time_in_seconds=timeout,
+            )
+        )
+
     def reset_open_window(self) -> None:
         """
         Sets the window in zone to closed
@@ -482,6 +584,7 @@ class TadoZone(BaseZone):
         request.mode = Mode.PLAIN
 
         self._http.request(request)
+        self._apply_state(open_window=None)
 
     def get_zone_control(self) -> ZoneControl:
         """
@@ -491,7 +594,7 @@ class TadoZone(BaseZone):
         request = TadoRequest()
         request.command = f"zones/{self._id:d}/control"
 
-        return ZoneControl.model_validate(self._http.request(request))
+        return self._http.request_model(request, ZoneControl)
 
     def set_zone_heating_circuit(self, heating_circuit: int) -> ZoneControl:
         """
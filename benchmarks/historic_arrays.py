@@ -0,0 +1,82 @@
+"""
+Benchmark of Historic.to_arrays() against reading the data points of the models, for
+the inside temperature of a year of day reports.
+
+Validates the given number of day reports and collects the timestamps and the inside
+temperature of all of them, from the models into lists, and with to_arrays() from lazily
+validated reports into NumPy arrays. Reports the CPU time and the peak memory allocated
+for all reports. Requires numpy.
+
+Usage: python benchmarks/historic_arrays.py [number of day reports]
+"""
+
+import json
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+
+from PyTado.models import Historic
+from PyTado.models.util import LOGGER, lazy_validation
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures")
+
+
+def _from_models(reports: list[bytes]) -> Any:
+    timestamps, celsius = [], []
+    for report in reports:
+        points = Historic.model_validate_json(report).measured_data.inside_temperature
+        for point in points.data_points or []:
+            timestamps.append(point.timestamp)
+            celsius.append(point.value.celsius)
+    return timestamps, celsius
+
+
+def _to_arrays(reports: list[bytes]) -> Any:
+    with lazy_validation():
+        arrays = [
+            Historic.model_validate_json(report).to_arrays().inside_temperature
+            for report in reports
+        ]
+    return (
+        np.concatenate([array.timestamps for array in arrays]),
+        np.concatenate([array.values for array in arrays]),
+    )
+
+
+def _measure(call: Callable[[], Any]) -> tuple[float, int]:
+    """Return the CPU seconds and the peak bytes allocated of a call"""
+    started = time.process_time()
+    call()
+    cpu = time.process_time() - started
+
+    tracemalloc.start()
+    call()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return cpu, peak
+
+
+def main() -> None:
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else 365
+    LOGGER.setLevel(logging.WARNING)
+
+    with open(
+        os.path.join(FIXTURES, "history.zone_day_report.json"), encoding="utf-8"
+    ) as f:
+        report = json.dumps(json.load(f)).encode()
+    reports = [report] * days
+
+    print(f"inside temperature of {days} day reports")
+    for label, read in (("models", _from_models), ("to_arrays", _to_arrays)):
+        cpu, peak = _measure(lambda: read(reports))
+        print(f"{label:>10}: {cpu * 1e3:8.1f} ms CPU, {peak / 2**20:8.1f} MiB peak")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark of lazy validation (see PyTado.models.util.lazy_validation) against eager
+validation, for a caller reading a few fields of large responses.
+
+Validates the states of a home with the given number of zones and reads the inside
+temperature, the target temperature and the heating power of every zone, and validates
+the day report of a zone and reads its interval and measured inside temperature. Reports
+the CPU time and the peak memory allocated per call.
+
+Usage: python benchmarks/lazy.py [number of zones]
+"""
+
+import json
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from PyTado.models import Historic
+from PyTado.models.pre_line_x.zone import ZoneStatesResponse
+from PyTado.models.util import LOGGER, lazy_validation
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures")
+
+
+def _load(fixture: str) -> Any:
+    with open(os.path.join(FIXTURES, fixture), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _read_zone_states(body: bytes) -> list[Any]:
+    states = ZoneStatesResponse.model_validate_json(body).zone_states
+    return [
+        (
+            state.sensor_data_points.inside_temperature,
+            state.setting.temperature,
+            state.activity_data_points.heating_power,
+        )
+        for state in states.values()
+    ]
+
+
+def _read_day_report(body: bytes) -> Any:
+    report = Historic.model_validate_json(body)
+    return report.interval, report.measured_data.inside_temperature
+
+
+def _measure(call: Callable[[], Any], number: int) -> tuple[float, int]:
+    """Return the CPU seconds and the peak bytes allocated per call"""
+    started = time.process_time()
+    for _ in range(number):
+        call()
+    cpu = (time.process_time() - started) / number
+
+    tracemalloc.start()
+    call()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return cpu, peak
+
+
+def main() -> None:
+    zones = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    LOGGER.setLevel(logging.WARNING)
+
+    state = _load("tadov2.heating.auto_mode.json")
+    zone_states = json.dumps(
+        {"zoneStates": {str(zone): state for zone in range(1, zones + 1)}}
+    ).encode()
+    day_report = json.dumps(_load("history.zone_day_report.json")).encode()
+
+    cases: list[tuple[str, Callable[[bytes], Any], bytes]] = [
+        (f"zoneStates, {zones} zones", _read_zone_states, zone_states),
+        ("dayReport", _read_day_report, day_report),
+    ]
+    for name, read, body in cases:
+        print(name)
+        for lazy in (False, True):
+            with lazy_validation(lazy):
+                cpu, peak = _measure(lambda: read(body), 50)
+            print(
+                f"{'lazy' if lazy else 'eager':>6}: {cpu * 1e6:10.1f} µs CPU, "
+                f"{peak / 1024:8.1f} KiB peak allocated per call"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Offline benchmark of a Tado workload replayed from the test fixtures or a cassette.
+
+Replays the zone state of a home with the given per-response latency, or the latency
+recorded in the cassette when "recorded" is given, and reports the time per call.
+
+Usage: python benchmarks/replay.py [latency in seconds | recorded] [cassette file]
+"""
+
+import os
+import sys
+import time
+
+from PyTado.http import Http
+from PyTado.interface.api.my_tado import Tado
+from PyTado.replay import Cassette, ReplaySession
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures")
+
+ROUTES = {
+    "https://my.tado.com/api/v2/me": "home_1234/my_api_v2_me.json",
+    "https://my.tado.com/api/v2/homes/1234/": (
+        "home_1234/tadov2.my_api_v2_home_state.json"
+    ),
+    "https://my.tado.com/api/v2/homes/1234/state": (
+        "tadov2.home_state.auto_supported.auto_mode.json"
+    ),
+    "https://my.tado.com/api/v2/homes/1234/zones/1/state": (
+        "tadov2.heating.auto_mode.json"
+    ),
+    "https://my.tado.com/api/v2/homes/1234/zones/2/state": (
+        "tadov2.water_heater.auto_mode.json"
+    ),
+    "https://my.tado.com/api/v2/homes/1234/zones/3/state": "smartac3.cool_mode.json",
+}
+
+
+def main() -> None:
+    latency = sys.argv[1] if len(sys.argv) > 1 else "0"
+    cassette = (
+        Cassette.load(sys.argv[2])
+        if len(sys.argv) > 2
+        else Cassette.from_fixtures(ROUTES, FIXTURES)
+    )
+
+    tado = Tado.from_http(
+        Http(
+            saved_refresh_token="replay",
+            http_session=ReplaySession(
+                cassette, latency=None if latency == "recorded" else float(latency)
+            ),
+        )
+    )
+
+    rounds = 50
+    started = time.perf_counter()
+    for _ in range(rounds):
+        tado.get_home_state()
+        for zone in (1, 2, 3):
+            tado.get_zone_state(zone)
+    elapsed = time.perf_counter() - started
+
+    calls = rounds * 4
+    print(f"{len(cassette)} recorded responses, latency {latency}")
+    print(f"{calls} calls: {elapsed / calls * 1e6:10.1f} µs per call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark of validating responses from their bytes with Http.request_model(), against
+decoding them with Http.request() and validating the decoded objects.
+
+Replays the states of a home with the given number of zones and the day report of a
+zone offline, and reports the CPU time and the memory allocated per call.
+
+Usage: python benchmarks/request_model.py [number of zones]
+"""
+
+import json
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from PyTado.http import Http, TadoRequest
+from PyTado.models import Historic
+from PyTado.models.pre_line_x.zone import ZoneStatesResponse
+from PyTado.models.util import LOGGER
+from PyTado.replay import Cassette, ReplaySession
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures")
+HOME = "https://my.tado.com/api/v2/homes/1234/"
+
+ROUTES = {
+    "https://my.tado.com/api/v2/me": "home_1234/my_api_v2_me.json",
+    HOME: "home_1234/tadov2.my_api_v2_home_state.json",
+    f"{HOME}zones/1/dayReport": "history.zone_day_report.json",
+}
+
+
+def _load(fixture: str) -> Any:
+    with open(os.path.join(FIXTURES, fixture), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _measure(call: Callable[[], Any], number: int) -> tuple[float, int]:
+    """Return the CPU seconds and the bytes allocated per call"""
+    started = time.process_time()
+    for _ in range(number):
+        call()
+    cpu = (time.process_time() - started) / number
+
+    tracemalloc.start()
+    call()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return cpu, peak
+
+
+def main() -> None:
+    zones = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    LOGGER.setLevel(logging.WARNING)
+
+    cassette = Cassette.from_fixtures(ROUTES, FIXTURES)
+    state = _load("tadov2.heating.auto_mode.json")
+    cassette.add(
+        "GET",
+        f"{HOME}zoneStates",
+        {"zoneStates": {str(zone): state for zone in range(1, zones + 1)}},
+    )
+    http = Http(saved_refresh_token="replay", http_session=ReplaySession(cassette))
+
+    cases = [
+        (f"zoneStates, {zones} zones", "zoneStates", ZoneStatesResponse),
+        ("dayReport", "zones/1/dayReport", Historic),
+    ]
+    for name, command, model in cases:
+        request = TadoRequest(command=command)
+        decoded = _measure(lambda: model.model_validate(http.request(request)), 50)
+        raw = _measure(lambda: http.request_model(request, model), 50)
+
+        print(name)
+        for label, (cpu, peak) in (("request", decoded), ("request_model", raw)):
+            print(
+                f"{label:>14}: {cpu * 1e6:10.1f} µs CPU, "
+                f"{peak / 1024:8.1f} KiB peak allocated per call"
+            )
+
+
+if __name__ == "__main__":
+    main()
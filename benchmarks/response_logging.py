@@ -0,0 +1,93 @@
+"""
+Micro-benchmark of the response handling of Http with debug logging disabled.
+
+Compares the former response hook, which decoded the JSON body and pretty printed the
+request headers for every response, with the current one on a large zoneStates payload.
+
+Usage: python benchmarks/response_logging.py [number of zones]
+"""
+
+import json
+import logging
+import os
+import pprint
+import sys
+import timeit
+from typing import Any
+
+import requests
+
+from PyTado.codec import JsonCodec
+from PyTado.http import _LOGGER, Http
+
+FIXTURE = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "tests",
+    "fixtures",
+    "tadov2.heating.auto_mode.json",
+)
+
+
+def _zone_states_response(zones: int) -> requests.Response:
+    with open(FIXTURE, encoding="utf-8") as f:
+        state = json.load(f)
+
+    body = json.dumps({"zoneStates": {str(zone): state for zone in range(zones)}})
+
+    prepared = requests.Request(
+        "GET",
+        "https://my.tado.com/api/v2/homes/1234/zoneStates",
+        headers={"Referer": "https://app.tado.com/", "Authorization": "Bearer token"},
+    ).prepare()
+
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = "application/json;charset=UTF-8"
+    response.request = prepared
+    response._content = body.encode("utf-8")
+    return response
+
+
+def _legacy_log_response(
+    response: requests.Response, *args: Any, **kwargs: Any
+) -> None:
+    """The response hook as it was, before it returned early when debug is disabled"""
+    if response.text is None or response.text == "":
+        response_data = {}
+    else:
+        response_data = response.json()
+
+    _LOGGER.debug(
+        f"\nRequest:\n\tMethod:{response.request.method}"
+        f"\n\tURL: {response.request.url}"
+        f"\n\tHeaders: {pprint.pformat(response.request.headers)}"
+        f"\nResponse:\n\tStatusCode: {response.status_code}"
+        f"\n\tData: {response_data}"
+    )
+
+
+def main() -> None:
+    zones = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    response = _zone_states_response(zones)
+    http = Http.__new__(Http)
+    http._codec = JsonCodec()
+    _LOGGER.setLevel(logging.WARNING)
+
+    def legacy() -> None:
+        _legacy_log_response(response)
+        http._parse_response(response.request.url or "", 200, response.content)
+
+    def current() -> None:
+        http._log_response(response)
+        http._parse_response(response.request.url or "", 200, response.content)
+
+    number = 200
+    print(f"zoneStates with {zones} zones, {len(response.content)} bytes")
+    for name, func in (("legacy", legacy), ("current", current)):
+        best = min(timeit.repeat(func, number=number, repeat=5)) / number
+        print(f"{name:>8}: {best * 1e6:10.1f} µs per response")
+
+
+if __name__ == "__main__":
+    main()
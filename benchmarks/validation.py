@@ -0,0 +1,58 @@
+"""
+Micro-benchmark of the model validation of large responses, with and without trusted
+validation (see PyTado.models.util.trusted_validation).
+
+Validates the day report of a zone into Historic and the rooms and devices of a Tado X
+home into DevicesResponse. The debug log of the models is disabled, as in production.
+
+Usage: python benchmarks/validation.py [number of validations]
+"""
+
+import json
+import logging
+import os
+import sys
+import timeit
+from typing import Any
+
+from PyTado.models import Historic
+from PyTado.models.line_x.device import DevicesResponse
+from PyTado.models.util import LOGGER, Base, trusted_validation
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures")
+
+CASES: list[tuple[type[Base], str]] = [
+    (Historic, "history.zone_day_report.json"),
+    (DevicesResponse, "tadox/rooms_and_devices.json"),
+]
+
+
+def _load(fixture: str) -> Any:
+    with open(os.path.join(FIXTURES, fixture), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    LOGGER.setLevel(logging.WARNING)
+
+    for model, fixture in CASES:
+        data = _load(fixture)
+        times = {}
+        for trusted in (False, True):
+            with trusted_validation(trusted):
+                best = min(
+                    timeit.repeat(
+                        lambda: model.model_validate(data), number=number, repeat=5
+                    )
+                )
+            times[trusted] = best / number
+
+        print(f"{model.__name__} ({fixture})")
+        print(f"{'default':>8}: {times[False] * 1e6:10.1f} µs per validation")
+        print(f"{'trusted':>8}: {times[True] * 1e6:10.1f} µs per validation")
+        print(f"{'speedup':>8}: {times[False] / times[True]:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,411 @@
+"""Test the asyncio API classes."""
+
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from collections import defaultdict, deque
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from PyTado.aio import AsyncHttp, AsyncTado, AsyncTadoX
+from PyTado.aio.zone import AsyncBaseZone
+from PyTado.exceptions import TadoException, TadoTimeoutException
+from PyTado.http import _DEFAULT_RETRIES, DeviceActivationStatus, TadoRequest
+from PyTado.ratelimit import RateLimiter
+from PyTado.types import HvacMode, Power, Presence
+
+from . import common
+
+TOKEN_URL = "https://login.tado.com/oauth2/token"
+ZONE = {
+    "id": 1,
+    "name": "Living room",
+    "type": "HEATING",
+    "dateCreated": "2020-01-01T00:00:00.000Z",
+    "deviceTypes": ["VA02"],
+    "devices": [],
+    "reportAvailable": False,
+    "showScheduleSetup": False,
+    "supportsDazzle": True,
+    "dazzleEnabled": True,
+    "dazzleMode": {"supported": True, "enabled": True},
+    "openWindowDetection": {"supported": True},
+}
+
+
+def _fixture(filename: str) -> Any:
+    return json.loads(common.load_fixture(filename))
+
+
+class FakeResponse:
+    """Minimal stand-in for aiohttp.ClientResponse."""
+
+    def __init__(
+        self, status: int, body: Any, headers: dict[str, str] | None = None
+    ) -> None:
+        self.status = status
+        self.reason = "OK" if status < 400 else "Error"
+        self.headers = headers or {}
+        self._text = "" if body is None else json.dumps(body)
+
+    async def text(self) -> str:
+        return self._text
+
+    async def read(self) -> bytes:
+        return self._text.encode("utf-8")
+
+    async def __aenter__(self) -> "FakeResponse":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+
+class FakeSession:
+    """Minimal stand-in for aiohttp.ClientSession answering from registered routes.
+
+    The last registered response of a route is repeated once the others are used up.
+    """
+
+    def __init__(self) -> None:
+        self.routes: dict[tuple[str, str], deque[FakeResponse]] = defaultdict(deque)
+        self.calls: list[tuple[str, str]] = []
+
+    def add(
+        self,
+        method: str,
+        url: str,
+        body: Any = None,
+        status: int = 200,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self.routes[(method, url)].append(FakeResponse(status, body, headers))
+
+    def request(self, method: str, url: str, **kwargs: Any) -> FakeResponse:
+        self.calls.append((method, url))
+        responses = self.routes[(method, url)]
+        if not responses:
+            raise AssertionError(f"Unexpected request {method} {url}")
+        return responses.popleft() if len(responses) > 1 else responses[0]
+
+    def post(self, url: str, **kwargs: Any) -> FakeResponse:
+        return self.request("POST", url, **kwargs)
+
+    async def close(self) -> None:
+        return None
+
+
+def _ready_http(session: FakeSession, is_x_line: bool = False) -> AsyncHttp:
+    http = AsyncHttp(http_session=session)  # type: ignore[arg-type]
+    http._id = 1234
+    http._x_api = is_x_line
+    http._token_refresh = "refresh"
+    http._refresh_at = datetime.now(timezone.utc) + timedelta(minutes=5)
+    http._device_activation_status = DeviceActivationStatus.COMPLETED
+    return http
+
+
+TOKEN = {"access_token": "value", "expires_in": 1000, "refresh_token": "another_value"}
+
+
+class AsyncHttpTestCase(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the AsyncHttp class."""
+
+    async def test_create_with_saved_refresh_token(self) -> None:
+        session = FakeSession()
+        session.add("POST", TOKEN_URL, TOKEN)
+        session.add(
+            "GET",
+            "https://my.tado.com/api/v2/me",
+            _fixture("home_1234/my_api_v2_me.json"),
+        )
+        session.add(
+            "GET",
+            "https://my.tado.com/api/v2/homes/1234/",
+            _fixture("home_1234/tadox.my_api_v2_home_state.json"),
+        )
+
+        async with await AsyncHttp.create(
+            saved_refresh_token="saved", http_session=session  # type: ignore[arg-type]
+        ) as http:
+            self.assertEqual(http._id, 1234)
+            self.assertTrue(http.is_x_line)
+            self.assertEqual(
+                http.device_activation_status, DeviceActivationStatus.COMPLETED
+            )
+            self.assertEqual(http._headers["Authorization"], "Bearer value")
+
+    async def test_tado_create_forwards_http_options(self) -> None:
+        session = FakeSession()
+        session.add("POST", TOKEN_URL, TOKEN)
+        session.add(
+            "GET",
+            "https://my.tado.com/api/v2/me",
+            _fixture("home_1234/my_api_v2_me.json"),
+        )
+        session.add(
+            "GET",
+            "https://my.tado.com/api/v2/homes/1234/",
+            _fixture("home_1234/tadox.my_api_v2_home_state.json"),
+        )
+        limiter = RateLimiter()
+
+        tado = await AsyncTadoX.create(
+            saved_refresh_token="saved",
+            http_session=session,  # type: ignore[arg-type]
+            rate_limiter=limiter,
+            deadline=7.0,
+        )
+
+        self.assertIs(tado._http._rate_limiter, limiter)
+        self.assertEqual(tado._http._deadline, 7.0)
+
+    async def test_create_with_saved_home(self) -> None:
+        session = FakeSession()
+        session.add("POST", TOKEN_URL, TOKEN)
+        session.add("GET", "https://my.tado.com/api/v2/homes/1234/state", {"a": 1})
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "token")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"refresh_token": "saved", "home_id": 1234, "is_x_line": True}, f
+                )
+
+            http = await AsyncHttp.create(
+                token_file_path=path, http_session=session  # type: ignore[arg-type]
+            )
+
+            self.assertEqual(session.calls, [])
+            self.assertTrue(http.is_x_line)
+
+            await http.request(TadoRequest(command="state"))
+
+        self.assertEqual(
+            session.calls,
+            [
+                ("POST", TOKEN_URL),
+                ("GET", "https://my.tado.com/api/v2/homes/1234/state"),
+            ],
+        )
+
+    async def test_concurrent_requests_refresh_once(self) -> None:
+        session = FakeSession()
+        session.add("POST", TOKEN_URL, TOKEN)
+        session.add("GET", "https://my.tado.com/api/v2/homes/1234/state", {"a": 1})
+
+        http = _ready_http(session)
+        http._refresh_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+
+        request = TadoRequest()
+        request.command = "state"
+
+        results = await asyncio.gather(*(http.request(request) for _ in range(5)))
+
+        self.assertEqual(results, [{"a": 1}] * 5)
+        self.assertEqual(session.calls.count(("POST", TOKEN_URL)), 1)
+
+    async def test_concurrent_identical_gets_are_coalesced(self) -> None:
+        session = FakeSession()
+        url = "https://my.tado.com/api/v2/homes/1234/state"
+        session.add("GET", url, {"presence": "HOME"})
+
+        http = _ready_http(session)
+        request = TadoRequest()
+        request.command = "state"
+
+        results = await asyncio.gather(*(http.request(request) for _ in range(5)))
+
+        self.assertEqual(results, [{"presence": "HOME"}] * 5)
+        self.assertEqual(session.calls, [("GET", url)])
+        self.assertEqual(http._in_flight, {})
+
+        await http.request(request)
+        self.assertEqual(len(session.calls), 2)
+
+    async def test_request_many(self) -> None:
+        session = FakeSession()
+        for zone in range(3):
+            session.add(
+                "GET",
+                f"https://my.tado.com/api/v2/homes/1234/zones/{zone}/state",
+                {"id": zone},
+                status=404 if zone == 1 else 200,
+            )
+
+        results = await _ready_http(session).request_many(
+            [TadoRequest(command=f"zones/{zone}/state") for zone in range(3)],
+            max_concurrency=2,
+        )
+
+        self.assertEqual(results[0], {"id": 0})
+        self.assertIsInstance(results[1], TadoException)
+        self.assertEqual(results[2], {"id": 2})
+
+    async def test_request_retries_gateway_errors(self) -> None:
+        session = FakeSession()
+        url = "https://my.tado.com/api/v2/homes/1234/state"
+        session.add("GET", url, status=503)
+        session.add("GET", url, {"presence": "AWAY"})
+
+        request = TadoRequest()
+        request.command = "state"
+
+        result = await _ready_http(session).request(request)
+
+        self.assertEqual(result, {"presence": "AWAY"})
+        self.assertEqual(session.calls.count(("GET", url)), 2)
+
+    async def test_request_deadline_stops_retries(self) -> None:
+        session = FakeSession()
+        url = "https://my.tado.com/api/v2/homes/1234/state"
+        session.add("GET", url, status=503)
+
+        with self.assertRaises(TadoTimeoutException):
+            await _ready_http(session).request(
+                TadoRequest(command="state", deadline=0.15)
+            )
+
+        self.assertLess(session.calls.count(("GET", url)), _DEFAULT_RETRIES)
+
+    async def test_request_failed(self) -> None:
+        session = FakeSession()
+        session.add(
+            "GET",
+            "https://my.tado.com/api/v2/homes/1234/state",
+            {"errors": [{"code": "unauthorized"}]},
+            status=401,
+        )
+
+        request = TadoRequest()
+        request.command = "state"
+
+        with self.assertRaises(TadoException):
+            await _ready_http(session).request(request)
+
+
+class AsyncTadoTestCase(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the AsyncTado class."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.session = FakeSession()
+        self.tado_client = AsyncTado.from_http(_ready_http(self.session))
+
+    async def test_zone_update(self) -> None:
+        self.session.add(
+            "GET",
+            "https://my.tado.com/api/v2/homes/1234/zones/1/state",
+            _fixture("tadov2.heating.auto_mode.json"),
+        )
+        self.session.add("GET", "https://my.tado.com/api/v2/homes/1234/zones", [ZONE])
+        self.session.add(
+            "GET",
+            "https://my.tado.com/api/v2/homes/1234/zones/1/defaultOverlay",
+            {"terminationCondition": {"type": "MANUAL"}},
+        )
+
+        zone = self.tado_client.get_zone(1)
+
+        with self.assertRaises(TadoException):
+            zone.current_temp
+
+        await zone.update()
+
+        assert zone.name == "Living room"
+        assert zone.current_hvac_mode == HvacMode.AUTO
+        assert zone.power == Power.ON
+        assert zone.tado_mode == Presence.HOME
+        assert zone.default_overlay_termination_type == "MANUAL"
+
+    def test_base_zone_is_abstract(self) -> None:
+        with self.assertRaises(TypeError):
+            AsyncBaseZone(self.tado_client, 1)  # type: ignore[abstract]
+
+    async def test_zone_updates_share_zone_list(self) -> None:
+        for zone_id in (1, 2):
+            self.session.add(
+                "GET",
+                f"https://my.tado.com/api/v2/homes/1234/zones/{zone_id}/state",
+                _fixture("tadov2.heating.auto_mode.json"),
+            )
+            self.session.add(
+                "GET",
+                f"https://my.tado.com/api/v2/homes/1234/zones/{zone_id}/defaultOverlay",
+                {"terminationCondition": {"type": "MANUAL"}},
+            )
+        self.session.add(
+            "GET",
+            "https://my.tado.com/api/v2/homes/1234/zones",
+            [ZONE, {**ZONE, "id": 2, "name": "Kitchen"}],
+        )
+
+        zones = [self.tado_client.get_zone(1), self.tado_client.get_zone(2)]
+        for zone in zones:
+            await zone.update()
+
+        assert [zone.name for zone in zones] == ["Living room", "Kitchen"]
+        assert (
+            self.session.calls.count(
+                ("GET", "https://my.tado.com/api/v2/homes/1234/zones")
+            )
+            == 1
+        )
+
+    async def test_get_zone_states(self) -> None:
+        self.session.add(
+            "GET",
+            "https://my.tado.com/api/v2/homes/1234/zoneStates",
+            {"zoneStates": {"1": _fixture("tadov2.heating.auto_mode.json")}},
+        )
+
+        states = await self.tado_client.get_zone_states()
+
+        assert states["1"].setting.power == Power.ON
+
+
+class AsyncTadoXTestCase(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the AsyncTadoX class."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.session = FakeSession()
+        self.tado_client = AsyncTadoX.from_http(
+            _ready_http(self.session, is_x_line=True)
+        )
+
+    async def test_room_update(self) -> None:
+        self.session.add(
+            "GET",
+            "https://hops.tado.com/homes/1234/roomsAndDevices",
+            _fixture("tadox/rooms_and_devices.json"),
+        )
+        self.session.add(
+            "GET",
+            "https://hops.tado.com/homes/1234/rooms/1",
+            _fixture("home_1234/tadox.heating.auto_mode.json"),
+        )
+        self.session.add(
+            "GET",
+            "https://my.tado.com/api/v2/homes/1234/state",
+            _fixture("tadov2.home_state.auto_supported.auto_mode.json"),
+        )
+
+        rooms = await self.tado_client.get_zones()
+        room = next(room for room in rooms if room._id == 1)
+        await room.update()
+
+        assert room.current_hvac_mode == HvacMode.AUTO
+        assert room.current_temp == 24.0
+        assert room.target_temp == 22.0
+        assert room.tado_mode == Presence.HOME
+        assert (await room.get_climate()).humidity == 38
+        # the room list fetched by get_zones() is reused by update()
+        assert (
+            self.session.calls.count(
+                ("GET", "https://hops.tado.com/homes/1234/roomsAndDevices")
+            )
+            == 1
+        )
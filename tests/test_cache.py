@@ -0,0 +1,122 @@
+"""Test the ResponseCache class."""
+
+import unittest
+from unittest import mock
+
+import responses
+
+from PyTado.cache import CachePolicy, ResponseCache
+from PyTado.http import Action, Endpoint, Http, TadoRequest
+
+ZONES_URL = "https://my.tado.com/api/v2/homes/1234/zones"
+CAPABILITIES_URL = "https://my.tado.com/api/v2/homes/1234/zones/1/capabilities"
+
+
+class ResponseCacheTestCase(unittest.TestCase):
+    """Test cases for the ResponseCache class."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.now = 0.0
+        self.cache = ResponseCache(clock=lambda: self.now)
+
+    def test_ttl(self) -> None:
+        self.cache.put(ZONES_URL, [{"id": 1}])
+
+        self.now = 299
+        self.assertEqual(self.cache.get(ZONES_URL), [{"id": 1}])
+
+        self.now = 300
+        self.assertIsNone(self.cache.get(ZONES_URL))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_uncached_resources(self) -> None:
+        self.cache.put("https://my.tado.com/api/v2/homes/1234/zones/1/state", {})
+        self.cache.put("https://example.com/api/v2/homes/1234/zones", [])
+
+        self.assertEqual(len(self.cache), 0)
+
+    def test_returns_copies(self) -> None:
+        self.cache.put(ZONES_URL, [{"id": 1}])
+        self.cache.get(ZONES_URL)[0]["id"] = 2  # type: ignore[index]
+
+        self.assertEqual(self.cache.get(ZONES_URL), [{"id": 1}])
+
+    def test_lru_eviction(self) -> None:
+        cache = ResponseCache(
+            policies=[
+                CachePolicy(Endpoint.MY_API, r"homes/\d+/zones/\d+/capabilities", 60)
+            ],
+            max_size=2,
+            clock=lambda: self.now,
+        )
+        urls = [
+            f"https://my.tado.com/api/v2/homes/1234/zones/{zone}/capabilities"
+            for zone in range(3)
+        ]
+
+        cache.put(urls[0], {})
+        cache.put(urls[1], {})
+        cache.get(urls[0])
+        cache.put(urls[2], {})
+
+        self.assertIsNotNone(cache.get(urls[0]))
+        self.assertIsNone(cache.get(urls[1]))
+        self.assertIsNotNone(cache.get(urls[2]))
+
+    def test_invalidate_related_resources(self) -> None:
+        default_overlay = f"{ZONES_URL}/1/defaultOverlay"
+        other_zone = f"{ZONES_URL}/10/defaultOverlay"
+        hops = "https://hops.tado.com/homes/1234/roomsAndDevices"
+
+        for url in (ZONES_URL, CAPABILITIES_URL, default_overlay, other_zone, hops):
+            self.cache.put(url, {})
+
+        self.cache.invalidate(default_overlay)
+
+        # the resource itself and its parents, not its siblings or other zones
+        self.assertIsNone(self.cache.get(default_overlay))
+        self.assertIsNone(self.cache.get(ZONES_URL))
+        self.assertIsNotNone(self.cache.get(CAPABILITIES_URL))
+        self.assertIsNotNone(self.cache.get(other_zone))
+        self.assertIsNotNone(self.cache.get(hops))
+
+        self.cache.invalidate(
+            "https://hops.tado.com/homes/1234/roomsAndDevices/devices/VA1"
+        )
+        self.assertIsNone(self.cache.get(hops))
+
+
+class HttpResponseCacheTestCase(unittest.TestCase):
+    """Test cases for the response cache in the Http class."""
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        for patch in (
+            mock.patch("PyTado.http.Http._device_ready"),
+            mock.patch("PyTado.http.Http._refresh_token", return_value=True),
+        ):
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.http = Http(saved_refresh_token="token", response_cache=ResponseCache())
+        self.http._id = 1234
+
+    @responses.activate
+    def test_get_is_cached_until_written(self) -> None:
+        zones = responses.get(ZONES_URL, json=[{"id": 1}])
+        overlay = responses.put(f"{ZONES_URL}/1/overlay", json={"type": "MANUAL"})
+
+        get = TadoRequest(command="zones")
+        self.assertEqual(self.http.request(get), [{"id": 1}])
+        self.assertEqual(self.http.request(get), [{"id": 1}])
+        self.assertEqual(zones.call_count, 1)
+
+        self.http.request(
+            TadoRequest(command="zones/1/overlay", action=Action.CHANGE, payload={})
+        )
+        self.http.request(get)
+
+        self.assertEqual(overlay.call_count, 1)
+        self.assertEqual(zones.call_count, 2)
@@ -0,0 +1,147 @@
+"""Test the CircuitBreaker class."""
+
+import unittest
+from unittest import mock
+
+import responses
+
+from PyTado.circuit import CircuitBreaker, CircuitState
+from PyTado.exceptions import TadoCircuitOpenException, TadoException
+from PyTado.http import Endpoint, Http, TadoRequest
+
+
+class CircuitBreakerTestCase(unittest.TestCase):
+    """Test cases for the CircuitBreaker class."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.now = 0.0
+
+    def breaker(self, **kwargs) -> CircuitBreaker:
+        return CircuitBreaker(clock=lambda: self.now, **kwargs)
+
+    def call(self, breaker: CircuitBreaker, endpoint: str, succeeded: bool) -> None:
+        breaker.before_request(endpoint)
+        breaker.record_result(endpoint, succeeded)
+
+    def test_opens_after_consecutive_failures(self) -> None:
+        breaker = self.breaker(failure_threshold=3, reset_timeout=30)
+
+        self.call(breaker, Endpoint.HOPS_API, False)
+        self.call(breaker, Endpoint.HOPS_API, False)
+        self.call(breaker, Endpoint.HOPS_API, True)
+        self.assertEqual(breaker.status()[Endpoint.HOPS_API].failures, 0)
+
+        for _ in range(3):
+            self.call(breaker, Endpoint.HOPS_API, False)
+
+        status = breaker.status()[Endpoint.HOPS_API]
+        self.assertEqual((status.state, status.retry_in), (CircuitState.OPEN, 30))
+        with self.assertRaises(TadoCircuitOpenException):
+            breaker.before_request(Endpoint.HOPS_API)
+
+        # other endpoints are not affected
+        self.call(breaker, Endpoint.MY_API, True)
+
+    def test_half_open_probe(self) -> None:
+        breaker = self.breaker(failure_threshold=1, reset_timeout=30)
+        self.call(breaker, Endpoint.EIQ, False)
+
+        self.now = 30
+        breaker.before_request(Endpoint.EIQ)
+        self.assertEqual(breaker.status()[Endpoint.EIQ].state, CircuitState.HALF_OPEN)
+        # only one probe at a time
+        with self.assertRaises(TadoCircuitOpenException):
+            breaker.before_request(Endpoint.EIQ)
+
+        # a failed probe opens the circuit again
+        breaker.record_result(Endpoint.EIQ, False)
+        self.assertEqual(breaker.status()[Endpoint.EIQ].state, CircuitState.OPEN)
+
+        self.now = 60
+        self.call(breaker, Endpoint.EIQ, True)
+        self.assertEqual(breaker.status()[Endpoint.EIQ].state, CircuitState.CLOSED)
+
+    def test_retry_budget(self) -> None:
+        breaker = self.breaker(retry_ratio=0.5, min_retries=1, window=10)
+
+        for _ in range(4):
+            self.call(breaker, Endpoint.MY_API, True)
+
+        # one retry plus half of the four calls
+        self.assertEqual(
+            [breaker.allow_retry(Endpoint.MY_API) for _ in range(4)],
+            [True, True, True, False],
+        )
+        budget = breaker.retry_budget()
+        self.assertEqual((budget.requests, budget.retries, budget.remaining), (4, 3, 0))
+
+        self.now = 10
+        self.assertEqual(breaker.retry_budget().remaining, 1)
+
+    def test_open_circuit_is_not_retried(self) -> None:
+        breaker = self.breaker(failure_threshold=1)
+        self.call(breaker, Endpoint.MINDER, False)
+
+        self.assertFalse(breaker.allow_retry(Endpoint.MINDER))
+        self.assertTrue(breaker.allow_retry(Endpoint.MY_API))
+
+
+class HttpCircuitTestCase(unittest.TestCase):
+    """Test cases for the circuit breaker of the Http class."""
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        for patch in (
+            mock.patch("PyTado.http.Http._device_ready"),
+            mock.patch("PyTado.http.Http._refresh_token", return_value=True),
+        ):
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.http = Http(
+            saved_refresh_token="token",
+            circuit_breaker=CircuitBreaker(failure_threshold=2),
+        )
+        self.http._id = 1234
+
+    @responses.activate
+    def test_fail_fast_while_open(self) -> None:
+        responses.get(
+            "https://hops.tado.com/homes/1234/rooms",
+            json={"errors": []},
+            status=500,
+        )
+        request = TadoRequest(endpoint=Endpoint.HOPS_API, command="rooms")
+
+        for _ in range(2):
+            with self.assertRaises(TadoException):
+                self.http.request(request)
+
+        with self.assertRaises(TadoCircuitOpenException):
+            self.http.request(request)
+
+        self.assertEqual(len(responses.calls), 2)
+        self.assertEqual(
+            self.http.circuit_status()[Endpoint.HOPS_API].state, CircuitState.OPEN
+        )
+        self.assertEqual(self.http.retry_budget_status().requests, 2)
+
+    @responses.activate
+    def test_open_circuit_takes_no_quota(self) -> None:
+        responses.get(
+            "https://hops.tado.com/homes/1234/rooms",
+            json={"errors": []},
+            status=500,
+        )
+        request = TadoRequest(endpoint=Endpoint.HOPS_API, command="rooms")
+        for _ in range(2):
+            with self.assertRaises(TadoException):
+                self.http.request(request)
+        quota = self.http.quota_status()
+
+        with self.assertRaises(TadoCircuitOpenException):
+            self.http.request(request)
+
+        self.assertEqual(self.http.quota_status(), quota)
@@ -0,0 +1,117 @@
+"""Test the JSON codecs."""
+
+import importlib.util
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import responses
+
+from PyTado.codec import JsonCodec, MsgspecCodec, OrjsonCodec, get_codec
+from PyTado.http import _OAUTH_TOKEN_URL, Action, Http, TadoRequest
+
+HAS_ORJSON = importlib.util.find_spec("orjson") is not None
+HAS_MSGSPEC = importlib.util.find_spec("msgspec") is not None
+
+PAYLOAD = {"setting": {"type": "HEATING", "temperature": {"celsius": 21.5}}, "ids": [1]}
+
+
+class CodecTestCase(unittest.TestCase):
+    """Test cases for the JSON codecs."""
+
+    def assert_round_trip(self, codec: JsonCodec) -> None:
+        encoded = codec.dumps(PAYLOAD)
+        self.assertIsInstance(encoded, bytes)
+        self.assertEqual(json.loads(encoded), PAYLOAD)
+        self.assertEqual(codec.loads(encoded), PAYLOAD)
+        self.assertEqual(codec.loads(encoded.decode("utf-8")), PAYLOAD)
+        with self.assertRaises(ValueError):
+            codec.loads(b"{not json")
+
+    def test_stdlib(self) -> None:
+        self.assert_round_trip(get_codec("json"))
+
+    @unittest.skipUnless(HAS_ORJSON, "orjson is not installed")
+    def test_orjson(self) -> None:
+        self.assert_round_trip(get_codec("orjson"))
+
+    @unittest.skipUnless(HAS_MSGSPEC, "msgspec is not installed")
+    def test_msgspec(self) -> None:
+        self.assert_round_trip(get_codec("msgspec"))
+
+    def test_auto_falls_back_to_stdlib(self) -> None:
+        with mock.patch.dict("sys.modules", {"orjson": None, "msgspec": None}):
+            self.assertIs(type(get_codec("auto")), JsonCodec)
+            with self.assertRaises(ImportError):
+                OrjsonCodec()
+            with self.assertRaises(ImportError):
+                MsgspecCodec()
+
+    def test_unknown_codec(self) -> None:
+        with self.assertRaises(ValueError):
+            get_codec("yaml")
+
+
+class HttpCodecTestCase(unittest.TestCase):
+    """Test cases for the codec of the Http class."""
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        for patch in (
+            mock.patch("PyTado.http.Http._device_ready"),
+            mock.patch("PyTado.http.Http._refresh_token", return_value=True),
+        ):
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.codec = mock.Mock(spec=JsonCodec, wraps=JsonCodec())
+        self.http = Http(saved_refresh_token="token", json_codec=self.codec)
+        self.http._id = 1234
+
+    @responses.activate
+    def test_payload_and_response(self) -> None:
+        responses.post(
+            "https://my.tado.com/api/v2/homes/1234/zones/1/overlay",
+            body=b'{"type": "MANUAL"}',
+            match=[responses.matchers.json_params_matcher(PAYLOAD)],
+        )
+
+        result = self.http.request(
+            TadoRequest(command="zones/1/overlay", action=Action.SET, payload=PAYLOAD)
+        )
+
+        self.assertEqual(result, {"type": "MANUAL"})
+        self.codec.dumps.assert_called_once_with(PAYLOAD)
+        # decoded straight from the bytes of the response
+        self.codec.loads.assert_called_once_with(b'{"type": "MANUAL"}')
+
+    @responses.activate
+    def test_oauth_token(self) -> None:
+        responses.post(
+            _OAUTH_TOKEN_URL,
+            body=b'{"access_token": "access", "refresh_token": "refresh", "expires_in": 600}',
+        )
+
+        self.assertTrue(self.http._request_token("token", force_refresh=False))
+
+        self.assertEqual(self.http._token_refresh, "refresh")
+        self.codec.dumps.assert_called_once_with({})
+        self.codec.loads.assert_called_once_with(
+            b'{"access_token": "access", "refresh_token": "refresh", "expires_in": 600}'
+        )
+
+    def test_token_file(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            self.http._token_file_path = os.path.join(directory, "token")
+            self.http._token_refresh = "refresh"
+            self.http._save_token()
+
+            self.http._token_refresh = None
+            self.assertTrue(self.http._load_token())
+
+        self.assertEqual(self.http._token_refresh, "refresh")
+        self.codec.dumps.assert_called_once_with({"refresh_token": "refresh"})
+        self.codec.loads.assert_called_once()
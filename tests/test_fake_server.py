@@ -0,0 +1,131 @@
+"""Test the fake Tado API server."""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from PyTado.exceptions import TadoException
+from PyTado.http import DeviceActivationStatus, Http, TadoRequest
+from PyTado.interface.api.hops_tado import TadoX
+from PyTado.interface.api.my_tado import Tado
+from PyTado.testing import FakeHome, FakeTadoServer
+from PyTado.types import OverlayMode, Presence
+
+
+@pytest.mark.enable_socket
+class FakeTadoServerTestCase(unittest.TestCase):
+    """Test cases for the FakeTadoServer class."""
+
+    def _server(self, **kwargs) -> FakeTadoServer:
+        server = FakeTadoServer(**kwargs)
+        server.start()
+        self.addCleanup(server.stop)
+        return server
+
+    def test_pre_line_x_home(self) -> None:
+        server = self._server(homes=[FakeHome(id=7, zones=2)])
+        tado = Tado.from_http(server.http(home_id=7))
+
+        self.assertEqual(sorted(tado.get_zone_states()), ["1", "2"])
+
+        tado.set_zone_overlay(2, OverlayMode.MANUAL, set_temp=23.5)
+        self.assertEqual(tado.get_zone_state(2).setting.temperature.celsius, 23.5)
+        self.assertIsNone(tado.get_zone_state(1).overlay)
+
+        tado.reset_zone_overlay(2)
+        self.assertIsNone(tado.get_zone_state(2).overlay)
+
+        tado.set_zone_overlays([1, 2], OverlayMode.MANUAL, set_temp=19.0)
+        self.assertEqual(tado.get_zone_states()["1"].setting.temperature.celsius, 19.0)
+
+        tado.reset_zone_overlays([1, 2])
+        self.assertEqual(len(server.homes[7].overlays), 0)
+
+        tado.set_away()
+        self.assertEqual(tado.get_home_state().presence, Presence.AWAY)
+
+    def test_line_x_home(self) -> None:
+        server = self._server(homes=[FakeHome(id=3, is_x_line=True)])
+        http = server.http(home_id=3)
+        self.assertTrue(http.is_x_line)
+        tadox = TadoX.from_http(http)
+
+        tadox.set_zone_overlay(1, OverlayMode.MANUAL, set_temp=21.0)
+
+        room = tadox.get_zone(1)
+        room.update()
+        self.assertEqual(room.target_temp, 21.0)
+        self.assertEqual(len(tadox.get_zones()), 3)
+
+    def test_device_flow(self) -> None:
+        server = self._server(homes=2, device_flow_polls=2)
+
+        for home_id in (1, 2):
+            http = Http(http_session=server.session())
+            self.assertEqual(
+                http.device_activation_status, DeviceActivationStatus.PENDING
+            )
+            http.device_activation()
+            self.assertEqual(http._id, home_id)
+
+        self.assertEqual(server.status_counts()[400], 4)
+
+    def test_unknown_refresh_token(self) -> None:
+        server = self._server()
+
+        http = Http(saved_refresh_token="unknown", http_session=server.session())
+
+        self.assertEqual(
+            http.device_activation_status, DeviceActivationStatus.NOT_STARTED
+        )
+
+    def test_other_home(self) -> None:
+        server = self._server(homes=2)
+        url = "https://my.tado.com/api/v2/homes/2/zones/1/state"
+
+        self.assertEqual(
+            server.handle("GET", url, "Bearer access-1-1", b"").status, 403
+        )
+        self.assertEqual(
+            server.handle("GET", url, "Bearer access-2-1", b"").status, 200
+        )
+        self.assertEqual(server.handle("GET", url, None, b"").status, 401)
+
+    def test_injected_errors(self) -> None:
+        server = self._server()
+        http = server.http(home_id=1)
+
+        server.error_rate = 1.0
+        server.error_status = 500
+        with self.assertRaises(TadoException):
+            http.request(TadoRequest(command="zones/1/state"))
+        self.assertEqual(server.status_counts()[500], 1)
+
+    def test_rate_limit(self) -> None:
+        server = self._server(rate_limit_rate=1.0, retry_after=3)
+
+        response = server.handle(
+            "GET", "https://my.tado.com/api/v2/me", "Bearer access-1-1", b""
+        )
+
+        self.assertEqual(response.status, 429)
+        self.assertEqual(response.headers["Retry-After"], "3")
+        self.assertEqual(server.status_counts(), {429: 1})
+
+    def test_soak(self) -> None:
+        server = self._server(homes=50, latency=0.001, jitter=0.002)
+
+        def poll(home_id: int) -> float:
+            tado = Tado.from_http(server.http(home_id=home_id))
+            states = tado.get_zone_states()
+            return states["1"].sensor_data_points.inside_temperature.celsius
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            temperatures = list(executor.map(poll, server.homes))
+
+        self.assertEqual(
+            temperatures,
+            [home.inside_temperature(1) for home in server.homes.values()],
+        )
+        self.assertEqual(set(server.status_counts()), {200})
@@ -0,0 +1,101 @@
+"""Test the NumPy export of the day reports."""
+
+import importlib.util
+import json
+import unittest
+from unittest import mock
+
+from PyTado.models import Historic
+from PyTado.models.util import lazy_validation
+
+from . import common
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+
+class HistoricArraysTestCase(unittest.TestCase):
+    """Test cases for Historic.to_arrays()."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.data = common.load_fixture("history.zone_day_report.json")
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+    def test_to_arrays(self) -> None:
+        import numpy as np
+
+        arrays = Historic.model_validate_json(self.data).to_arrays()
+
+        temperature = arrays.inside_temperature
+        self.assertEqual(temperature.timestamps.dtype, np.dtype("datetime64[ms]"))
+        self.assertEqual(temperature.values.dtype, np.float64)
+        self.assertEqual(len(temperature.values), 99)
+        self.assertEqual(temperature.timestamps[0], np.datetime64("2025-04-06T21:45"))
+        self.assertEqual(temperature.values[0], 20.05)
+        self.assertEqual(arrays.humidity.values[0], 0.451)
+
+        self.assertEqual(arrays.stripes.values[0], "AWAY")
+        self.assertEqual(arrays.stripes.end[0], np.datetime64("2025-04-06T22:00:10"))
+        self.assertIsNone(arrays.stripes.celsius)
+        self.assertEqual(arrays.settings.values[0], "ON")
+        self.assertEqual(arrays.settings.celsius[0], 18.0)
+        self.assertEqual(arrays.call_for_heat.values[0], "NONE")
+        self.assertEqual(arrays.weather_condition.values[0], "NIGHT_CLOUDY")
+        self.assertEqual(arrays.weather_condition.celsius[0], 3.64)
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+    def test_lazy_from_json(self) -> None:
+        import numpy as np
+
+        eager = Historic.model_validate_json(self.data).to_arrays()
+        with lazy_validation():
+            historic = Historic.model_validate_json(self.data)
+            lazy = historic.to_arrays()
+
+        # read from the JSON, without validating the models
+        self.assertNotIn("measured_data", historic.__dict__)
+        for series in ("inside_temperature", "humidity"):
+            for name in ("timestamps", "values"):
+                np.testing.assert_array_equal(
+                    getattr(getattr(lazy, series), name),
+                    getattr(getattr(eager, series), name),
+                )
+        for series in ("stripes", "settings", "call_for_heat", "weather_condition"):
+            for name in ("start", "end", "values", "celsius"):
+                np.testing.assert_array_equal(
+                    getattr(getattr(lazy, series), name),
+                    getattr(getattr(eager, series), name),
+                )
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+    def test_lazy_invalid_json(self) -> None:
+        from pydantic import ValidationError
+
+        data = json.loads(self.data)
+        del data["measuredData"]["insideTemperature"]["dataPoints"][0]["value"]
+        with lazy_validation():
+            historic = Historic.model_validate(data)
+
+        with self.assertRaises(ValidationError):
+            historic.to_arrays()
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+    def test_lazy_non_numeric_value(self) -> None:
+        from pydantic import ValidationError
+
+        data = json.loads(self.data)
+        data["measuredData"]["insideTemperature"]["dataPoints"][0]["value"] = {
+            "celsius": "warm"
+        }
+        with lazy_validation():
+            historic = Historic.model_validate(data)
+
+        with self.assertRaises(ValidationError):
+            historic.to_arrays()
+
+    def test_requires_numpy(self) -> None:
+        historic = Historic.model_validate_json(self.data)
+
+        with mock.patch.dict("sys.modules", {"numpy": None}):
+            with self.assertRaises(ImportError):
+                historic.to_arrays()
@@ -416,3 +416,66 @@ class TadoZoneTestCase(common.TadoBaseTestCase, is_x_line=True):
         assert schedule.schedule[0].setting.power == Power.ON
         assert schedule.schedule[0].setting.temperature.value == 18.0
         assert len(schedule.schedule) == 28
+
+    @responses.activate
+    def test_zone_snapshot(self) -> None:
+        room_state = json.loads(
+            common.load_fixture("home_1234/tadox.heating.manual_mode.json")
+        )
+        responses.add(
+            responses.GET,
+            "https://hops.tado.com/homes/1234/rooms",
+            json=[room_state],
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/state",
+            json=json.loads(
+                common.load_fixture("tadov2.home_state.auto_supported.auto_mode.json")
+            ),
+            status=200,
+        )
+
+        rooms = self.tado_client.get_zone_snapshot()
+
+        self.assertEqual([room.id for room in rooms], [room_state["id"]])
+        self.assertEqual(
+            rooms[0].current_temp,
+            room_state["sensorDataPoints"]["insideTemperature"]["value"],
+        )
+        self.assertEqual(rooms[0].tado_mode, Presence.HOME)
+        # one request for the rooms and one for the home state, none per room
+        self.assertEqual(len(responses.calls), 2)
+
+    @responses.activate
+    def test_manual_control_write_through(self) -> None:
+        self.set_fixture("home_1234/tadox.heating.auto_mode.json")
+        for action in ("manualControl", "resumeSchedule"):
+            responses.add(
+                responses.POST,
+                f"https://hops.tado.com/homes/1234/rooms/1/{action}",
+                status=204,
+            )
+        room = self.tado_client.get_zone(1)
+        assert room.overlay_active is False
+
+        room.set_zone_overlay(
+            OverlayMode.TIMER, set_temp=23.0, duration=timedelta(minutes=10)
+        )
+
+        assert room.provisional is True
+        assert room.target_temp == 23.0
+        assert room.current_hvac_mode == HvacMode.HEAT
+        assert room.overlay_termination_type == OverlayMode.TIMER
+        assert room.overlay_termination_expiry_seconds == 600
+
+        room.set_zone_overlay(OverlayMode.MANUAL, is_boost=True)
+        assert room.boost is True
+        assert room.target_temp is None
+
+        room.reset_zone_overlay()
+        assert room.overlay_active is False
+        assert room.boost is False
+        # one read of the room state, the changes were applied locally
+        assert len(responses.calls) == 4
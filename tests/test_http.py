@@ -2,15 +2,35 @@
 
 import io
 import json
+import os
+import tempfile
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from unittest import mock
 
+import requests
 import responses
+from urllib3.util.retry import RequestHistory
 
 from PyTado.const import CLIENT_ID_DEVICE
-from PyTado.exceptions import TadoException
-from PyTado.http import Domain, Endpoint, Http, TadoRequest
+from PyTado.exceptions import TadoException, TadoTimeoutException
+from PyTado.http import (
+    _DEADLINE,
+    _RETRY_GATE,
+    Action,
+    Domain,
+    Endpoint,
+    Http,
+    TadoRequest,
+    Timeout,
+    _BoundedRetry,
+)
+from PyTado.models.home import HomeState, Users
+from PyTado.models.pre_line_x.zone import Zones
+from PyTado.models.return_models import SuccessResult
+from PyTado.types import Presence
 
 from . import common
 
@@ -199,6 +219,290 @@ class TestHttp(unittest.TestCase):
 
         assert refresh_token.call_count == 1
 
+    @responses.activate
+    def test_refresh_token_keeps_session(self):
+        """Test that a token refresh keeps the (injected) session and its adapter."""
+        session = requests.Session()
+        instance = Http(debug=True, http_session=session)
+        instance.device_activation()
+
+        adapter = session.get_adapter("https://my.tado.com/")
+
+        # Force token refresh
+        instance._refresh_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        instance._refresh_token()
+
+        self.assertIs(instance._session, session)
+        self.assertIs(session.get_adapter("https://my.tado.com/"), adapter)
+        self.assertEqual(instance._headers["Authorization"], "Bearer value")
+
+    @responses.activate
+    def test_concurrent_requests_refresh_once(self):
+        """Test that threads sharing an instance wait for a single token refresh."""
+        instance = Http()
+        instance.device_activation()
+
+        def slow_token(request):
+            time.sleep(0.1)
+            return (
+                200,
+                {},
+                json.dumps(
+                    {"access_token": "new", "expires_in": 1000, "refresh_token": "next"}
+                ),
+            )
+
+        responses.remove(responses.POST, "https://login.tado.com/oauth2/token")
+        responses.add_callback(
+            responses.POST, "https://login.tado.com/oauth2/token", callback=slow_token
+        )
+        responses.add(
+            responses.PUT,
+            "https://my.tado.com/api/v2/homes/1234/test",
+            json={"success": True},
+            status=200,
+        )
+
+        instance._refresh_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        request = TadoRequest(command="test", action="PUT", payload={"a": 1})
+        responses.calls.reset()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: instance.request(request), range(8)))
+
+        self.assertEqual(results, [{"success": True}] * 8)
+        token_calls = [
+            call for call in responses.calls if "oauth2/token" in call.request.url
+        ]
+        self.assertEqual(len(token_calls), 1)
+        self.assertEqual(instance._headers["Authorization"], "Bearer new")
+        self.assertNotIn("Content-Type", instance._headers)
+
+    @responses.activate
+    def test_concurrent_identical_gets_are_coalesced(self):
+        """Test that identical GET requests in flight share one upstream call."""
+        instance = Http()
+        instance.device_activation()
+
+        def slow_state(request):
+            time.sleep(0.1)
+            return (200, {}, json.dumps({"presence": "HOME"}))
+
+        responses.add_callback(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/state",
+            callback=slow_state,
+        )
+        responses.calls.reset()
+        request = TadoRequest(command="state")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: instance.request(request), range(8)))
+
+        self.assertEqual(results, [{"presence": "HOME"}] * 8)
+        self.assertEqual(len(responses.calls), 1)
+        self.assertEqual(instance._in_flight, {})
+
+        # mutating one result must not change the others
+        results[0]["presence"] = "AWAY"
+        self.assertEqual(results[1:], [{"presence": "HOME"}] * 7)
+
+    @responses.activate
+    def test_request_many(self):
+        """Test that request_many keeps the order and returns errors per request."""
+        instance = Http()
+        instance.device_activation()
+
+        def slow_zone(request):
+            zone = int(request.url.split("/")[-2])
+            # later zones answer first
+            time.sleep(0.02 * (4 - zone))
+            if zone == 2:
+                return (500, {}, json.dumps({"errors": []}))
+            return (200, {}, json.dumps({"id": zone}))
+
+        for zone in range(4):
+            responses.add_callback(
+                responses.GET,
+                f"https://my.tado.com/api/v2/homes/1234/zones/{zone}/state",
+                callback=slow_zone,
+            )
+
+        results = instance.request_many(
+            [TadoRequest(command=f"zones/{zone}/state") for zone in range(4)],
+            max_concurrency=4,
+        )
+
+        self.assertEqual(results[:2], [{"id": 0}, {"id": 1}])
+        self.assertIsInstance(results[2], TadoException)
+        self.assertEqual(results[3], {"id": 3})
+        self.assertEqual(instance.request_many([]), [])
+
+        with self.assertRaises(ValueError):
+            instance.request_many([TadoRequest(command="state")], max_concurrency=0)
+
+    @responses.activate
+    def test_request_model(self):
+        """Test that request_model validates the response body without decoding it."""
+        instance = Http()
+        instance.device_activation()
+
+        responses.get(
+            "https://my.tado.com/api/v2/homes/1234/state",
+            json={"presence": "HOME", "presenceLocked": False},
+        )
+        responses.get(
+            "https://my.tado.com/api/v2/homes/1234/users",
+            json=[json.loads(common.load_fixture("home_1234/my_api_v2_me.json"))],
+        )
+        responses.delete(
+            "https://my.tado.com/api/v2/homes/1234/presenceLock", status=204
+        )
+        responses.get(
+            "https://my.tado.com/api/v2/homes/1234/zones",
+            json={"errors": []},
+            status=500,
+        )
+
+        with mock.patch.object(instance._codec, "loads") as loads:
+            state = instance.request_model(TadoRequest(command="state"), HomeState)
+            users = instance.request_model(TadoRequest(command="users"), Users)
+            result = instance.request_model(
+                TadoRequest(command="presenceLock", action=Action.RESET),
+                SuccessResult,
+            )
+
+        loads.assert_not_called()
+        self.assertEqual(state.presence, Presence.HOME)
+        self.assertEqual(users[0].name, "Alice Wonderland")
+        self.assertTrue(result.success)
+
+        with self.assertRaises(TadoException):
+            instance.request_model(TadoRequest(command="zones"), Zones)
+
+    @responses.activate
+    def test_request_model_coalesced(self):
+        """Test that identical request_model GETs in flight share one upstream call."""
+        instance = Http()
+        instance.device_activation()
+
+        def slow_state(request):
+            time.sleep(0.1)
+            return (200, {}, json.dumps({"presence": "HOME", "presenceLocked": False}))
+
+        responses.add_callback(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/state",
+            callback=slow_state,
+        )
+        responses.calls.reset()
+        request = TadoRequest(command="state")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            states = list(
+                executor.map(
+                    lambda _: instance.request_model(request, HomeState), range(8)
+                )
+            )
+
+        self.assertEqual({state.presence for state in states}, {Presence.HOME})
+        self.assertEqual(len(responses.calls), 1)
+        self.assertEqual(instance._in_flight, {})
+
+    @responses.activate
+    def test_request_timeouts(self):
+        """Test that requests are sent with the timeout of their endpoint."""
+        instance = Http(
+            endpoint_timeouts={Endpoint.MINDER: Timeout(connect=1, read=30)}
+        )
+        instance.device_activation()
+
+        response = mock.Mock(status_code=200, content=b"{}", headers={})
+        with mock.patch.object(
+            instance._session, "send", return_value=response
+        ) as send:
+            instance.request(TadoRequest(command="state"))
+            instance.request(TadoRequest(command="state", endpoint=Endpoint.MINDER))
+            instance.request(TadoRequest(command="weather", deadline=2))
+
+        self.assertEqual(
+            [call.kwargs["timeout"] for call in send.call_args_list[:2]],
+            [(5, 10), (1, 30)],
+        )
+        connect, read = send.call_args_list[2].kwargs["timeout"]
+        self.assertLessEqual(max(connect, read), 2)
+
+    @responses.activate
+    def test_request_timed_out(self):
+        """Test that timeouts and exceeded deadlines raise a TadoTimeoutException."""
+        instance = Http()
+        instance.device_activation()
+
+        responses.add(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/state",
+            body=requests.exceptions.ReadTimeout(),
+        )
+
+        with self.assertRaises(TadoTimeoutException):
+            instance.request(TadoRequest(command="state"))
+
+        with self.assertRaises(TadoTimeoutException):
+            instance.request(TadoRequest(command="weather", deadline=0))
+
+    def test_retry_stops_at_deadline(self):
+        """Test that the urllib3 Retry stops at the deadline and without retry budget."""
+        retry = _BoundedRetry(total=5, backoff_factor=10).new(
+            history=(RequestHistory("GET", "/", None, 503, None),) * 3
+        )
+        self.assertFalse(retry.is_exhausted())
+        self.assertEqual(retry.get_backoff_time(), 40)
+
+        token = _DEADLINE.set(time.monotonic() + 1)
+        try:
+            self.assertFalse(retry.is_exhausted())
+            self.assertLessEqual(retry.get_backoff_time(), 1)
+        finally:
+            _DEADLINE.reset(token)
+
+        token = _DEADLINE.set(time.monotonic() - 1)
+        try:
+            self.assertTrue(retry.is_exhausted())
+        finally:
+            _DEADLINE.reset(token)
+
+        token = _RETRY_GATE.set(lambda: False)
+        try:
+            self.assertTrue(retry.is_exhausted())
+        finally:
+            _RETRY_GATE.reset(token)
+
+    @responses.activate
+    def test_log_response_skipped_without_debug(self):
+        """Test that the response hook does not touch the response unless debugging."""
+        instance = Http(debug=False)
+        response = mock.Mock(spec=requests.Response)
+        type(response).text = mock.PropertyMock(side_effect=AssertionError)
+
+        instance._log_response(response)
+
+        response.json.assert_not_called()
+
+    @responses.activate
+    def test_connection_pool_stats(self):
+        """Test that the pool counters are summed over all pooled hosts."""
+        instance = Http()
+
+        pools = instance._http_adapter.poolmanager.pools
+        pools["my.tado.com"] = mock.Mock(num_requests=5, num_connections=1)
+        pools["login.tado.com"] = mock.Mock(num_requests=2, num_connections=2)
+
+        stats = instance.connection_pool_stats()
+
+        self.assertEqual(stats.requests, 7)
+        self.assertEqual(stats.new_connections, 3)
+        self.assertEqual(stats.reused_connections, 4)
+
     @responses.activate
     def test_configure_url_endpoint_mobile(self):
         """Test URL configuration for the MOBILE endpoint."""
@@ -287,10 +591,86 @@ class TestHttp(unittest.TestCase):
         ) as mock_file:
             http = Http(token_file_path="path/to/open")
 
-        mock_save.assert_called_once()
+        # once for the refreshed token and once more when the home is known
+        self.assertEqual(mock_save.call_count, 2)
         mock_file.assert_called_with("path/to/open", encoding="utf-8")
         assert http._device_activation_status == "COMPLETED"
 
+    @responses.activate
+    def test_saved_home_skips_startup_requests(self):
+        """Test that a home saved with the token is used without requests on startup."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "token")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"refresh_token": "saved", "home_id": 1234, "is_x_line": False}, f
+                )
+
+            http = Http(token_file_path=path)
+
+            self.assertEqual(len(responses.calls), 0)
+            self.assertEqual(http._id, 1234)
+            self.assertFalse(http.is_x_line)
+            self.assertEqual(http.device_activation_status, "COMPLETED")
+
+            responses.add(
+                responses.GET,
+                "https://my.tado.com/api/v2/homes/1234/state",
+                json={"presence": "HOME"},
+            )
+            self.assertEqual(
+                http.request(TadoRequest(command="state")), {"presence": "HOME"}
+            )
+
+            # the token was refreshed with the first request, no home lookup happened
+            self.assertEqual(
+                [call.request.url.split("?")[0] for call in responses.calls],
+                [
+                    "https://login.tado.com/oauth2/token",
+                    "https://my.tado.com/api/v2/homes/1234/state",
+                ],
+            )
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(
+                    json.load(f),
+                    {
+                        "refresh_token": "another_value",
+                        "home_id": 1234,
+                        "is_x_line": False,
+                    },
+                )
+
+    @responses.activate
+    def test_saved_home_revalidated_when_rejected(self):
+        """Test that a stale home from the token file is looked up again."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "token")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"refresh_token": "saved", "home_id": 999, "is_x_line": False}, f
+                )
+
+            http = Http(token_file_path=path)
+
+            responses.add(
+                responses.GET,
+                "https://my.tado.com/api/v2/homes/999/state",
+                json={"errors": [{"code": "accessDenied"}]},
+                status=403,
+            )
+            responses.add(
+                responses.GET,
+                "https://my.tado.com/api/v2/homes/1234/state",
+                json={"presence": "AWAY"},
+            )
+
+            self.assertEqual(
+                http.request(TadoRequest(command="state")), {"presence": "AWAY"}
+            )
+            self.assertEqual(http._id, 1234)
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(json.load(f)["home_id"], 1234)
+
     @mock.patch("PyTado.http.Http._refresh_token", return_value=True)
     @mock.patch("PyTado.http.Http._device_ready")
     @mock.patch("PyTado.http.Http._load_token")
@@ -340,6 +720,8 @@ class TestHttp(unittest.TestCase):
         mock_response = mock.Mock()
         mock_response.status_code = 204
         mock_response.text = ""
+        mock_response.content = b""
+        mock_response.headers = {}
 
         with mock.patch.object(http._session, "send", return_value=mock_response):
             request = TadoRequest(command="test", domain=Domain.HOME)
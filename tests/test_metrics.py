@@ -0,0 +1,262 @@
+"""Test the request and validation metrics."""
+
+import importlib.util
+import unittest
+from unittest import mock
+
+import responses
+
+from PyTado.exceptions import TadoException
+from PyTado.http import Action, Domain, Endpoint, Http, TadoRequest
+from PyTado.metrics import (
+    MetricsRecorder,
+    Observer,
+    OpenTelemetryObserver,
+    PrometheusObserver,
+    RequestMetrics,
+    command_template,
+)
+from PyTado.models.util import Base
+
+from .test_aio import FakeSession, _ready_http
+
+HAS_PROMETHEUS = importlib.util.find_spec("prometheus_client") is not None
+HAS_OPENTELEMETRY = importlib.util.find_spec("opentelemetry.sdk") is not None
+
+
+class Inner(Base):
+    celsius: float
+
+
+class Outer(Base):
+    temperature: Inner
+
+
+class FailingObserver(Observer):
+    def on_request(self, metrics: RequestMetrics) -> None:
+        raise RuntimeError("broken observer")
+
+
+def _metrics(**kwargs) -> RequestMetrics:
+    return RequestMetrics(
+        **{
+            "endpoint": Endpoint.MY_API,
+            "command": "zones/{id}/state",
+            "method": "GET",
+            "status_code": 200,
+            "duration": 0.2,
+            "retries": 1,
+            "bytes_sent": 0,
+            "bytes_received": 42,
+            **kwargs,
+        }
+    )
+
+
+class CommandTemplateTestCase(unittest.TestCase):
+    """Test cases for command_template."""
+
+    def test_command_template(self) -> None:
+        self.assertEqual(command_template("zones/1/state"), "zones/{id}/state")
+        self.assertEqual(
+            command_template("zones/12/dayReport?date=2024-01-01"),
+            "zones/{id}/dayReport",
+        )
+        self.assertEqual(
+            command_template("rooms/3/resumeSchedule"), "rooms/{id}/resumeSchedule"
+        )
+        self.assertEqual(command_template("devices/VA1234567890"), "devices/{id}")
+        self.assertEqual(command_template("zoneStates"), "zoneStates")
+
+    def test_request_templates(self) -> None:
+        self.assertEqual(Http._command_template(TadoRequest(domain=Domain.ME)), "me")
+        self.assertEqual(
+            Http._command_template(
+                TadoRequest(
+                    domain=Domain.DEVICES, device="RU1234567890", command="identify"
+                )
+            ),
+            "devices/{id}/identify",
+        )
+
+
+class MetricsRecorderTestCase(unittest.TestCase):
+    """Test cases for the MetricsRecorder class."""
+
+    def test_aggregates(self) -> None:
+        recorder = MetricsRecorder()
+        recorder.on_request(_metrics())
+        recorder.on_request(_metrics(status_code=None, duration=3.0, error="Timeout"))
+
+        snapshot = recorder.snapshot()
+        metrics = snapshot[(Endpoint.MY_API, "zones/{id}/state")]
+
+        self.assertEqual((metrics.requests, metrics.errors, metrics.retries), (2, 1, 2))
+        self.assertEqual(metrics.status_codes, {200: 1})
+        self.assertEqual(metrics.bytes_received, 84)
+        self.assertEqual(metrics.duration_max, 3.0)
+        self.assertEqual(sum(metrics.duration_buckets), 2)
+
+        # the snapshot is a copy
+        metrics.status_codes[500] = 1
+        self.assertNotIn(
+            500, recorder.snapshot()[(Endpoint.MY_API, "zones/{id}/state")].status_codes
+        )
+
+        recorder.reset()
+        self.assertEqual(recorder.snapshot(), {})
+
+
+class HttpMetricsTestCase(unittest.TestCase):
+    """Test cases for the observers of the Http class."""
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        for patch in (
+            mock.patch("PyTado.http.Http._device_ready"),
+            mock.patch("PyTado.http.Http._refresh_token", return_value=True),
+        ):
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.recorder = MetricsRecorder()
+        self.http = Http(
+            saved_refresh_token="token",
+            observers=[FailingObserver(), self.recorder],
+        )
+        self.http._id = 1234
+
+    @responses.activate
+    def test_request_metrics(self) -> None:
+        responses.get(
+            "https://my.tado.com/api/v2/homes/1234/zones/1/state",
+            json={"temperature": {"celsius": 20.5}},
+        )
+        responses.post(
+            "https://my.tado.com/api/v2/homes/1234/zones/2/overlay",
+            json={"errors": []},
+            status=422,
+        )
+
+        data = self.http.request(TadoRequest(command="zones/1/state"))
+        with self.assertRaises(TadoException):
+            self.http.request(
+                TadoRequest(
+                    command="zones/2/overlay", action=Action.SET, payload={"a": 1}
+                )
+            )
+
+        snapshot = self.recorder.snapshot()
+        state = snapshot[(Endpoint.MY_API, "zones/{id}/state")]
+        self.assertEqual((state.requests, state.errors), (1, 0))
+        self.assertEqual(state.status_codes, {200: 1})
+        self.assertEqual(state.bytes_received, len(responses.calls[0].response.content))
+        self.assertGreater(state.duration_total, 0)
+
+        overlay = snapshot[(Endpoint.MY_API, "zones/{id}/overlay")]
+        self.assertEqual((overlay.requests, overlay.errors), (1, 1))
+        self.assertEqual(overlay.status_codes, {422: 1})
+        self.assertEqual(overlay.bytes_sent, len(b'{"a": 1}'))
+
+        # the validation is attributed to the last request, nested models are not counted
+        self.http.request(TadoRequest(command="zones/1/state"))
+        Outer.model_validate(data)
+
+        state = self.recorder.snapshot()[(Endpoint.MY_API, "zones/{id}/state")]
+        self.assertEqual(state.validations, 1)
+        self.assertGreater(state.validation_total, 0)
+
+    @responses.activate
+    def test_remove_observer(self) -> None:
+        responses.get("https://my.tado.com/api/v2/homes/1234/zoneStates", json={})
+
+        self.http.remove_observer(self.recorder)
+        self.http.request(TadoRequest(command="zoneStates"))
+        self.assertEqual(self.recorder.snapshot(), {})
+
+        self.http.add_observer(self.recorder)
+        self.http.request(TadoRequest(command="zoneStates"))
+        self.assertEqual(
+            self.recorder.snapshot()[(Endpoint.MY_API, "zoneStates")].requests, 1
+        )
+
+
+class AsyncHttpMetricsTestCase(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the observers of the AsyncHttp class."""
+
+    async def test_retries(self) -> None:
+        session = FakeSession()
+        url = "https://my.tado.com/api/v2/homes/1234/state"
+        session.add("GET", url, status=503)
+        session.add("GET", url, {"presence": "AWAY"})
+
+        recorder = MetricsRecorder()
+        http = _ready_http(session)
+        http.add_observer(recorder)
+
+        await http.request(TadoRequest(command="state"))
+
+        metrics = recorder.snapshot()[(Endpoint.MY_API, "state")]
+        self.assertEqual((metrics.requests, metrics.retries), (1, 1))
+        self.assertEqual(metrics.status_codes, {200: 1})
+
+
+@unittest.skipUnless(HAS_PROMETHEUS, "prometheus_client is not installed")
+class PrometheusObserverTestCase(unittest.TestCase):
+    """Test cases for the PrometheusObserver class."""
+
+    def test_export(self) -> None:
+        import prometheus_client
+
+        registry = prometheus_client.CollectorRegistry()
+        observer = PrometheusObserver(registry=registry)
+        observer.on_request(_metrics())
+
+        labels = {
+            "endpoint": Endpoint.MY_API,
+            "command": "zones/{id}/state",
+            "method": "GET",
+        }
+        self.assertEqual(
+            registry.get_sample_value(
+                "pytado_requests_total", {**labels, "status_code": "200"}
+            ),
+            1,
+        )
+        self.assertEqual(
+            registry.get_sample_value("pytado_request_retries_total", labels), 1
+        )
+        self.assertEqual(
+            registry.get_sample_value(
+                "pytado_request_duration_seconds_bucket", {**labels, "le": "0.25"}
+            ),
+            1,
+        )
+
+
+@unittest.skipUnless(HAS_OPENTELEMETRY, "opentelemetry-sdk is not installed")
+class OpenTelemetryObserverTestCase(unittest.TestCase):
+    """Test cases for the OpenTelemetryObserver class."""
+
+    def test_export(self) -> None:
+        from opentelemetry.sdk.metrics import MeterProvider
+        from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+        reader = InMemoryMetricReader()
+        meter = MeterProvider(metric_readers=[reader]).get_meter("test")
+        observer = OpenTelemetryObserver(meter=meter)
+        observer.on_request(_metrics())
+
+        metrics = {
+            metric.name: metric
+            for resource in reader.get_metrics_data().resource_metrics
+            for scope in resource.scope_metrics
+            for metric in scope.metrics
+        }
+        requests = metrics["pytado.requests"].data.data_points[0]
+        self.assertEqual(requests.value, 1)
+        self.assertEqual(requests.attributes["http.response.status_code"], 200)
+        self.assertEqual(
+            metrics["pytado.request.duration"].data.data_points[0].count, 1
+        )
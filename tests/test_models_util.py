@@ -0,0 +1,146 @@
+"""Test the trusted and lazy validation of the models."""
+
+import unittest
+from unittest import mock
+
+from pydantic import ValidationError
+
+from PyTado.models import Historic
+from PyTado.models.home import Temperature
+from PyTado.models.pre_line_x.zone import ZoneState
+from PyTado.models.util import (
+    Base,
+    ModelAdapter,
+    lazy_validation,
+    set_lazy_validation,
+    set_trusted_validation,
+    trusted_validation,
+)
+
+from . import common
+
+
+class _Model(Base):
+    name: str
+    value: int | None = None
+
+
+class _Parent(Base):
+    child: _Model
+    children: list[_Model] = []
+    value: int
+
+
+class TrustedValidationTestCase(unittest.TestCase):
+    """Test cases for trusted_validation and set_trusted_validation."""
+
+    @mock.patch("PyTado.models.util.LOGGER")
+    def test_default_logs_extra_keys(self, logger: mock.Mock) -> None:
+        model = _Model.model_validate({"name": "zone", "other": 1})
+
+        self.assertEqual(model.model_extra, {"other": 1})
+        logger.warning.assert_called_once()
+
+    @mock.patch("PyTado.models.util.LOGGER")
+    def test_trusted_skips_logging(self, logger: mock.Mock) -> None:
+        with trusted_validation():
+            model = _Model.model_validate({"name": "zone", "other": 1})
+            with self.assertRaises(ValidationError):
+                _Model.model_validate({"value": 1})
+
+        self.assertEqual(model.model_extra, {"other": 1})
+        logger.warning.assert_not_called()
+        logger.error.assert_not_called()
+
+        _Model.model_validate({"name": "zone", "other": 1})
+        logger.warning.assert_called_once()
+
+    @mock.patch("PyTado.models.util.LOGGER")
+    def test_process_default(self, logger: mock.Mock) -> None:
+        set_trusted_validation(True)
+        self.addCleanup(set_trusted_validation, False)
+
+        _Model.model_validate({"name": "zone", "other": 1})
+        logger.warning.assert_not_called()
+
+        with trusted_validation(False):
+            _Model.model_validate({"name": "zone", "other": 1})
+        logger.warning.assert_called_once()
+
+
+class ModelAdapterTestCase(unittest.TestCase):
+    """Test cases for the ModelAdapter class."""
+
+    @mock.patch("PyTado.models.util.LOGGER")
+    def test_validate(self, logger: mock.Mock) -> None:
+        models = ModelAdapter(list[_Model])
+
+        self.assertEqual(
+            models.validate_json(b'[{"name": "one"}, {"name": "two", "value": 2}]'),
+            [_Model(name="one"), _Model(name="two", value=2)],
+        )
+        self.assertEqual(
+            models.validate_python([{"name": "one"}]), [_Model(name="one")]
+        )
+
+        with self.assertRaises(ValidationError):
+            models.validate_json(b'[{"name": "one"}, {"value": 2}]')
+        # logged once for the whole response, not for every nested model
+        logger.error.assert_called_once()
+        self.assertEqual(logger.error.call_args.args[1], "list[_Model]")
+
+
+class LazyValidationTestCase(unittest.TestCase):
+    """Test cases for lazy_validation and set_lazy_validation."""
+
+    def test_same_as_eager(self) -> None:
+        for model, fixture in (
+            (ZoneState, "tadov2.heating.auto_mode.json"),
+            (Historic, "history.zone_day_report.json"),
+        ):
+            data = common.load_fixture(fixture)
+            eager = model.model_validate_json(data)
+            with lazy_validation():
+                lazy = model.model_validate_json(data)
+
+            self.assertEqual(lazy.__dict__.keys(), {"__lazy__"})
+            self.assertEqual(lazy.model_fields_set, eager.model_fields_set)
+            self.assertEqual(lazy.to_dict(), eager.to_dict())
+            self.assertEqual(lazy, eager)
+            self.assertEqual(repr(lazy), repr(eager))
+
+    def test_validated_on_access(self) -> None:
+        with lazy_validation():
+            parent = _Parent.model_validate(
+                {"child": {"name": "one"}, "value": "none", "other": 1}
+            )
+
+        self.assertNotIn("child", parent.__dict__)
+        self.assertEqual(parent.child, _Model(name="one"))
+        self.assertIs(parent.child, parent.__dict__["child"])
+        self.assertEqual(parent.children, [])
+        self.assertEqual(parent.model_extra, {"other": 1})
+        with self.assertRaises(ValidationError):
+            parent.value
+        with self.assertRaises(AttributeError):
+            parent.unknown
+
+    def test_missing_field_raises(self) -> None:
+        with lazy_validation(), self.assertRaises(ValidationError):
+            _Parent.model_validate({"child": {"name": "one"}})
+
+    def test_models_with_validators_eager(self) -> None:
+        with lazy_validation():
+            temperature = Temperature.model_validate({"value": 20.5})
+
+        self.assertEqual(temperature.__dict__["fahrenheit"], 68.9)
+
+    def test_model_adapter(self) -> None:
+        parents = ModelAdapter(dict[str, _Parent])
+
+        set_lazy_validation(True)
+        self.addCleanup(set_lazy_validation, False)
+        result = parents.validate_json(b'{"1": {"child": {"name": "one"}, "value": 1}}')
+
+        self.assertNotIn("value", result["1"].__dict__)
+        self.assertEqual(result, {"1": _Parent(child=_Model(name="one"), value=1)})
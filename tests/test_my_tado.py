@@ -6,7 +6,9 @@ from unittest import mock
 
 import responses
 
+from PyTado.exceptions import TadoException
 from PyTado.http import TadoRequest
+from PyTado.types import OverlayMode, ZoneType
 
 from . import common
 
@@ -186,3 +188,111 @@ class TadoTestCase(common.TadoBaseTestCase, is_x_line=False):
 
         # Verify the response
         self.assertEqual(response.max_flow_temperature, 50)
+
+    @responses.activate
+    def test_get_all_capabilities(self):
+        for zone, type_ in ((1, "HEATING"), (2, "HOT_WATER")):
+            responses.add(
+                responses.GET,
+                f"https://my.tado.com/api/v2/homes/1234/zones/{zone}/capabilities",
+                json={"type": type_},
+                status=200,
+            )
+
+        zones = [self.tado_client.get_zone(1), self.tado_client.get_zone(2)]
+        with mock.patch.object(type(self.tado_client), "get_zones", return_value=zones):
+            capabilities = self.tado_client.get_all_capabilities()
+
+        self.assertEqual(list(capabilities), [1, 2])
+        self.assertEqual(capabilities[1].type, "HEATING")
+        self.assertEqual(capabilities[2].type, "HOT_WATER")
+
+    @responses.activate
+    def test_get_zone_overlay_defaults_raises_errors(self):
+        responses.add(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/zones/1/defaultOverlay",
+            json={"terminationCondition": {"type": "MANUAL"}},
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/zones/2/defaultOverlay",
+            json={"errors": []},
+            status=404,
+        )
+
+        with self.assertRaises(TadoException):
+            self.tado_client.get_zone_overlay_defaults([1, 2])
+
+    @responses.activate
+    def test_get_zone_snapshot(self):
+        heating = json.loads(common.load_fixture("tadov2.heating.manual_mode.json"))
+        hot_water = json.loads(
+            common.load_fixture("tadov2.water_heater.auto_mode.json")
+        )
+        zone_states = responses.add(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/zoneStates",
+            json={"zoneStates": {"1": heating, "2": hot_water}},
+            status=200,
+        )
+
+        zones = self.tado_client.get_zone_snapshot()
+
+        self.assertEqual([zone.id for zone in zones], [1, 2])
+        self.assertEqual(
+            zones[0].target_temp, heating["setting"]["temperature"]["celsius"]
+        )
+        self.assertTrue(zones[0].overlay_active)
+        self.assertFalse(zones[1].overlay_active)
+        # the states of all zones came with the single zoneStates request
+        self.assertEqual(len(responses.calls), 1)
+        self.assertEqual(zone_states.call_count, 1)
+
+    @responses.activate
+    def test_set_zone_overlays(self):
+        overlay = responses.add(
+            responses.POST,
+            "https://my.tado.com/api/v2/homes/1234/overlay",
+            status=204,
+        )
+
+        zones = list(range(1, 26))
+        self.tado_client.set_zone_overlays(
+            zones, OverlayMode.MANUAL, set_temp=21, device_type=ZoneType.HEATING
+        )
+
+        # 25 zones are sent in two requests of at most 20 zones
+        self.assertEqual(overlay.call_count, 2)
+        bodies = [json.loads(call.request.body) for call in overlay.calls]
+        self.assertEqual(
+            [item["room"] for body in bodies for item in body["overlays"]], zones
+        )
+        self.assertEqual(
+            bodies[1]["overlays"][0]["overlay"],
+            {
+                "setting": {
+                    "type": "HEATING",
+                    "power": "ON",
+                    "temperature": {"celsius": 21},
+                },
+                "termination": {"typeSkillBasedApp": "MANUAL"},
+            },
+        )
+
+    @responses.activate
+    def test_reset_zone_overlays(self):
+        overlay = responses.add(
+            responses.DELETE,
+            "https://my.tado.com/api/v2/homes/1234/overlay",
+            status=204,
+        )
+
+        self.tado_client.reset_zone_overlays([1, 2, 2, 3])
+
+        self.assertEqual(overlay.call_count, 1)
+        self.assertEqual(
+            overlay.calls[0].request.url,
+            "https://my.tado.com/api/v2/homes/1234/overlay?rooms=1%2C2%2C3",
+        )
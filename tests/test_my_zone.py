@@ -1,7 +1,7 @@
 """Test the TadoZone object."""
 
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import responses
 
@@ -15,6 +15,7 @@ from PyTado.types import (
     Power,
     Presence,
     VerticalSwing,
+    ZoneType,
 )
 
 from . import common
@@ -301,3 +302,137 @@ class TadoZoneTestCase(common.TadoBaseTestCase, is_x_line=False):
         assert mode.current_hvac_mode == HvacMode.OFF
         assert mode.target_temp is None
         assert mode.available is True
+
+    @responses.activate
+    def test_overlay_write_through(self):
+        """Test the cached state follows overlay changes without a new read."""
+        self.set_state_fixture("tadov2.heating.auto_mode.json")
+        overlay = {
+            "type": "MANUAL",
+            "setting": {
+                "type": "HEATING",
+                "power": "ON",
+                "temperature": {"celsius": 22.5, "fahrenheit": 72.5},
+            },
+            "termination": {"type": "MANUAL", "typeSkillBasedApp": "MANUAL"},
+        }
+        responses.add(
+            responses.PUT,
+            "https://my.tado.com/api/v2/homes/1234/zones/1/overlay",
+            json=overlay,
+            status=200,
+        )
+        responses.add(
+            responses.DELETE,
+            "https://my.tado.com/api/v2/homes/1234/zones/1/overlay",
+            status=204,
+        )
+        zone = self.tado_client.get_zone(1)
+        assert zone.target_temp == 20.0
+
+        zone.set_zone_overlay(
+            OverlayMode.MANUAL, set_temp=22.5, device_type=ZoneType.HEATING
+        )
+
+        assert zone.provisional is True
+        assert zone.target_temp == 22.5
+        assert zone.overlay_active is True
+        assert zone.overlay_termination_type == OverlayMode.MANUAL
+
+        zone.reset_zone_overlay()
+
+        assert zone.provisional is True
+        assert zone.overlay_active is False
+        assert len(responses.calls) == 3
+
+        zone.update()
+        assert zone.target_temp == 20.0
+        assert zone.provisional is False
+
+    @responses.activate
+    def test_overlay_write_through_without_response(self):
+        """Test the overlay sent is applied when the API returns no overlay."""
+        self.set_state_fixture("tadov2.heating.auto_mode.json")
+        responses.add(
+            responses.PUT,
+            "https://my.tado.com/api/v2/homes/1234/zones/1/overlay",
+            status=204,
+        )
+        zone = self.tado_client.get_zone(1)
+        assert zone.overlay_active is False
+
+        zone.set_zone_overlay(
+            OverlayMode.TIMER,
+            set_temp=18.0,
+            duration=timedelta(minutes=30),
+            device_type=ZoneType.HEATING,
+        )
+
+        assert zone.provisional is True
+        assert zone.target_temp == 18.0
+        assert zone.overlay_termination_type == OverlayMode.TIMER
+        assert zone.overlay_termination_expiry_seconds == 1800
+
+    @responses.activate
+    def test_open_window_write_through(self):
+        """Test the cached state follows open window changes without a new read."""
+        self.set_state_fixture("tadov2.heating.auto_mode.json")
+        responses.add(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/zones",
+            json=[
+                {
+                    "id": 1,
+                    "name": "Heating",
+                    "type": "HEATING",
+                    "dateCreated": "2020-01-01T00:00:00.000Z",
+                    "deviceTypes": ["VA02"],
+                    "devices": [],
+                    "reportAvailable": False,
+                    "showScheduleSetup": False,
+                    "supportsDazzle": True,
+                    "dazzleEnabled": True,
+                    "dazzleMode": {"supported": True, "enabled": True},
+                    "openWindowDetection": {
+                        "supported": True,
+                        "enabled": True,
+                        "timeoutInSeconds": 900,
+                    },
+                }
+            ],
+            status=200,
+        )
+        for method, url in (
+            (responses.POST, "state/openWindow/activate"),
+            (responses.DELETE, "state/openWindow"),
+        ):
+            responses.add(
+                method,
+                f"https://my.tado.com/api/v2/homes/1234/zones/1/{url}",
+                status=204,
+            )
+        zone = self.tado_client.get_zone(1)
+        assert zone.open_window is False
+
+        zone.set_open_window()
+        assert zone.open_window is True
+        assert zone.open_window_expiry_seconds == 900
+
+        zone.reset_open_window()
+        assert zone.open_window is False
+        assert zone.provisional is True
+
+    @responses.activate
+    def test_open_window_without_state(self):
+        """Test opening the window of a zone not read yet sends a single request."""
+        responses.add(
+            responses.POST,
+            "https://my.tado.com/api/v2/homes/1234/zones/1/state/openWindow/activate",
+            status=204,
+        )
+        zone = self.tado_client.get_zone(1)
+
+        zone.set_open_window()
+
+        assert len(responses.calls) == 1
+        assert zone.provisional is False
@@ -0,0 +1,155 @@
+"""Test the RateLimiter class."""
+
+import unittest
+from unittest import mock
+
+import responses
+
+from PyTado.exceptions import TadoRateLimitException
+from PyTado.http import Endpoint, Http, TadoRequest
+from PyTado.ratelimit import RateLimit, RateLimiter, parse_rate_limit_headers
+
+
+class RateLimiterTestCase(unittest.TestCase):
+    """Test cases for the RateLimiter class."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.now = 0.0
+
+    def limiter(self, **kwargs) -> RateLimiter:
+        return RateLimiter(clock=lambda: self.now, **kwargs)
+
+    def test_unlimited_only_counts(self) -> None:
+        limiter = self.limiter()
+
+        for _ in range(100):
+            self.assertEqual(limiter.acquire(Endpoint.MY_API), 0)
+
+        status = limiter.quota_status()
+        self.assertEqual(status[RateLimiter.ACCOUNT].requests_today, 100)
+        self.assertEqual(status[Endpoint.MY_API].requests_today, 100)
+        self.assertIsNone(status[Endpoint.MY_API].remaining)
+
+    def test_per_minute_budget(self) -> None:
+        limiter = self.limiter(limit=RateLimit(per_minute=2))
+
+        self.assertEqual(limiter.acquire(Endpoint.MY_API), 0)
+        self.assertEqual(limiter.acquire(Endpoint.HOPS_API), 0)
+        # the third request has to wait for its share of the minute
+        self.assertAlmostEqual(limiter.acquire(Endpoint.MY_API), 30)
+        self.assertAlmostEqual(limiter.acquire(Endpoint.MY_API), 60)
+
+        self.now = 120
+        self.assertEqual(limiter.acquire(Endpoint.MY_API), 0)
+
+    def test_max_delay(self) -> None:
+        limiter = self.limiter(limit=RateLimit(per_minute=1))
+
+        self.assertEqual(limiter.acquire(Endpoint.MY_API, max_delay=10), 0)
+        self.assertIsNone(limiter.acquire(Endpoint.MY_API, max_delay=10))
+
+        # the call not sent did not take a request
+        status = limiter.quota_status()[RateLimiter.ACCOUNT]
+        self.assertEqual(status.requests_today, 1)
+        self.assertAlmostEqual(limiter.acquire(Endpoint.MY_API), 60)
+
+    def test_endpoint_budget_exhausted(self) -> None:
+        limiter = self.limiter(
+            endpoint_limits={Endpoint.MINDER: RateLimit(per_day=1)}, max_wait=10
+        )
+
+        limiter.acquire(Endpoint.MINDER)
+        with self.assertRaises(TadoRateLimitException):
+            limiter.acquire(Endpoint.MINDER)
+
+        # other endpoints are not affected
+        self.assertEqual(limiter.acquire(Endpoint.MY_API), 0)
+
+        status = limiter.quota_status()[Endpoint.MINDER]
+        self.assertEqual((status.limit, status.remaining), (1, 0))
+
+    def test_server_quota(self) -> None:
+        limiter = self.limiter(max_wait=3600)
+
+        limiter.record_response(
+            Endpoint.MY_API,
+            200,
+            {
+                "RateLimit-Policy": '"perday";q=100;w=86400',
+                "RateLimit": '"perday";r=0;t=60',
+            },
+        )
+
+        status = limiter.quota_status()[Endpoint.MY_API]
+        self.assertEqual(
+            (status.limit, status.remaining, status.reset_in), (100, 0, 60)
+        )
+        self.assertEqual(limiter.acquire(Endpoint.MY_API), 60)
+
+    def test_too_many_requests(self) -> None:
+        limiter = self.limiter(max_wait=10)
+
+        limiter.record_response(Endpoint.HOPS_API, 429, {"Retry-After": "30"})
+
+        with self.assertRaises(TadoRateLimitException):
+            limiter.acquire(Endpoint.HOPS_API)
+
+        self.now = 30
+        self.assertEqual(limiter.acquire(Endpoint.HOPS_API), 0)
+
+    def test_parse_headers(self) -> None:
+        self.assertEqual(
+            parse_rate_limit_headers(
+                {"X-RateLimit-Limit": "10", "X-RateLimit-Remaining": "5"}
+            ),
+            (10, 5, None),
+        )
+        self.assertEqual(
+            parse_rate_limit_headers(
+                {
+                    "ratelimit-limit": "10",
+                    "ratelimit-remaining": "1",
+                    "ratelimit-reset": "9",
+                }
+            ),
+            (10, 1, 9),
+        )
+        self.assertIsNone(
+            parse_rate_limit_headers({"Content-Type": "application/json"})
+        )
+
+
+class HttpQuotaTestCase(unittest.TestCase):
+    """Test cases for the quota accounting of the Http class."""
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        for patch in (
+            mock.patch("PyTado.http.Http._device_ready"),
+            mock.patch("PyTado.http.Http._refresh_token", return_value=True),
+        ):
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.http = Http(saved_refresh_token="token")
+        self.http._id = 1234
+
+    @responses.activate
+    def test_quota_status(self) -> None:
+        responses.get(
+            "https://my.tado.com/api/v2/homes/1234/state",
+            json={},
+            headers={
+                "ratelimit-policy": '"perday";q=20000;w=86400',
+                "ratelimit": '"perday";r=19999;t=3600',
+            },
+        )
+
+        self.http.request(TadoRequest(command="state"))
+
+        status = self.http.quota_status()
+        self.assertEqual(status[RateLimiter.ACCOUNT].requests_today, 1)
+        self.assertEqual(status[Endpoint.MY_API].limit, 20000)
+        self.assertEqual(status[Endpoint.MY_API].remaining, 19999)
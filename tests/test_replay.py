@@ -0,0 +1,131 @@
+"""Test the recording and replay sessions."""
+
+import gzip
+import os
+import tempfile
+import time
+import unittest
+
+import requests
+import responses
+
+from PyTado.exceptions import TadoException
+from PyTado.http import Http, TadoRequest
+from PyTado.interface.api.my_tado import Tado
+from PyTado.replay import REDACTED, Cassette, RecordingSession, ReplaySession
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+TOKEN_URL = "https://login.tado.com/oauth2/token"
+STATE_URL = "https://my.tado.com/api/v2/homes/1234/zones/1/state"
+
+ROUTES = {
+    "https://my.tado.com/api/v2/me": "home_1234/my_api_v2_me.json",
+    "https://my.tado.com/api/v2/homes/1234/": (
+        "home_1234/tadov2.my_api_v2_home_state.json"
+    ),
+    STATE_URL: "tadov2.heating.auto_mode.json",
+}
+
+
+def _replay_http(cassette: Cassette, **kwargs) -> Http:
+    return Http(
+        saved_refresh_token="saved",
+        http_session=ReplaySession(cassette, **kwargs),
+    )
+
+
+class RecordingTestCase(unittest.TestCase):
+    """Test cases for the RecordingSession class."""
+
+    @responses.activate
+    def test_record_scrubs_tokens(self) -> None:
+        responses.post(
+            TOKEN_URL,
+            json={
+                "access_token": "secret-access",
+                "expires_in": 600,
+                "refresh_token": "secret-refresh",
+            },
+        )
+        responses.get(
+            "https://my.tado.com/api/v2/me",
+            json={"homes": [{"id": 1234}]},
+            headers={"Set-Cookie": "session=secret", "RateLimit": "r=99"},
+        )
+        responses.get("https://my.tado.com/api/v2/homes/1234/", json={"id": 1234})
+        responses.get(STATE_URL, json={"tadoMode": "HOME"})
+
+        session = RecordingSession()
+        http = Http(saved_refresh_token="secret-saved", http_session=session)
+        http.request(TadoRequest(command="zones/1/state"))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "home.json.gz")
+            session.cassette.save(path)
+            with open(path, "rb") as f:
+                content = gzip.decompress(f.read()).decode("utf-8")
+            cassette = Cassette.load(path)
+
+        self.assertNotIn("secret", content)
+        self.assertEqual(
+            [(item.method, item.url.split("?")[0]) for item in cassette],
+            [
+                ("POST", TOKEN_URL),
+                ("GET", "https://my.tado.com/api/v2/me"),
+                ("GET", "https://my.tado.com/api/v2/homes/1234/"),
+                ("GET", STATE_URL),
+            ],
+        )
+        me = list(cassette)[1]
+        self.assertEqual(
+            dict(me.headers), {"Content-Type": "application/json", "RateLimit": "r=99"}
+        )
+
+        # the recorded exchanges replay without the network
+        responses.reset()
+        replayed = _replay_http(cassette)
+        self.assertEqual(
+            replayed.request(TadoRequest(command="zones/1/state")), {"tadoMode": "HOME"}
+        )
+        self.assertEqual(replayed._headers["Authorization"], f"Bearer {REDACTED}")
+
+
+class ReplayTestCase(unittest.TestCase):
+    """Test cases for the ReplaySession class."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.cassette = Cassette.from_fixtures(ROUTES, FIXTURES)
+
+    def test_fixture_workload(self) -> None:
+        tado = Tado.from_http(_replay_http(self.cassette))
+
+        for _ in range(3):
+            state = tado.get_zone_state(1)
+
+        self.assertEqual(state.setting.temperature.celsius, 20.0)
+
+    def test_responses_in_order(self) -> None:
+        self.cassette.add("GET", STATE_URL, {"n": 2})
+        self.cassette.add("GET", STATE_URL, {"n": 3}, status=503)
+
+        http = _replay_http(self.cassette, repeat=False)
+        http.request(TadoRequest(command="zones/1/state"))
+        self.assertEqual(http.request(TadoRequest(command="zones/1/state")), {"n": 2})
+        # replayed as recorded, the retries already happened when recording
+        with self.assertRaises(TadoException):
+            http.request(TadoRequest(command="zones/1/state"))
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            http.request(TadoRequest(command="zones/1/state"))
+
+    def test_latency(self) -> None:
+        http = _replay_http(self.cassette, latency=0.05)
+
+        started = time.monotonic()
+        http.request(TadoRequest(command="zones/1/state"))
+
+        self.assertGreaterEqual(time.monotonic() - started, 0.05)
+
+    def test_unknown_call(self) -> None:
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            _replay_http(self.cassette).request(TadoRequest(command="zones/2/state"))
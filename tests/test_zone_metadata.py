@@ -0,0 +1,217 @@
+"""Test the shared zone metadata cache."""
+
+import json
+import unittest
+
+import responses
+
+from PyTado.exceptions import TadoException
+from PyTado.interface.api import Tado, TadoX
+from PyTado.zone.metadata import ZoneIdentityMap, ZoneMetadataCache
+
+from . import common
+
+ZONES_URL = "https://my.tado.com/api/v2/homes/1234/zones"
+ROOMS_URL = "https://hops.tado.com/homes/1234/roomsAndDevices"
+STATE_URL = "https://my.tado.com/api/v2/homes/1234/zones/1/state"
+
+
+def _zone(zone_id: int) -> dict:
+    return {
+        "id": zone_id,
+        "name": f"Zone {zone_id}",
+        "type": "HEATING",
+        "dateCreated": "2020-01-01T00:00:00.000Z",
+        "deviceTypes": ["VA02"],
+        "devices": [],
+        "reportAvailable": False,
+        "showScheduleSetup": False,
+        "supportsDazzle": True,
+        "dazzleEnabled": True,
+        "dazzleMode": {"supported": True, "enabled": True},
+        "openWindowDetection": {"supported": True},
+    }
+
+
+class ZoneMetadataCacheTestCase(unittest.TestCase):
+    """Test cases for the ZoneMetadataCache class."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.now = 0.0
+        self.fetches = 0
+        self.zones = {1: "one", 2: "two"}
+        self.cache = ZoneMetadataCache(self._fetch, ttl=60, clock=lambda: self.now)
+
+    def _fetch(self) -> dict[int, str]:
+        self.fetches += 1
+        return dict(self.zones)
+
+    def test_fetched_once_per_ttl(self) -> None:
+        self.assertEqual(self.cache.get(1), "one")
+        self.assertEqual(self.cache.get(2), "two")
+        self.assertEqual(self.fetches, 1)
+
+        self.now = 60
+        self.zones[1] = "renamed"
+        self.assertEqual(self.cache.get(1), "renamed")
+        self.assertEqual(self.fetches, 2)
+
+    def test_unknown_zone_fetches_again(self) -> None:
+        self.cache.get(1)
+        self.zones[3] = "three"
+
+        self.assertEqual(self.cache.get(3), "three")
+        self.assertIsNone(self.cache.get(4))
+        self.assertEqual(self.fetches, 3)
+
+    def test_unknown_zone_fetched_once_per_ttl(self) -> None:
+        self.cache.get(1)
+
+        self.assertIsNone(self.cache.get(4))
+        self.assertIsNone(self.cache.get(4))
+        self.assertEqual(self.fetches, 2)
+
+        self.now = 60
+        self.zones[4] = "four"
+        self.assertEqual(self.cache.get(4), "four")
+        self.assertEqual(self.fetches, 3)
+
+    def test_put_and_invalidate(self) -> None:
+        self.cache.put({1: "put"})
+        self.assertEqual(self.cache.get(1), "put")
+        self.assertEqual(self.fetches, 0)
+
+        self.cache.invalidate()
+        self.assertEqual(self.cache.get(1), "one")
+        self.assertEqual(self.fetches, 1)
+
+
+class _Zone:
+    def __init__(self, zone_id: int) -> None:
+        self.id = zone_id
+        self.updates = 0
+
+    def update(self) -> None:
+        self.updates += 1
+
+
+class ZoneIdentityMapTestCase(unittest.TestCase):
+    """Test cases for the ZoneIdentityMap class."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.now = 0.0
+        self.zones = ZoneIdentityMap(_Zone, max_age=10, clock=lambda: self.now)
+
+    def test_same_object(self) -> None:
+        zone = self.zones.get(1)
+
+        self.assertIs(self.zones.get(1), zone)
+        self.assertIsNot(self.zones.get(2), zone)
+        self.assertEqual(zone.updates, 0)
+
+    def test_updated_after_max_age(self) -> None:
+        zone = self.zones.get(1)
+
+        self.now = 10
+        self.assertIs(self.zones.get(1), zone)
+        self.assertEqual(zone.updates, 1)
+
+        self.now = 15
+        self.zones.get(1)
+        self.assertEqual(zone.updates, 1)
+
+    def test_touch(self) -> None:
+        zone = self.zones.get(1)
+
+        self.now = 8
+        self.zones.touch(1, zone)
+        self.zones.touch(1, _Zone(1))
+        self.zones.touch(2, _Zone(2))
+
+        self.now = 12
+        self.assertIs(self.zones.get(1), zone)
+        self.assertEqual(zone.updates, 0)
+        self.assertIsNot(self.zones.get(2), zone)
+
+    def test_invalidate(self) -> None:
+        one, two = self.zones.get(1), self.zones.get(2)
+
+        self.zones.invalidate([1, 3])
+        self.assertEqual((one.updates, two.updates), (1, 0))
+
+        self.zones.invalidate()
+        self.assertEqual((one.updates, two.updates), (2, 1))
+
+
+class TadoZoneMetadataTestCase(common.TadoBaseTestCase, is_x_line=False):
+    """Test cases for the zone metadata shared by the zones of a Tado home"""
+
+    tado_client: Tado
+
+    @responses.activate
+    def test_zones_share_one_fetch(self) -> None:
+        zones_call = responses.get(ZONES_URL, json=[_zone(1), _zone(2), _zone(3)])
+
+        names = [zone.name for zone in self.tado_client.get_zones()]
+        names.append(self.tado_client.get_zone(2).name)
+
+        self.assertEqual(names, ["Zone 1", "Zone 2", "Zone 3", "Zone 2"])
+        self.assertEqual(zones_call.call_count, 1)
+
+    @responses.activate
+    def test_repeated_calls_share_state(self) -> None:
+        state = json.loads(common.load_fixture("tadov2.heating.auto_mode.json"))
+        state_call = responses.get(STATE_URL, json=state)
+        responses.get(ZONES_URL, json=[_zone(1)])
+
+        self.assertIs(self.tado_client.get_zone(1), self.tado_client.get_zone(1))
+        self.tado_client.get_climate(1)
+        self.tado_client.get_climate(1)
+        self.assertEqual(state_call.call_count, 1)
+
+        self.tado_client.invalidate_zones([1])
+        self.tado_client.get_climate(1)
+        self.assertEqual(state_call.call_count, 2)
+
+    @responses.activate
+    def test_loaded_state_is_fresh(self) -> None:
+        state = json.loads(common.load_fixture("tadov2.heating.auto_mode.json"))
+        state_call = responses.get(STATE_URL, json=state)
+        responses.get(ZONES_URL, json=[_zone(1)])
+        now = 0.0
+        self.tado_client._zone_map._clock = lambda: now
+
+        self.tado_client.get_zone(1)
+        now = 8
+        self.tado_client.get_climate(1)
+        now = 12
+        self.tado_client.get_climate(1)
+        self.assertEqual(state_call.call_count, 1)
+
+    @responses.activate
+    def test_unknown_zone(self) -> None:
+        responses.get(ZONES_URL, json=[_zone(1)])
+
+        with self.assertRaises(TadoException):
+            self.tado_client.get_zone(9).name
+
+
+class TadoXZoneMetadataTestCase(common.TadoBaseTestCase, is_x_line=True):
+    """Test cases for the room metadata shared by the rooms of a Tado X home"""
+
+    tado_client: TadoX
+
+    @responses.activate
+    def test_rooms_share_one_fetch(self) -> None:
+        rooms_call = responses.get(
+            ROOMS_URL,
+            json=json.loads(common.load_fixture("tadox/rooms_and_devices.json")),
+        )
+
+        rooms = [self.tado_client.get_zone(1), self.tado_client.get_zone(1)]
+
+        self.assertEqual(rooms[0].name, rooms[1].name)
+        self.assertEqual(len(rooms[1].devices), len(rooms[0].devices))
+        self.assertEqual(rooms_call.call_count, 1)